@@ -63,6 +63,7 @@
 #include "qvariant.h"
 #include "qstringbuilder.h"
 #include "private/qnumeric_p.h"
+#include <algorithm>
 #include <cmath>
 #ifndef QT_NO_SYSTEMLOCALE
 #   include "qmutex.h"
@@ -215,15 +216,19 @@ QLatin1String QLocalePrivate::countryToCode(QLocale::Country country)
 // http://www.unicode.org/reports/tr35/#Likely_Subtags
 static bool addLikelySubtags(QLocaleId &localeId)
 {
-    // ### optimize with bsearch
-    const int likely_subtags_count = sizeof(likely_subtags) / sizeof(likely_subtags[0]);
-    const QLocaleId *p = likely_subtags;
-    const QLocaleId *const e = p + likely_subtags_count;
-    for ( ; p < e; p += 2) {
-        if (localeId == p[0]) {
-            localeId = p[1];
-            return true;
-        }
+    // likely_subtags is a list of (from, to) pairs, sorted on from by
+    // qlocalexml2cpp.py; find the first pair whose from matches:
+    const auto key = [](QLocaleId id) {
+        return quint64(id.language_id) << 32 | quint64(id.script_id) << 16 | id.country_id;
+    };
+    const LikelyPair *const end = likely_subtags + sizeof(likely_subtags) / sizeof(likely_subtags[0]);
+    const LikelyPair *pair = std::lower_bound(likely_subtags, end, key(localeId),
+                                              [key](const LikelyPair &entry, quint64 wanted) {
+                                                  return key(entry.from) < wanted;
+                                              });
+    if (pair != end && pair->from == localeId) {
+        localeId = pair->to;
+        return true;
     }
     return false;
 }
@@ -57,6 +57,7 @@ QT_BEGIN_NAMESPACE
 static const int windowsDataTableSize = sizeof(windowsDataTable) / sizeof(QWindowsData) - 1;
 static const int zoneDataTableSize = sizeof(zoneDataTable) / sizeof(QZoneData) - 1;
 static const int utcDataTableSize = sizeof(utcDataTable) / sizeof(QUtcData) - 1;
+static const int ianaIdTableSize = sizeof(ianaIdTable) / sizeof(QIanaData) - 1;
 
 
 static const QZoneData *zoneData(quint16 index)
@@ -100,6 +101,20 @@ static QByteArray utcId(const QUtcData *utcData)
     return (ianaIdData + utcData->ianaIdIndex);
 }
 
+// Return the first QZoneData whose IANA IDs include the given one, if any
+static const QZoneData *zoneDataForIanaId(const QByteArray &id)
+{
+    // ianaIdTable is sorted by IANA ID:
+    const QIanaData *const end = ianaIdTable + ianaIdTableSize;
+    const QIanaData *data = std::lower_bound(ianaIdTable, end, id,
+                                             [](const QIanaData &entry, const QByteArray &id) {
+                                                 return qstrcmp(id, ianaIdData + entry.ianaIdIndex) > 0;
+                                             });
+    if (data != end && id == ianaIdData + data->ianaIdIndex)
+        return zoneData(data->zoneDataIndex);
+    return nullptr;
+}
+
 static quint16 toWindowsIdKey(const QByteArray &winId)
 {
     for (quint16 i = 0; i < windowsDataTableSize; ++i) {
@@ -168,11 +183,8 @@ QByteArray QTimeZonePrivate::id() const
 QLocale::Country QTimeZonePrivate::country() const
 {
     // Default fall-back mode, use the zoneTable to find Region of known Zones
-    for (int i = 0; i < zoneDataTableSize; ++i) {
-        const QZoneData *data = zoneData(i);
-        if (ianaId(data).split(' ').contains(m_id))
-            return (QLocale::Country)data->country;
-    }
+    if (const QZoneData *data = zoneDataForIanaId(m_id))
+        return (QLocale::Country)data->country;
     return QLocale::AnyCountry;
 }
 
@@ -673,11 +685,8 @@ QString QTimeZonePrivate::isoOffsetFormat(int offsetFromUtc)
 
 QByteArray QTimeZonePrivate::ianaIdToWindowsId(const QByteArray &id)
 {
-    for (int i = 0; i < zoneDataTableSize; ++i) {
-        const QZoneData *data = zoneData(i);
-        if (ianaId(data).split(' ').contains(id))
-            return toWindowsIdLiteral(data->windowsIdKey);
-    }
+    if (const QZoneData *data = zoneDataForIanaId(id))
+        return toWindowsIdLiteral(data->windowsIdKey);
     return QByteArray();
 }
 
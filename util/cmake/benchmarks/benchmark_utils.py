@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of the given samples."""
+    assert samples
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "max": max(samples),
+    }
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True):
+    """Swallows stdout (pro2cmake is chatty), unless disabled."""
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+class Benchmark:
+    """
+    A named benchmark.
+
+    setup() is called before every run, outside of the measured time, and
+    returns the positional arguments passed to func(). Use it for anything
+    that func() mutates, so every run starts from the same state.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        setup: Optional[Callable[[], Tuple[Any, ...]]] = None,
+        repeat: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.func = func
+        self.setup = setup or (lambda: ())
+        self.repeat = repeat
+
+    def run(self, repeat: int, *, warmup: int = 1, measure_memory: bool = True) -> Dict[str, Any]:
+        repeat = self.repeat or repeat
+        for _ in range(warmup):
+            self.func(*self.setup())
+
+        samples: List[float] = []
+        for _ in range(repeat):
+            args = self.setup()
+            start = time.perf_counter()
+            self.func(*args)
+            samples.append(time.perf_counter() - start)
+        result = summarize(samples)
+
+        if measure_memory:
+            # Tracing slows everything down, so measure memory in a
+            # separate run that is not part of the timings.
+            args = self.setup()
+            tracemalloc.start()
+            try:
+                self.func(*args)
+                result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return result
+
+
+def max_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes, if known."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark],
+    *,
+    repeat: int = 5,
+    warmup: int = 1,
+    measure_memory: bool = True,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for benchmark in benchmarks:
+        print(f"Running {benchmark.name}...", flush=True)
+        with quiet(not verbose):
+            results[benchmark.name] = benchmark.run(
+                repeat, warmup=warmup, measure_memory=measure_memory
+            )
+        print(f"    {format_result(results[benchmark.name])}")
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "max_rss": max_rss(),
+        "benchmarks": results,
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    text = (
+        f"min {result['min'] * 1000:.2f} ms, median {result['median'] * 1000:.2f} ms, "
+        f"p95 {result['p95'] * 1000:.2f} ms ({result['runs']} runs)"
+    )
+    if "peak_memory" in result:
+        text += f", peak {result['peak_memory'] / 1024:.0f} KiB"
+    return text
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        results = json.load(f)
+    if results.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark results schema version.")
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    *,
+    threshold: float = 0.1,
+    metric: str = "median",
+) -> List[str]:
+    """
+    Compares two benchmark result sets. Returns a description of every
+    benchmark whose time (the given metric) or peak memory grew by more
+    than threshold (a fraction, 0.1 == 10%) compared to the baseline.
+    """
+    regressions = []
+    baseline_benchmarks = baseline["benchmarks"]
+    for name, result in sorted(current["benchmarks"].items()):
+        if name not in baseline_benchmarks:
+            continue
+        old = baseline_benchmarks[name]
+        for key in (metric, "peak_memory"):
+            if key not in result or not old.get(key):
+                continue
+            change = result[key] / old[key] - 1
+            if change > threshold:
+                regressions.append(
+                    f"{name}: {key} {old[key]:.6g} -> {result[key]:.6g} (+{change * 100:.1f}%)"
+                )
+    return regressions
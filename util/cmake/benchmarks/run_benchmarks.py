@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+"""
+Performance benchmarks for the pro2cmake toolchain.
+
+Run from util/cmake:
+
+    python benchmarks/run_benchmarks.py -o results.json
+    python benchmarks/run_benchmarks.py --compare baseline.json
+
+The results are written as JSON (min/median/p95 timings and peak traced
+memory per benchmark). With --compare, every benchmark that got slower or
+used more memory than the baseline by more than --threshold is reported,
+and the script exits with a non-zero status.
+"""
+
+import glob
+import os
+import sys
+import tempfile
+
+from argparse import ArgumentParser
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sympy.core.cache  # type: ignore  # noqa: E402
+
+import condition_simplifier_cache  # noqa: E402
+from condition_simplifier import simplify_condition  # noqa: E402
+from qmake_parser import QmakeParser  # noqa: E402
+from pro2cmake import (  # noqa: E402
+    Scope,
+    do_include,
+    flatten_scopes,
+    generate_new_cmakelists,
+    handle_source_subtractions,
+    merge_scopes,
+    recursive_evaluate_scope,
+)
+from benchmarks.benchmark_utils import (  # noqa: E402
+    Benchmark,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+data_dir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data"
+)
+
+# A sample of conditions as they show up in qtbase.
+conditions = [
+    "WIN32 AND NOT WINRT",
+    "((ON) AND (NOT (WIN32))) AND (UNIX)",
+    "WIN32 AND bar AND UNIX",
+    "NOT (((NOT QT_FEATURE_process)) OR ((NOT TARGET Qt::Gui)))",
+    "NOT (((ANDROID OR UIKIT)) OR ((NOT TARGET Qt::Network)))",
+    "(((QT_FEATURE_tabletevent) AND (QT_FEATURE_evdev)))",
+    "(((TARGET Qt::Widgets) AND (TARGET Qt::Sql)))",
+    "(((QT_FEATURE_xkbcommon) AND (NOT MACOS AND NOT WIN32) AND (TARGET Qt::DBus)))",
+    "UNIX AND NOT MACOS AND (ANDROID_EMBEDDED OR NOT ANDROID)",
+    "(LINUX OR QNX) AND NOT (ANDROID OR INTEGRITY) AND QT_FEATURE_dlopen",
+    "(MACOS OR IOS OR TVOS OR WATCHOS) AND NOT (APPLE AND UIKIT)",
+    "(WIN32 AND QT_FEATURE_shared) OR (UNIX AND NOT QT_FEATURE_shared)",
+]
+
+
+class ParsedProject:
+    """A parsed .pro file, ready to be turned into a Scope."""
+
+    def __init__(self, file: str) -> None:
+        self.file = os.path.abspath(file)
+        result, self.content = QmakeParser(debug=False).parseFile(self.file)
+        self.statements = result.asDict().get("statements")
+
+    def scope(self) -> Scope:
+        return Scope.FromDict(None, self.file, self.statements, project_file_content=self.content)
+
+
+def write_file(path: str, content: str) -> str:
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def write_include_chain(directory: str, depth: int) -> str:
+    """Writes a .pro file including a chain of depth nested .pri files."""
+    for level in range(depth):
+        include = f"include(level{level + 1}.pri)\n" if level + 1 < depth else ""
+        write_file(
+            os.path.join(directory, f"level{level}.pri"),
+            f"SOURCES += level{level}.cpp\nlevel{level}: DEFINES += LEVEL{level}\n{include}",
+        )
+    return write_file(
+        os.path.join(directory, "include_chain.pro"),
+        "TARGET = include_chain\nTEMPLATE = app\ninclude(level0.pri)\n",
+    )
+
+
+def write_subtraction_project(directory: str, sources: int, subtract_every: int = 50) -> str:
+    """Writes an app with many sources, some of which are subtracted in scopes."""
+    lines = ["TARGET = subtractions", "TEMPLATE = app", "SOURCES += \\"]
+    lines += [f"    source{i}.cpp \\" for i in range(sources)]
+    lines.append("")
+    for i in range(0, sources, subtract_every):
+        condition = ("win32", "unix", "macos", "linux")[(i // subtract_every) % 4]
+        lines.append(f"{condition}: SOURCES -= source{i}.cpp")
+        lines.append(f"{condition}: SOURCES += source{i}_{condition}.cpp")
+    return write_file(os.path.join(directory, "subtractions.pro"), "\n".join(lines) + "\n")
+
+
+def fixed_args(*args: Any) -> Callable[[], Tuple[Any, ...]]:
+    return lambda: args
+
+
+def prepare_source_subtractions(project: ParsedProject) -> Tuple[List[Scope]]:
+    scope = project.scope()
+    recursive_evaluate_scope(scope)
+    return (merge_scopes(flatten_scopes(scope)),)
+
+
+def simplify_all(cold: bool) -> None:
+    for condition in conditions:
+        if cold:
+            sympy.core.cache.clear_cache()
+        simplify_condition(condition)
+
+
+def set_condition_cache(enabled: bool) -> Tuple[()]:
+    condition_simplifier_cache.set_condition_simplified_cache_enabled(enabled)
+    return ()
+
+
+def generate(project: ParsedProject) -> None:
+    # pro2cmake expects to run from within the project directory.
+    current_dir = os.getcwd()
+    os.chdir(os.path.dirname(project.file))
+    try:
+        scope = project.scope()
+        do_include(scope)
+        generate_new_cmakelists(scope)
+        os.remove(scope.generated_cmake_lists_path)
+    finally:
+        os.chdir(current_dir)
+
+
+def create_benchmarks(work_dir: str, projects: List[str], sources: int) -> List[Benchmark]:
+    benchmarks = [Benchmark("grammar_build", lambda: QmakeParser(debug=False))]
+
+    parser = QmakeParser(debug=False)
+    for file in sorted(glob.glob(os.path.join(data_dir, "*.pro"))):
+        name = os.path.splitext(os.path.basename(file))[0]
+        benchmarks.append(Benchmark(f"parse/{name}", parser.parseFile, setup=fixed_args(file)))
+
+    standardpaths = ParsedProject(os.path.join(data_dir, "standardpaths.pro"))
+    benchmarks.append(Benchmark("scope_from_dict/standardpaths", standardpaths.scope))
+
+    include_chain = ParsedProject(write_include_chain(work_dir, 50))
+    benchmarks.append(
+        Benchmark("do_include/chain_50", do_include, setup=lambda: (include_chain.scope(),))
+    )
+
+    # Cold: no memoization, and sympy's internal caches are dropped.
+    # Warm: every condition is served from the simplifier cache.
+    benchmarks.append(
+        Benchmark(
+            "simplify_condition/cold",
+            lambda: simplify_all(cold=True),
+            setup=lambda: set_condition_cache(False),
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            "simplify_condition/warm",
+            lambda: simplify_all(cold=False),
+            setup=lambda: set_condition_cache(True),
+        )
+    )
+
+    subtractions = ParsedProject(write_subtraction_project(work_dir, sources))
+    benchmarks.append(
+        Benchmark(
+            f"handle_source_subtractions/{sources}",
+            handle_source_subtractions,
+            setup=lambda: prepare_source_subtractions(subtractions),
+        )
+    )
+
+    benchmarks.append(
+        Benchmark(
+            f"generate_new_cmakelists/subtractions_{sources}",
+            generate,
+            setup=lambda: (subtractions,),
+            repeat=3,
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            "generate_new_cmakelists/include_chain_50", generate, setup=lambda: (include_chain,)
+        )
+    )
+    for project_file in projects:
+        project = ParsedProject(project_file)
+        name = os.path.relpath(project.file)
+        benchmarks.append(
+            Benchmark(f"generate_new_cmakelists/{name}", generate, setup=fixed_args(project))
+        )
+    return benchmarks
+
+
+def _parse_commandline():
+    parser = ArgumentParser(description="Run the pro2cmake performance benchmarks.")
+    parser.add_argument(
+        "-o", "--output", dest="output", type=str, help="Write the results to this JSON file."
+    )
+    parser.add_argument(
+        "--compare",
+        dest="baseline",
+        type=str,
+        help="Compare the results against this baseline JSON file and report regressions.",
+    )
+    parser.add_argument(
+        "--results",
+        dest="results",
+        type=str,
+        help="Don't run the benchmarks, compare this results file against --compare instead.",
+    )
+    parser.add_argument(
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown (0.1 == 10%%) above which a benchmark counts as regressed.",
+    )
+    parser.add_argument(
+        "--metric",
+        dest="metric",
+        choices=["min", "median", "p95"],
+        default="median",
+        help="Which timing to compare.",
+    )
+    parser.add_argument(
+        "--repeat", dest="repeat", type=int, default=5, help="Timed runs per benchmark."
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        dest="filter",
+        type=str,
+        default="",
+        help="Only run benchmarks whose name contains this string.",
+    )
+    parser.add_argument(
+        "--sources",
+        dest="sources",
+        type=int,
+        default=5000,
+        help="Number of sources in the synthetic source subtraction project.",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="measure_memory",
+        action="store_false",
+        help="Skip the (slow) peak memory measurement.",
+    )
+    parser.add_argument(
+        "--verbose", dest="verbose", action="store_true", help="Show pro2cmake output."
+    )
+    parser.add_argument(
+        "projects",
+        metavar="<.pro file>",
+        type=str,
+        nargs="*",
+        help="Additional projects to time a full conversion of.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_commandline()
+
+    if args.results:
+        if not args.baseline:
+            print("--results requires --compare.")
+            sys.exit(2)
+        results = load_results(args.results)
+    else:
+        with tempfile.TemporaryDirectory(prefix="pro2cmake_benchmarks_") as work_dir:
+            benchmarks = [
+                b
+                for b in create_benchmarks(work_dir, args.projects, args.sources)
+                if args.filter in b.name
+            ]
+            results = run_benchmarks(
+                benchmarks,
+                repeat=args.repeat,
+                measure_memory=args.measure_memory,
+                verbose=args.verbose,
+            )
+        if args.output:
+            save_results(results, args.output)
+            print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_results(
+            load_results(args.baseline), results, threshold=args.threshold, metric=args.metric
+        )
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold * 100:.0f}%:")
+            for regression in regressions:
+                print(f"    {regression}")
+            sys.exit(1)
+        print("No regressions found.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+"""
+Scaling benchmarks for pro2cmake.
+
+Generates synthetic projects (see generate_synthetic_project.py) of
+increasing size, times the main pro2cmake stages on each of them and
+estimates how time and memory grow with the size. Run from util/cmake:
+
+    python benchmarks/run_scaling_benchmarks.py --parameter sources --sizes 1000,2000,4000,8000
+
+Every stage covers the whole project: with --parameter subdirs, the
+top-level project and each of its subprojects, just as run_pro2cmake.py
+converts every .pro file of a tree.
+
+For every stage, the growth exponent is the slope of log(time) over
+log(size): 1.0 means linear, 2.0 quadratic. Stages whose exponent exceeds
+--max-exponent are reported as super-linear, and the script exits with a
+non-zero status.
+"""
+
+import glob
+import math
+import os
+import sys
+import tempfile
+
+from argparse import ArgumentParser
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generate_synthetic_project import add_parameter_arguments, generate_project  # noqa: E402
+from pro2cmake import (  # noqa: E402
+    Scope,
+    do_include,
+    flatten_scopes,
+    handle_source_subtractions,
+    merge_scopes,
+    recursive_evaluate_scope,
+)
+from benchmarks.benchmark_utils import Benchmark, quiet, run_benchmarks, save_results  # noqa: E402
+from benchmarks.run_benchmarks import ParsedProject, fixed_args, generate  # noqa: E402
+
+scalable_parameters = [
+    "sources",
+    "depth",
+    "conditions",
+    "include_fanout",
+    "include_depth",
+    "subtraction_ratio",
+    "subdirs",
+]
+
+
+def parse_projects(project_file: str) -> List[ParsedProject]:
+    """Parses the given .pro file and every .pro file in the directories below it."""
+    directory = os.path.dirname(os.path.abspath(project_file))
+    files = sorted(glob.glob(os.path.join(directory, "**", "*.pro"), recursive=True))
+    return [ParsedProject(file) for file in files]
+
+
+def load_one(project: ParsedProject) -> Scope:
+    current_dir = os.getcwd()
+    os.chdir(os.path.dirname(project.file))
+    try:
+        scope = project.scope()
+        do_include(scope)
+    finally:
+        os.chdir(current_dir)
+    return scope
+
+
+def load(projects: List[ParsedProject]) -> List[Scope]:
+    return [load_one(project) for project in projects]
+
+
+def evaluate(scopes: List[Scope]) -> None:
+    for scope in scopes:
+        recursive_evaluate_scope(scope)
+
+
+def evaluated(projects: List[ParsedProject]) -> Tuple[List[Scope]]:
+    scopes = load(projects)
+    evaluate(scopes)
+    return (scopes,)
+
+
+def evaluate_sources(scopes: List[Scope]) -> None:
+    for scope in scopes:
+        for s in flatten_scopes(scope):
+            s.get_files("SOURCES")
+
+
+def merge(scopes: List[Scope]) -> List[List[Scope]]:
+    return [merge_scopes(flatten_scopes(scope)) for scope in scopes]
+
+
+def merged(projects: List[ParsedProject]) -> Tuple[List[List[Scope]]]:
+    return (merge(*evaluated(projects)),)
+
+
+def subtract_sources(merged_scopes: List[List[Scope]]) -> None:
+    for scopes in merged_scopes:
+        handle_source_subtractions(scopes)
+
+
+def generate_all(projects: List[ParsedProject]) -> None:
+    for project in projects:
+        generate(project)
+
+
+def create_benchmarks(projects: List[ParsedProject]) -> List[Benchmark]:
+    return [
+        Benchmark("load", load, setup=fixed_args(projects)),
+        Benchmark("recursive_evaluate_scope", evaluate, setup=lambda: (load(projects),)),
+        Benchmark("evaluate_sources", evaluate_sources, setup=lambda: evaluated(projects)),
+        Benchmark("merge_scopes", merge, setup=lambda: evaluated(projects)),
+        Benchmark(
+            "handle_source_subtractions", subtract_sources, setup=lambda: merged(projects)
+        ),
+        Benchmark("generate_new_cmakelists", generate_all, setup=fixed_args(projects)),
+    ]
+
+
+def growth_exponent(sizes: List[float], values: List[float]) -> float:
+    """Least squares slope of log(values) over log(sizes)."""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v > 0]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def analyze(
+    runs: List[Dict[str, Any]], *, max_exponent: float, min_time: float
+) -> Dict[str, Dict[str, Any]]:
+    sizes = [run["size"] for run in runs]
+    stages: Dict[str, Dict[str, Any]] = {}
+    for stage in runs[0]["results"]["benchmarks"]:
+        times = [run["results"]["benchmarks"][stage]["median"] for run in runs]
+        memory = [run["results"]["benchmarks"][stage].get("peak_memory", 0) for run in runs]
+        time_exponent = growth_exponent(sizes, times)
+        memory_exponent = growth_exponent(sizes, memory)
+        # Very short stages are dominated by noise, don't judge them.
+        judged = times[-1] >= min_time
+        stages[stage] = {
+            "times": times,
+            "peak_memory": memory,
+            "time_exponent": time_exponent,
+            "memory_exponent": memory_exponent,
+            "super_linear": judged and max(time_exponent, memory_exponent) > max_exponent,
+        }
+    return stages
+
+
+def print_report(parameter: str, sizes: List[float], stages: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\nScaling with {parameter}:")
+    header = f"{'stage':<28}" + "".join(f"{size:>12g}" for size in sizes) + "    time exp   mem exp"
+    print(header)
+    for stage, data in stages.items():
+        times = "".join(f"{t * 1000:>10.1f}ms" for t in data["times"])
+        flag = "  <-- super-linear" if data["super_linear"] else ""
+        print(
+            f"{stage:<28}{times}{data['time_exponent']:>12.2f}{data['memory_exponent']:>10.2f}{flag}"
+        )
+
+
+def _parse_commandline():
+    parser = ArgumentParser(description="Measure how pro2cmake scales with the project size.")
+    add_parameter_arguments(parser)
+    parser.add_argument(
+        "--parameter",
+        dest="parameter",
+        choices=scalable_parameters,
+        default="sources",
+        help="The project parameter to scale.",
+    )
+    parser.add_argument(
+        "--sizes",
+        dest="sizes",
+        type=str,
+        default="1000,2000,4000,8000",
+        help="Comma separated values of the scaled parameter.",
+    )
+    parser.add_argument(
+        "--max-exponent",
+        dest="max_exponent",
+        type=float,
+        default=1.25,
+        help="Growth exponent above which a stage is reported as super-linear.",
+    )
+    parser.add_argument(
+        "--min-time",
+        dest="min_time",
+        type=float,
+        default=0.01,
+        help="Ignore stages faster than this many seconds at the largest size.",
+    )
+    parser.add_argument(
+        "--repeat", dest="repeat", type=int, default=1, help="Timed runs per stage and size."
+    )
+    parser.add_argument(
+        "--warmup",
+        dest="warmup",
+        type=int,
+        default=1,
+        help="Untimed runs per stage and size, to fill the condition caches.",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="measure_memory",
+        action="store_false",
+        help="Skip the (slow) peak memory measurement.",
+    )
+    parser.add_argument(
+        "-o", "--output", dest="output", type=str, help="Write the results to this JSON file."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_commandline()
+    value_type = float if args.parameter == "subtraction_ratio" else int
+    sizes = [value_type(size) for size in args.sizes.split(",")]
+
+    runs: List[Dict[str, Any]] = []
+    for size in sizes:
+        parameters = {p: getattr(args, p) for p in scalable_parameters}
+        parameters[args.parameter] = size
+        print(f"\n{args.parameter} = {size}")
+        with tempfile.TemporaryDirectory(prefix="pro2cmake_scaling_") as work_dir:
+            with quiet():
+                project_file = generate_project(
+                    work_dir, name=args.name, block_size=args.block_size, **parameters
+                )
+                projects = parse_projects(project_file)
+            results = run_benchmarks(
+                create_benchmarks(projects),
+                repeat=args.repeat,
+                warmup=args.warmup,
+                measure_memory=args.measure_memory,
+            )
+        runs.append({"size": size, "parameters": parameters, "results": results})
+
+    stages = analyze(runs, max_exponent=args.max_exponent, min_time=args.min_time)
+    print_report(args.parameter, sizes, stages)
+
+    if args.output:
+        save_results({"parameter": args.parameter, "runs": runs, "stages": stages}, args.output)
+        print(f"Results written to {args.output}")
+
+    super_linear = [stage for stage, data in stages.items() if data["super_linear"]]
+    if super_linear:
+        print(f"Super-linear scaling in: {', '.join(super_linear)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
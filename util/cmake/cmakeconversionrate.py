@@ -29,15 +29,69 @@
 
 from argparse import ArgumentParser
 
+import concurrent.futures
+import glob
+import json
 import os
 import re
+import shutil
 import subprocess
+import time
 import typing
+import xml.etree.ElementTree as ET
+
+testcase_pattern = "^\\s*CONFIG\\s*\\+?=.*\\btestcase\\b"
+add_test_rex = re.compile(r"^\s*qt_(?:internal_)?add_test\(\s*([\w.-]+)", re.MULTILINE)
+
+# Bump when the layout of the cache or the report changes.
+schema_version = 1
 
 
 def _parse_commandline():
     parser = ArgumentParser(description="Calculate the conversion rate to cmake.")
     parser.add_argument("--debug", dest="debug", action="store_true", help="Turn on debug output")
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help="Number of ctest shards to run concurrently. Needs ctest >= 3.21 "
+        "(for --output-junit); older ctest runs a single shard.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=250,
+        help="Total number of tests to run in parallel, split between the shards.",
+    )
+    parser.add_argument(
+        "--full-build",
+        dest="full_build",
+        action="store_true",
+        help="Always build all targets instead of only the tests changed since the last run.",
+    )
+    parser.add_argument(
+        "--report",
+        dest="report",
+        type=str,
+        help="Where to write the JSON report. Default is "
+        "cmakeconversionrate_report.json in the binary directory.",
+    )
+    parser.add_argument(
+        "--compare",
+        dest="compare",
+        type=str,
+        help="A previous report to compare against. Default is the report of the last run.",
+    )
+    parser.add_argument(
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown (0.25 == 25%%) above which a test or step counts as regressed.",
+    )
     parser.add_argument(
         "source_directory",
         metavar="<Source Directory>",
@@ -54,19 +108,121 @@ def _parse_commandline():
     return parser.parse_args()
 
 
-def calculate_baseline(source_directory: str, *, debug: bool = False) -> int:
+def _tool(name: str) -> str:
+    return shutil.which(name) or f"/usr/bin/{name}"
+
+
+def _git(source_directory: str, *args: str) -> str:
+    result = subprocess.run(
+        [_tool("git"), *args], capture_output=True, cwd=source_directory, check=True
+    )
+    return result.stdout.decode("utf-8")
+
+
+def source_tree_hash(source_directory: str) -> typing.Optional[str]:
+    """ The git tree hash of the sources, or None if there are local changes. """
+    try:
+        if _git(source_directory, "status", "--porcelain", "--untracked-files=no").strip():
+            return None
+        return _git(source_directory, "rev-parse", "HEAD^{tree}").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Cache:
+    """ Results kept between runs, in the binary directory. """
+
+    def __init__(self, binary_directory: str) -> None:
+        self.path = os.path.join(binary_directory, ".cmakeconversionrate", "cache.json")
+        self.data: typing.Dict[str, typing.Any] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self.data = json.load(f)
+            except (IOError, ValueError):
+                self.data = {}
+        if self.data.get("schema_version") != schema_version:
+            self.data = {"schema_version": schema_version, "baselines": {}}
+
+    @property
+    def report_path(self) -> str:
+        return os.path.join(os.path.dirname(self.path), "last_report.json")
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self.data, f, indent=4, sort_keys=True)
+
+
+def calculate_baseline(
+    source_directory: str, *, cache: typing.Optional[Cache] = None, debug: bool = False
+) -> int:
+    tree_hash = source_tree_hash(source_directory)
+    if cache and tree_hash and tree_hash in cache.data["baselines"]:
+        if debug:
+            print(f"Using cached qmake baseline for tree {tree_hash}.")
+        return cache.data["baselines"][tree_hash]
+
     if debug:
         print(f'Scanning "{source_directory}" for qmake-based tests.')
     result = subprocess.run(
-        '/usr/bin/git grep -E "^\\s*CONFIG\\s*\\+?=.*\\btestcase\\b" | sort -u | wc -l',
-        shell=True,
-        capture_output=True,
-        cwd=source_directory,
+        [_tool("git"), "grep", "-E", testcase_pattern], capture_output=True, cwd=source_directory
     )
-    return int(result.stdout)
+    base_line = len(set(result.stdout.decode("utf-8", "replace").splitlines()))
 
+    if cache and tree_hash:
+        cache.data["baselines"][tree_hash] = base_line
+    return base_line
 
-def build(source_directory: str, binary_directory: str, *, debug=False) -> None:
+
+def _test_targets_in(directory: str) -> typing.List[str]:
+    cmake_lists = os.path.join(directory, "CMakeLists.txt")
+    if not os.path.isfile(cmake_lists):
+        return []
+    with open(cmake_lists, "r") as f:
+        return add_test_rex.findall(f.read())
+
+
+def changed_test_targets(
+    source_directory: str, old_tree: str, new_tree: str, *, debug: bool = False
+) -> typing.Optional[typing.List[str]]:
+    """
+    Returns the test targets affected by the changes between two source trees,
+    or None if a full build is needed (e.g. because non-test code changed).
+    """
+    try:
+        changed_files = _git(source_directory, "diff", "--name-only", old_tree, new_tree).split()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    targets: typing.List[str] = []
+    for changed_file in changed_files:
+        if not changed_file.startswith("tests/"):
+            if debug:
+                print(f"{changed_file} is not part of a test, doing a full build.")
+            return None
+        # Find the closest directory defining a test.
+        directory = os.path.dirname(os.path.join(source_directory, changed_file))
+        directory_targets: typing.List[str] = []
+        while not directory_targets and os.path.relpath(directory, source_directory) != "tests":
+            directory_targets = _test_targets_in(directory)
+            directory = os.path.dirname(directory)
+        if not directory_targets:
+            if debug:
+                print(f"No test target found for {changed_file}, doing a full build.")
+            return None
+        targets += [t for t in directory_targets if t not in targets]
+    return targets
+
+
+def build(
+    source_directory: str,
+    binary_directory: str,
+    *,
+    targets: typing.Optional[typing.List[str]] = None,
+    debug=False,
+) -> None:
+    """ Configures (if needed) and builds; raises CalledProcessError if cmake or ninja fails. """
     abs_source = os.path.abspath(source_directory)
     if not os.path.isdir(binary_directory):
         os.makedirs(binary_directory)
@@ -74,47 +230,144 @@ def build(source_directory: str, binary_directory: str, *, debug=False) -> None:
 
         if debug:
             print(f'Running cmake in "{binary_directory}"')
-        result = subprocess.run(["/usr/bin/cmake", "-GNinja", abs_source], cwd=binary_directory)
+        result = subprocess.run([_tool("cmake"), "-GNinja", abs_source], cwd=binary_directory)
         if debug:
             print(f"CMake return code: {result.returncode}.")
-
-        assert result.returncode == 0
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, result.args)
 
     if debug:
-        print(f'Running ninja in "{binary_directory}".')
-    result = subprocess.run("/usr/bin/ninja", cwd=binary_directory)
+        what = " ".join(targets) if targets is not None else "all targets"
+        print(f'Running ninja in "{binary_directory}" for {what}.')
+    if targets == []:
+        return
+    result = subprocess.run([_tool("ninja"), *(targets or [])], cwd=binary_directory)
     if debug:
         print(f"Ninja return code: {result.returncode}.")
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, result.args)
 
-    assert result.returncode == 0
 
+def ctest_supports_junit() -> bool:
+    result = subprocess.run([_tool("ctest"), "--version"], capture_output=True)
+    match = re.search(r"(\d+)\.(\d+)", result.stdout.decode("utf-8"))
+    if not match:
+        return False
+    return (int(match.group(1)), int(match.group(2))) >= (3, 21)
 
-def test(binary_directory: str, *, debug=False) -> typing.Tuple[int, int]:
-    if debug:
-        print(f'Running ctest in "{binary_directory}".')
-    result = subprocess.run(
-        '/usr/bin/ctest -j 250 | grep "tests passed, "',
-        shell=True,
-        capture_output=True,
-        cwd=binary_directory,
-    )
-    summary = result.stdout.decode("utf-8").replace("\n", "")
-    if debug:
-        print(f"Test summary: {summary} ({result.returncode}).")
 
-    matches = re.fullmatch(r"\d+% tests passed, (\d+) tests failed out of (\d+)", summary)
-    if matches:
+def parse_junit(path: str) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """ Per-test status and duration from a ctest --output-junit file. """
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for testcase in ET.parse(path).getroot().iter("testcase"):
+        status = testcase.get("status", "run")
+        if testcase.find("failure") is not None or testcase.find("error") is not None:
+            status = "fail"
+        elif testcase.find("skipped") is not None or status in ("notrun", "disabled"):
+            status = "skipped"
+        else:
+            status = "pass"
+        results[testcase.get("name", "")] = {
+            "status": status,
+            "duration": float(testcase.get("time", 0) or 0),
+        }
+    return results
+
+
+def parse_dashboard_xml(path: str) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """ Per-test status and duration from a ctest -T Test dashboard file (Test.xml). """
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for test in ET.parse(path).getroot().iter("Test"):
+        if test.get("Status") is None:
+            continue
+        duration = 0.0
+        for measurement in test.iter("NamedMeasurement"):
+            if measurement.get("name") == "Execution Time":
+                duration = float(measurement.findtext("Value", "0") or 0)
+        status = {"passed": "pass", "failed": "fail"}.get(test.get("Status", ""), "skipped")
+        results[test.findtext("Name", "")] = {"status": status, "duration": duration}
+    return results
+
+
+def test(
+    binary_directory: str, *, workers: int = 1, jobs: int = 250, debug=False
+) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """ Runs ctest, sharded over workers, and returns per-test results.
+
+    Each shard writes its JUnit results and its log to files of its own. Sharding
+    needs ctest >= 3.21: older ctest only has the -T Test dashboard output, which
+    always goes to the same Testing/ directory, so a single shard is run instead.
+    """
+    junit = ctest_supports_junit()
+    if not junit and workers > 1:
+        # Concurrent ctest -T Test runs would overwrite each other's results.
+        print("ctest is too old for --output-junit, running a single shard.")
+        workers = 1
+    shard_jobs = max(1, jobs // workers)
+    output_dir = os.path.abspath(os.path.join(binary_directory, ".cmakeconversionrate"))
+    os.makedirs(output_dir, exist_ok=True)
+
+    def run_shard(shard: int) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        command = [_tool("ctest"), "-j", str(shard_jobs)]
+        if workers > 1:
+            # Every workers-th test, starting at shard.
+            command += ["-I", f"{shard + 1},,{workers}"]
+        if junit:
+            junit_path = os.path.join(output_dir, f"junit_{shard}.xml")
+            log_path = os.path.join(output_dir, f"ctest_{shard}.log")
+            command += ["--output-junit", junit_path, "--output-log", log_path]
+        else:
+            command += ["-T", "Test"]
         if debug:
-            print(f"Matches: failed {matches.group(1)}, total {matches.group(2)}.")
-        return (int(matches.group(2)), int(matches.group(2)) - int(matches.group(1)))
+            print(f'Running {" ".join(command)} in "{binary_directory}".')
+        result = subprocess.run(command, capture_output=True, cwd=binary_directory)
+        if debug:
+            print(f"ctest shard {shard} return code: {result.returncode}.")
+        if junit:
+            return parse_junit(junit_path) if os.path.exists(junit_path) else {}
+        tag_files = glob.glob(os.path.join(binary_directory, "Testing", "*", "Test.xml"))
+        if not tag_files:
+            return {}
+        return parse_dashboard_xml(max(tag_files, key=os.path.getmtime))
+
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        for shard_results in pool.map(run_shard, range(workers)):
+            results.update(shard_results)
+    return results
 
-    return (0, 0)
+
+def compare_reports(
+    previous: typing.Dict[str, typing.Any],
+    current: typing.Dict[str, typing.Any],
+    *,
+    threshold: float = 0.25,
+) -> typing.List[str]:
+    """ Lists step and per-test slowdowns above threshold, and newly failing tests. """
+    findings = []
+    for step in ("build_time", "test_time"):
+        old, new = previous.get(step) or 0, current.get(step) or 0
+        if old and new / old - 1 > threshold:
+            findings.append(f"{step}: {old:.1f}s -> {new:.1f}s (+{(new / old - 1) * 100:.0f}%)")
+    previous_tests = previous.get("tests", {})
+    for name, result in sorted(current.get("tests", {}).items()):
+        old_result = previous_tests.get(name)
+        if not old_result:
+            continue
+        if old_result["status"] == "pass" and result["status"] == "fail":
+            findings.append(f"{name}: now failing")
+        old, new = old_result["duration"], result["duration"]
+        # Ignore noise of very short tests.
+        if old >= 0.1 and new / old - 1 > threshold:
+            findings.append(f"{name}: {old:.2f}s -> {new:.2f}s (+{(new / old - 1) * 100:.0f}%)")
+    return findings
 
 
 def main() -> int:
     args = _parse_commandline()
+    cache = Cache(args.binary_directory)
 
-    base_line = calculate_baseline(args.source_directory, debug=args.debug)
+    base_line = calculate_baseline(args.source_directory, cache=cache, debug=args.debug)
     if base_line <= 0:
         print(f"Could not find the qmake baseline in {args.source_directory}.")
         return 1
@@ -122,19 +375,73 @@ def main() -> int:
     if args.debug:
         print(f"qmake baseline: {base_line} test binaries.")
 
-    cmake_total = 0
-    cmake_success = 0
+    tree_hash = source_tree_hash(args.source_directory)
+    targets = None
+    last_tree = cache.data.get("last_tree")
+    if not args.full_build and tree_hash and last_tree:
+        targets = changed_test_targets(
+            args.source_directory, last_tree, tree_hash, debug=args.debug
+        )
+
+    report: typing.Dict[str, typing.Any] = {
+        "schema_version": schema_version,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "source_tree": tree_hash,
+        "baseline": base_line,
+        "built_targets": targets,
+        "build_time": None,
+        "test_time": None,
+        "tests": {},
+    }
     try:
-        build(args.source_directory, args.binary_directory, debug=args.debug)
-        (cmake_total, cmake_success) = test(args.binary_directory, debug=args.debug)
+        start = time.perf_counter()
+        build(args.source_directory, args.binary_directory, targets=targets, debug=args.debug)
+        report["build_time"] = time.perf_counter() - start
+        # Only remember the tree once it has been built successfully.
+        cache.data["last_tree"] = tree_hash
+
+        start = time.perf_counter()
+        report["tests"] = test(
+            args.binary_directory, workers=max(1, args.workers), jobs=args.jobs, debug=args.debug
+        )
+        report["test_time"] = time.perf_counter() - start
+    except subprocess.CalledProcessError as e:
+        if args.debug:
+            print(f"{os.path.basename(e.cmd[0])} failed with return code {e.returncode}.")
+        print("\n\n\nCould not calculate the cmake state.")
+        return 2
     finally:
-        if cmake_total == 0:
-            print("\n\n\nCould not calculate the cmake state.")
-            return 2
-        else:
-            print(f"\n\n\nCMake test conversion rate: {cmake_total/base_line:.2f}.")
-            print(f"CMake test success rate   : {cmake_success/base_line:.2f}.")
-            return 0
+        cache.save()
+
+    cmake_total = len(report["tests"])
+    cmake_success = sum(1 for t in report["tests"].values() if t["status"] == "pass")
+    if cmake_total == 0:
+        print("\n\n\nCould not calculate the cmake state.")
+        return 2
+
+    report["conversion_rate"] = cmake_total / base_line
+    report["success_rate"] = cmake_success / base_line
+
+    compare_path = args.compare or cache.report_path
+    if os.path.exists(compare_path):
+        with open(compare_path, "r") as f:
+            findings = compare_reports(json.load(f), report, threshold=args.threshold)
+        if findings:
+            print(f"Regressions compared to {compare_path}:")
+            for finding in findings:
+                print(f"    {finding}")
+
+    report_path = args.report or os.path.join(
+        args.binary_directory, "cmakeconversionrate_report.json"
+    )
+    for path in (report_path, cache.report_path):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=4, sort_keys=True)
+
+    print(f"\n\n\nCMake test conversion rate: {cmake_total/base_line:.2f}.")
+    print(f"CMake test success rate   : {cmake_success/base_line:.2f}.")
+    print(f"Build time: {report['build_time']:.1f}s, test time: {report['test_time']:.1f}s.")
+    return 0
 
 
 if __name__ == "__main__":
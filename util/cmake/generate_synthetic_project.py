@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+"""
+This utility script writes synthetic qmake projects of configurable size,
+to stress-test how pro2cmake scales.
+
+To execute: python3 generate_synthetic_project.py --sources 20000 --depth 4 <output dir>
+
+The generated projects are deterministic for a given set of parameters.
+"""
+
+import os
+
+from argparse import ArgumentParser
+from typing import List
+
+# The first conditions are platform scopes, the rest are features.
+platform_conditions = ["win32", "unix", "macos", "linux", "android", "ios"]
+
+
+def _parse_commandline():
+    parser = ArgumentParser(description="Generate a synthetic qmake project.")
+    add_parameter_arguments(parser)
+    parser.add_argument(
+        "output_directory",
+        metavar="<output dir>",
+        type=str,
+        help="The directory to write the project to.",
+    )
+    return parser.parse_args()
+
+
+def add_parameter_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "--name", dest="name", type=str, default="synthetic", help="The project name."
+    )
+    parser.add_argument(
+        "--sources", dest="sources", type=int, default=1000, help="Total number of sources."
+    )
+    parser.add_argument(
+        "--depth", dest="depth", type=int, default=3, help="Maximum nesting depth of scopes."
+    )
+    parser.add_argument(
+        "--conditions",
+        dest="conditions",
+        type=int,
+        default=16,
+        help="Number of distinct scope conditions.",
+    )
+    parser.add_argument(
+        "--include-fanout",
+        dest="include_fanout",
+        type=int,
+        default=2,
+        help="Number of .pri files included by each project file.",
+    )
+    parser.add_argument(
+        "--include-depth",
+        dest="include_depth",
+        type=int,
+        default=2,
+        help="Depth of the .pri include tree.",
+    )
+    parser.add_argument(
+        "--subtraction-ratio",
+        dest="subtraction_ratio",
+        type=float,
+        default=0.02,
+        help="Fraction of sources that are removed again with SOURCES -= in some scope.",
+    )
+    parser.add_argument(
+        "--subdirs",
+        dest="subdirs",
+        type=int,
+        default=0,
+        help="Generate a SUBDIRS project with this many subprojects, "
+        "which share the sources between them.",
+    )
+    parser.add_argument(
+        "--block-size",
+        dest="block_size",
+        type=int,
+        default=20,
+        help="Number of sources per SOURCES assignment.",
+    )
+
+
+def condition_name(index: int) -> str:
+    if index < len(platform_conditions):
+        return platform_conditions[index]
+    return f"qtConfig(synthetic_feature_{index})"
+
+
+def _write_file(path: str, lines: List[str]) -> None:
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _source_block_lines(sources: List[str], indent: str) -> List[str]:
+    lines = [f"{indent}SOURCES += \\"]
+    lines += [f"{indent}    {s} \\" for s in sources[:-1]]
+    lines.append(f"{indent}    {sources[-1]}")
+    return lines
+
+
+def _scoped_block_lines(
+    block_index: int, sources: List[str], *, depth: int, conditions: int
+) -> List[str]:
+    """Wraps a SOURCES assignment into depth nested condition scopes."""
+    lines: List[str] = []
+    for level in range(depth):
+        condition = condition_name((block_index + level * 7) % conditions)
+        lines.append(f"{'    ' * level}{condition} {{")
+    lines += _source_block_lines(sources, "    " * depth)
+    for level in reversed(range(depth)):
+        indent = "    " * level
+        # Give every third scope an else branch.
+        if level and (block_index + level) % 3 == 0:
+            lines.append(f"{indent}}} else {{")
+            lines.append(f"{indent}    SOURCES += else_{block_index}_{level}.cpp")
+        lines.append(f"{indent}}}")
+    return lines
+
+
+def _include_tree(name: str, fanout: int, depth: int) -> List[List[str]]:
+    """Returns the include children of each file, the project file is at index 0."""
+    files = [name]
+    children: List[List[str]] = [[]]
+    level = [0]
+    for current_depth in range(depth):
+        next_level = []
+        for parent in level:
+            for i in range(fanout):
+                files.append(f"{files[parent]}_{i}")
+                children.append([])
+                children[parent].append(files[-1])
+                next_level.append(len(files) - 1)
+        level = next_level
+    return [[files[i]] + children[i] for i in range(len(files))]
+
+
+def generate_app_project(
+    output_dir: str,
+    name: str,
+    sources: List[str],
+    *,
+    depth: int = 3,
+    conditions: int = 16,
+    include_fanout: int = 2,
+    include_depth: int = 2,
+    subtraction_ratio: float = 0.02,
+    block_size: int = 20,
+) -> str:
+    """Writes an app project using the given sources, returns the .pro file path."""
+    os.makedirs(output_dir, exist_ok=True)
+    conditions = max(1, conditions)
+    tree = _include_tree(name, include_fanout, include_depth)
+    file_lines: List[List[str]] = [[] for _ in tree]
+    file_lines[0] += [f"TARGET = {name}", "TEMPLATE = app", "QT = core", ""]
+
+    blocks = [sources[i : i + block_size] for i in range(0, len(sources), block_size)]
+    for block_index, block in enumerate(blocks):
+        lines = file_lines[block_index % len(tree)]
+        block_depth = block_index % (depth + 1)
+        if block_depth:
+            lines += _scoped_block_lines(
+                block_index, block, depth=block_depth, conditions=conditions
+            )
+        else:
+            lines += _source_block_lines(block, "")
+        lines.append("")
+
+    if subtraction_ratio > 0 and sources:
+        step = max(1, round(1 / subtraction_ratio))
+        for i in range(0, len(sources), step):
+            condition = condition_name((i // step) % conditions)
+            file_lines[0].append(f"{condition}: SOURCES -= {sources[i]}")
+
+    for (file_name, *includes), lines in zip(tree, file_lines):
+        lines += [f"include({include}.pri)" for include in includes]
+        suffix = ".pro" if file_name == name else ".pri"
+        _write_file(os.path.join(output_dir, file_name + suffix), lines)
+    return os.path.join(output_dir, f"{name}.pro")
+
+
+def generate_project(
+    output_dir: str,
+    *,
+    name: str = "synthetic",
+    sources: int = 1000,
+    depth: int = 3,
+    conditions: int = 16,
+    include_fanout: int = 2,
+    include_depth: int = 2,
+    subtraction_ratio: float = 0.02,
+    subdirs: int = 0,
+    block_size: int = 20,
+) -> str:
+    """Writes a synthetic project, returns the path of the top-level .pro file."""
+    source_names = [f"src/file{i}.cpp" for i in range(sources)]
+    app_args = dict(
+        depth=depth,
+        conditions=conditions,
+        include_fanout=include_fanout,
+        include_depth=include_depth,
+        subtraction_ratio=subtraction_ratio,
+        block_size=block_size,
+    )
+    if not subdirs:
+        return generate_app_project(output_dir, name, source_names, **app_args)  # type: ignore
+
+    os.makedirs(output_dir, exist_ok=True)
+    lines = ["TEMPLATE = subdirs", ""]
+    per_subdir = -(-sources // subdirs)
+    for i in range(subdirs):
+        subdir = f"sub{i}"
+        generate_app_project(
+            os.path.join(output_dir, subdir),
+            subdir,
+            source_names[i * per_subdir : (i + 1) * per_subdir],
+            **app_args,  # type: ignore
+        )
+        # Make every third subdirectory conditional.
+        if i % 3 == 2:
+            lines.append(f"{condition_name(i % max(1, conditions))}: SUBDIRS += {subdir}")
+        else:
+            lines.append(f"SUBDIRS += {subdir}")
+    path = os.path.join(output_dir, f"{name}.pro")
+    _write_file(path, lines)
+    return path
+
+
+def main() -> None:
+    args = _parse_commandline()
+    path = generate_project(
+        args.output_directory,
+        name=args.name,
+        sources=args.sources,
+        depth=args.depth,
+        conditions=args.conditions,
+        include_fanout=args.include_fanout,
+        include_depth=args.include_depth,
+        subtraction_ratio=args.subtraction_ratio,
+        subdirs=args.subdirs,
+        block_size=args.block_size,
+    )
+    print(f"Generated {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,7 @@
 # exception.
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import os.path
 import posixpath
@@ -1712,6 +1713,63 @@ def replace_path_constants(path: str, scope: Scope) -> str:
     return path
 
 
+def _list_subdir_entries(parent: str) -> Dict[str, str]:
+    """ Maps each entry of the parent directory to "dir" or "file". """
+    entries: Dict[str, str] = {}
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                if entry.is_dir():
+                    entries[entry.name] = "dir"
+                elif entry.is_file():
+                    entries[entry.name] = "file"
+    except OSError:
+        pass
+    return entries
+
+
+def _parse_subdir_project(
+    project_file: str,
+) -> Optional[Tuple[Optional[List[Any]], str]]:
+    """ Parses a SUBDIRS project file, possibly in a worker process.
+
+    Returns the statements as plain (picklable) data, or None if parsing failed,
+    in which case the caller should re-parse in-process to report the error.
+    """
+    try:
+        result, project_file_content = parseProFile(project_file, debug=False)
+    except pp.ParseException:
+        return None
+    return result.asDict().get("statements"), project_file_content
+
+
+def _parse_subdir_projects(
+    project_files: List[str],
+) -> Dict[str, Tuple[Optional[List[Any]], str]]:
+    """ Parses the given SUBDIRS project files concurrently. """
+    unique_files = list(dict.fromkeys(project_files))
+    results: List[Optional[Tuple[Optional[List[Any]], str]]] = []
+    if len(unique_files) > 1:
+        workers = min(len(unique_files), os.cpu_count() or 1)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_parse_subdir_project, unique_files))
+        except (OSError, ImportError, NotImplementedError):
+            # No usable multiprocessing support, parse serially below.
+            results = []
+    if not results:
+        results = [_parse_subdir_project(f) for f in unique_files]
+
+    parsed: Dict[str, Tuple[Optional[List[Any]], str]] = {}
+    for project_file, result in zip(unique_files, results):
+        if result is None:
+            # Re-parse in this process, so the parse error gets reported and raised.
+            subdir_result, project_file_content = parseProFile(project_file, debug=False)
+            result = subdir_result.asDict().get("statements"), project_file_content
+        parsed[project_file] = result
+    return parsed
+
+
 def handle_subdir(
     scope: Scope, cm_fh: IO[str], *, indent: int = 0, is_example: bool = False
 ) -> None:
@@ -1721,6 +1779,30 @@ def handle_subdir(
     # type hints.
     sub_dirs: Dict[str, Dict[str, Set[FrozenSet[str]]]] = {}
 
+    # SUBDIRS += foo.pro entries which are converted inline into the current
+    # CMakeLists.txt, in the order they were encountered.
+    inline_projects: List[Tuple[Scope, str, int]] = []
+
+    # Cached listings of the parent directories of SUBDIRS entries, so that
+    # every entry doesn't need its own file system probes.
+    dir_listings: Dict[str, Dict[str, str]] = {}
+
+    def subdir_entry_kind(sd: str) -> str:
+        parent, name = os.path.split(os.path.normpath(sd))
+        if name and os.pardir not in parent.split(os.sep) and name != os.pardir:
+            parent = parent or os.curdir
+            if parent not in dir_listings:
+                dir_listings[parent] = _list_subdir_entries(parent)
+            kind = dir_listings[parent].get(name)
+            if kind:
+                return kind
+        # Fall back to probing, e.g. for case-insensitive file systems.
+        if os.path.isdir(sd):
+            return "dir"
+        if os.path.isfile(sd):
+            return "file"
+        return ""
+
     # Collects assignment conditions into global sub_dirs dict.
     def collect_subdir_info(sub_dir_assignment: str, *, current_conditions: FrozenSet[str] = None):
         subtraction = sub_dir_assignment.startswith("-")
@@ -1746,19 +1828,18 @@ def handle_subdir(
     # and the children of the given scope.
     def handle_subdir_helper(
         scope: Scope,
-        cm_fh: IO[str],
         *,
         indent: int = 0,
         current_conditions: FrozenSet[str] = frozenset(),
-        is_example: bool = False,
     ):
         for sd in scope.get_files("SUBDIRS"):
             # Collect info about conditions and SUBDIR assignments in the
             # current scope.
-            if os.path.isdir(sd) or sd.startswith("-"):
+            kind = "" if sd.startswith("-") else subdir_entry_kind(sd)
+            if sd.startswith("-") or kind == "dir":
                 collect_subdir_info(sd, current_conditions=current_conditions)
-            # For the file case, directly write into the file handle.
-            elif os.path.isfile(sd):
+            # The file case is converted inline once all entries are known.
+            elif kind == "file":
                 # Handle cases with SUBDIRS += Foo/bar/z.pro. We want to be able
                 # to generate add_subdirectory(Foo/bar) instead of parsing the full
                 # .pro file in the current CMakeLists.txt. This causes issues
@@ -1767,18 +1848,7 @@ def handle_subdir(
                 if dirname:
                     collect_subdir_info(dirname, current_conditions=current_conditions)
                 else:
-                    subdir_result, project_file_content = parseProFile(sd, debug=False)
-                    subdir_scope = Scope.FromDict(
-                        scope,
-                        sd,
-                        subdir_result.asDict().get("statements"),
-                        "",
-                        scope.basedir,
-                        project_file_content=project_file_content,
-                    )
-
-                    do_include(subdir_scope)
-                    cmakeify_scope(subdir_scope, cm_fh, indent=indent, is_example=is_example)
+                    inline_projects.append((scope, sd, indent))
             else:
                 print(f"    XXXX: SUBDIR {sd} in {scope}: Not found.")
 
@@ -1793,14 +1863,26 @@ def handle_subdir(
             if child_condition:
                 child_conditions = frozenset((*child_conditions, child_condition))
 
-            handle_subdir_helper(
-                c,
-                cm_fh,
-                indent=indent + 1,
-                current_conditions=child_conditions,
-                is_example=is_example,
+            handle_subdir_helper(c, indent=indent + 1, current_conditions=child_conditions)
+
+    def write_inline_projects() -> None:
+        # Parse all inline projects up front (concurrently), then convert them
+        # in the order they were listed.
+        parsed = _parse_subdir_projects([sd for _, sd, _ in inline_projects])
+        for parent_scope, sd, sd_indent in inline_projects:
+            statements, project_file_content = parsed[sd]
+            subdir_scope = Scope.FromDict(
+                parent_scope,
+                sd,
+                statements,
+                "",
+                parent_scope.basedir,
+                project_file_content=project_file_content,
             )
 
+            do_include(subdir_scope)
+            cmakeify_scope(subdir_scope, cm_fh, indent=sd_indent, is_example=is_example)
+
     def group_and_print_sub_dirs(scope: Scope, indent: int = 0) -> None:
         # Simplify conditions, and group
         # subdirectories with the same conditions.
@@ -1827,13 +1909,16 @@ def handle_subdir(
                 final_str = " OR ".join(sorted(alternatives))
             return final_str
 
+        # Build the full subdir -> condition table first, so that all
+        # conditions can be simplified in one batch.
+        subdir_conditions: Dict[str, str] = {}
         for subdir_name in sub_dirs:
             additions = sub_dirs[subdir_name].get("additions", set())
             subtractions = sub_dirs[subdir_name].get("subtractions", set())
 
-            # An empty condition key represents the group of sub dirs
+            # An empty condition string represents the group of sub dirs
             # that should be added unconditionally.
-            condition_key = ""
+            condition_str = ""
             if additions or subtractions:
                 addition_str = join_all_conditions(additions)
                 if addition_str:
@@ -1848,9 +1933,15 @@ def handle_subdir(
                 condition_str += subtraction_str
                 if not condition_str.rstrip("()").strip():
                     continue
-                condition_simplified = simplify_condition(condition_str)
-                condition_key = condition_simplified
+            subdir_conditions[subdir_name] = condition_str
 
+        simplified_conditions: Dict[str, str] = {"": ""}
+        for condition_str in subdir_conditions.values():
+            if condition_str not in simplified_conditions:
+                simplified_conditions[condition_str] = simplify_condition(condition_str)
+
+        for subdir_name, condition_str in subdir_conditions.items():
+            condition_key = simplified_conditions[condition_str]
             sub_dir_list_by_key: List[str] = grouped_sub_dirs.get(condition_key, [])
             sub_dir_list_by_key.append(subdir_name)
             grouped_sub_dirs[condition_key] = sub_dir_list_by_key
@@ -1881,9 +1972,8 @@ def handle_subdir(
     recursive_evaluate_scope(scope)
 
     # Do the work.
-    handle_subdir_helper(
-        scope, cm_fh, indent=indent, current_conditions=current_conditions, is_example=is_example
-    )
+    handle_subdir_helper(scope, indent=indent, current_conditions=current_conditions)
+    write_inline_projects()
 
     # Make sure to exclude targets within subdirectories first.
     qt_no_make_tools = scope.get("_QT_NO_MAKE_TOOLS")
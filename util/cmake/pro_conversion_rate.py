@@ -37,23 +37,62 @@ To execute: python3 pro_conversion_rate.py <src dir>
 where <src dir> can be any qt source directory. For better statistics,
 specify a module root source dir (like ./qtbase or ./qtsvg).
 
+For dashboards, --json prints machine-readable output, and --history
+records every run keyed by commit in a SQLite database, together with a
+snapshot of the scanned directories. With --since <commit>, only
+directories whose mtime or inode changed since the snapshot of that
+commit are listed again. --show-history prints the recorded runs without
+scanning.
+
 """
 
 from argparse import ArgumentParser
 
+import json
 import os
+import sqlite3
+import subprocess
+import sys
+import time
 import typing
-from typing import Dict, Union
+import zlib
+from typing import Dict, Optional, Union
 from timeit import default_timer
 
 
 def _parse_commandline():
     parser = ArgumentParser(description="Find pro files for which there are no CMakeLists.txt.")
+    parser.add_argument(
+        "--json", dest="json", action="store_true", help="Print the results as JSON."
+    )
+    parser.add_argument(
+        "--history",
+        dest="history",
+        type=str,
+        help="SQLite database to record the results and directory snapshot of this run in.",
+    )
+    parser.add_argument(
+        "--since",
+        dest="since",
+        type=str,
+        help="Only re-list directories that changed since the snapshot recorded for this "
+        "commit, given as anything git rev-parse accepts (or 'last' for the most recent "
+        "one). Requires --history.",
+    )
+    parser.add_argument(
+        "--show-history",
+        dest="show_history",
+        action="store_true",
+        help="Print the runs recorded in --history instead of scanning.",
+    )
     parser.add_argument(
         "source_directory", metavar="<src dir>", type=str, help="The source directory"
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if (args.since or args.show_history) and not args.history:
+        parser.error("--since and --show-history require --history.")
+    return args
 
 
 class Blacklist:
@@ -109,7 +148,152 @@ def recursive_scan(path: str, extension: str, result_paths: typing.List[str], bl
                     continue
                 recursive_scan(entry.path, extension, result_paths, blacklist)
     except Exception as e:
-        print(e)
+        print(e, file=sys.stderr)
+
+
+# Per directory: [mtime_ns, inode, sub directories, matching files, has CMakeLists.txt]
+DirectorySnapshot = Dict[str, list]
+
+
+class ScanStatistics:
+    def __init__(self):
+        self.directories = 0
+        self.listed_directories = 0
+
+
+def snapshot_scan(
+    path: str,
+    extension: str,
+    result_paths: typing.List[str],
+    blacklist: Blacklist,
+    old_snapshot: DirectorySnapshot,
+    new_snapshot: DirectorySnapshot,
+    statistics: ScanStatistics,
+) -> None:
+    """
+    Like recursive_scan, but records the directory listings in new_snapshot.
+    Directories whose mtime and inode match old_snapshot are not listed again,
+    their recorded listing is used instead. Only adding, removing or renaming
+    entries changes a directory's mtime, which is all that matters here.
+    """
+    statistics.directories += 1
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return
+
+    entry = old_snapshot.get(path)
+    if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_ino:
+        statistics.listed_directories += 1
+        sub_dirs = []
+        files = []
+        has_cmake = False
+        try:
+            for dir_entry in os.scandir(path):
+                if dir_entry.is_file():
+                    if dir_entry.name.endswith(extension):
+                        files.append(dir_entry.name)
+                    elif dir_entry.name == "CMakeLists.txt":
+                        has_cmake = True
+                elif dir_entry.is_dir():
+                    if not blacklist.is_blacklisted(dir_entry.name, dir_entry.path):
+                        sub_dirs.append(dir_entry.name)
+        except Exception as e:
+            print(e, file=sys.stderr)
+        entry = [st.st_mtime_ns, st.st_ino, sub_dirs, files, has_cmake]
+    new_snapshot[path] = entry
+
+    result_paths += [os.path.join(path, f) for f in entry[3]]
+    for sub_dir in entry[2]:
+        snapshot_scan(
+            os.path.join(path, sub_dir),
+            extension,
+            result_paths,
+            blacklist,
+            old_snapshot,
+            new_snapshot,
+            statistics,
+        )
+
+
+class History:
+    """ SQLite database of previous runs and their directory snapshots, keyed by commit. """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "commit_id TEXT PRIMARY KEY, timestamp REAL, source_directory TEXT, "
+            "total INTEGER, existing INTEGER, missing INTEGER, result TEXT)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots (commit_id TEXT PRIMARY KEY, data BLOB)"
+        )
+
+    def record(self, commit: str, result: dict, snapshot: DirectorySnapshot) -> None:
+        stats = result["stats"]
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    commit,
+                    time.time(),
+                    result["source_directory"],
+                    stats["total projects"]["value"],
+                    stats["existing projects"]["value"],
+                    stats["missing projects"]["value"],
+                    json.dumps(result),
+                ),
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?)",
+                (commit, zlib.compress(json.dumps(snapshot).encode("utf-8"))),
+            )
+
+    def snapshot(self, commit: str) -> Optional[DirectorySnapshot]:
+        if commit == "last":
+            query = (
+                "SELECT data FROM snapshots JOIN runs USING (commit_id) "
+                "ORDER BY timestamp DESC LIMIT 1"
+            )
+            row = self.connection.execute(query).fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT data FROM snapshots WHERE commit_id = ?", (commit,)
+            ).fetchone()
+        if not row:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def runs(self) -> typing.List[dict]:
+        rows = self.connection.execute(
+            "SELECT commit_id, timestamp, source_directory, total, existing, missing "
+            "FROM runs ORDER BY timestamp"
+        )
+        keys = ["commit", "timestamp", "source_directory", "total", "existing", "missing"]
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def resolve_commit(src_path: str, ref: str) -> str:
+    """ Returns the full hash of the commit ref names in src_path's git checkout. """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            capture_output=True,
+            cwd=src_path,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        raise ValueError(f"{ref} does not name a commit in {src_path}")
+    return result.stdout.decode("utf-8").strip()
+
+
+def current_commit(src_path: str) -> Optional[str]:
+    try:
+        return resolve_commit(src_path, "HEAD")
+    except ValueError:
+        return None
 
 
 def check_for_cmake_project(pro_path: str) -> bool:
@@ -194,21 +378,57 @@ def print_stats(
     print(f"{'Total script time':<40}: {script_time:.10f} seconds")
 
 
+def print_history(runs: typing.List[dict], as_json: bool):
+    if as_json:
+        print(json.dumps(runs, indent=4))
+        return
+    for run in runs:
+        date = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["timestamp"]))
+        converted = run["existing"] * 100 / run["total"] if run["total"] else 0
+        print(
+            f"{run['commit'][:12]}  {date}  {run['existing']:>6}/{run['total']:<6} "
+            f"({converted:.2f}%)  {run['source_directory']}"
+        )
+
+
 def main():
     args = _parse_commandline()
     src_path = os.path.abspath(args.source_directory)
     pro_paths = []
+    has_cmake_project = {}
 
     extension = ".pro"
 
     blacklist_names = ["config.tests", "doc", "3rdparty", "angle"]
     blacklist_path_parts = [os.path.join("util", "cmake")]
 
+    history = History(args.history) if args.history else None
+    if history and args.show_history:
+        print_history(history.runs(), args.json)
+        return
+
     script_start_time = default_timer()
     blacklist = Blacklist(blacklist_names, blacklist_path_parts)
 
     scan_time_start = default_timer()
-    recursive_scan(src_path, extension, pro_paths, blacklist)
+    snapshot: DirectorySnapshot = {}
+    statistics = ScanStatistics()
+    if history:
+        old_snapshot: DirectorySnapshot = {}
+        if args.since:
+            try:
+                since = args.since if args.since == "last" else resolve_commit(src_path, args.since)
+            except ValueError as e:
+                sys.exit(f"Cannot use --since: {e}.")
+            old_snapshot = history.snapshot(since) or {}
+            if not old_snapshot:
+                print(f"No snapshot found for {args.since}, scanning everything.", file=sys.stderr)
+        snapshot_scan(src_path, extension, pro_paths, blacklist, old_snapshot, snapshot, statistics)
+        for directory, entry in snapshot.items():
+            for f in entry[3]:
+                has_cmake_project[os.path.join(directory, f)] = entry[4]
+    else:
+        recursive_scan(src_path, extension, pro_paths, blacklist)
     scan_time_end = default_timer()
     scan_time = scan_time_end - scan_time_start
 
@@ -216,7 +436,11 @@ def main():
 
     pros_with_missing_project = []
     for pro_path in pro_paths:
-        if not check_for_cmake_project(pro_path):
+        if pro_path in has_cmake_project:
+            has_cmake = has_cmake_project[pro_path]
+        else:
+            has_cmake = check_for_cmake_project(pro_path)
+        if not has_cmake:
             pros_with_missing_project.append(pro_path)
 
     missing_pros = len(pros_with_missing_project)
@@ -228,7 +452,32 @@ def main():
     script_end_time = default_timer()
     script_time = script_end_time - script_start_time
 
-    print_stats(src_path, pros_with_missing_project, stats, scan_time, script_time)
+    commit = current_commit(src_path) if (history or args.json) else None
+    result = {
+        "source_directory": src_path,
+        "commit": commit,
+        "stats": stats,
+        "missing_projects": [os.path.relpath(p, src_path) for p in pros_with_missing_project],
+        "scan_time": scan_time,
+        "script_time": script_time,
+    }
+    if history:
+        result["directories"] = statistics.directories
+        result["listed_directories"] = statistics.listed_directories
+        if commit:
+            history.record(commit, result, snapshot)
+        else:
+            print(f"{src_path} is not a git checkout, not recording the results.", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(result, indent=4))
+    else:
+        print_stats(src_path, pros_with_missing_project, stats, scan_time, script_time)
+        if history:
+            print(
+                f"{'Listed directories':<40}: "
+                f"{statistics.listed_directories} of {statistics.directories}"
+            )
 
 
 if __name__ == "__main__":
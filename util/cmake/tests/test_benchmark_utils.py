@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+from benchmarks.benchmark_utils import Benchmark, compare_results, percentile
+
+
+def _results(**benchmarks):
+    return {"schema_version": 1, "benchmarks": benchmarks}
+
+
+def test_percentile():
+    samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(samples, 0.5) == 3.0
+    assert percentile(samples, 0.95) == 5.0
+    assert percentile([7.0], 0.95) == 7.0
+
+
+def test_benchmark_runs_setup_every_time():
+    calls = []
+    result = Benchmark("append", calls.append, setup=lambda: (len(calls),)).run(
+        3, warmup=1, measure_memory=False
+    )
+    assert calls == [0, 1, 2, 3]
+    assert result["runs"] == 3
+    assert result["min"] <= result["median"] <= result["p95"]
+
+
+def test_compare_results():
+    baseline = _results(a={"median": 1.0, "peak_memory": 100}, b={"median": 2.0})
+    current = _results(
+        a={"median": 1.05, "peak_memory": 200}, b={"median": 3.0}, c={"median": 9.0}
+    )
+    regressions = compare_results(baseline, current, threshold=0.1)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a: peak_memory")
+    assert regressions[1].startswith("b: median")
+    assert not compare_results(baseline, baseline)
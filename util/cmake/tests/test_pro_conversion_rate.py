@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+
+import subprocess
+
+import pytest
+
+from pro_conversion_rate import History, resolve_commit
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_snapshot_by_ref(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Initial")
+    commit = resolve_commit(str(tmp_path), "HEAD")
+    assert len(commit) == 40
+
+    snapshot = {"src": [1, 2, ["sub"], ["src.pro"], True]}
+    result = {"source_directory": str(tmp_path), "stats": {}}
+    for key in ("total projects", "existing projects", "missing projects"):
+        result["stats"][key] = {"value": 1}
+    history = History(str(tmp_path / "history.db"))
+    history.record(commit, result, snapshot)
+
+    assert history.snapshot(resolve_commit(str(tmp_path), "HEAD")) == snapshot
+    assert history.snapshot("last") == snapshot
+    assert history.snapshot(commit[:7]) is None
+    with pytest.raises(ValueError):
+        resolve_commit(str(tmp_path), "no-such-branch")
@@ -0,0 +1,491 @@
+#!/usr/bin/env python2
+# coding=utf8
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the test suite of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+"""Micro-benchmarks for the locale database scripts
+
+Each sub-command times one part of the machinery that turns CLDR data
+into Qt's locale tables, so that changes to it can be checked for
+their effect on speed.  Run with --help for the list of sub-commands
+and with SUB-COMMAND --help for the details of each.
+
+  find -- times LocaleScanner's XPath look-ups, over the XPaths that
+          digesting a locale uses, for the chains of the en and root
+          locales.
+  pipeline -- times regeneration of the locale data, with each form of
+          the intermediate file.
+  codes -- times the mappings between codes, IDs and names used while
+          regenerating.
+  dates -- checks dateconverter.convert_date() against the original,
+          character-by-character, conversion over every date and time
+          pattern in CLDR and times both.
+  batch -- checks that LocaleScanner's accessors, using batched XPath
+          look-ups, give the same data as looking up each XPath from
+          scratch, for every locale in CLDR, and times both.
+  order -- checks that qlocalexml2cpp.py's sort key puts the locales
+          of a qLocaleXML file in the same order as the comparison
+          function it replaced, given them in the order main() does and
+          in shuffled orders, and times both.
+"""
+
+import os
+import re
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+def timed(func, *args):
+    """Calls func(*args) and returns the time it took, in seconds."""
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+def report(label, seconds, count = None):
+    if count is None:
+        print('{:<24} {:9.3f} ms'.format(label, seconds * 1e3))
+    else:
+        print('{:<24} {:9.3f} ms {:9.2f} us/op'.format(
+                label, seconds * 1e3, seconds * 1e6 / max(count, 1)))
+
+def readLocale(access, scan, country, calendars = ('gregorian',)):
+    """Runs LocaleScanner's accessors, as CldrReader does.
+
+    Returns a list of the (key, value) pairs they yield, for the
+    locale scan reads, with the currency of the given country."""
+    iso = access.currencyData(country)[0]
+    language, script, ignore, variant = scan.tagCodes()
+    return [pair for data in (scan.currencyData(iso),
+                              scan.numericData(access.numberSystem),
+                              scan.textPatternData(),
+                              scan.endonyms(language, script, country, variant),
+                              scan.unitData(), scan.calendarNames(calendars))
+            for pair in data]
+
+def findXPaths(access, locale, country):
+    """Returns the XPaths reading locale's data looks up.
+
+    Runs LocaleScanner's accessors, as CldrReader does, on the given
+    locale and records the XPath of each look-up they do."""
+    scan, seen = access.locale(locale), []
+    findAll = scan.findAll
+    def record(xpaths, *args, **kw):
+        seen.extend(xpaths)
+        return findAll(xpaths, *args, **kw)
+    scan.findAll = record
+    readLocale(access, scan, country)
+    return seen
+
+def benchFind(opts):
+    from cldr import CldrAccess
+    access = CldrAccess(opts.cldr_path, opts.xml_backend)
+    xpaths = findXPaths(access, 'en', opts.country)
+    print('{} look-ups per locale'.format(len(xpaths)))
+
+    def lookAll(scan):
+        for xpath in xpaths:
+            scan.find(xpath, '')
+
+    for name in ('en', 'root'):
+        scan = access.locale(name)
+        report(name + ' (first)', timed(lookAll, scan), len(xpaths))
+        best = min(timed(lookAll, scan) for i in range(opts.repeat))
+        report(name + ' (best)', best, len(xpaths))
+
+def benchPipeline(opts):
+    from qlocalexml import JSON_EXTENSION
+    here = os.path.dirname(os.path.abspath(__file__))
+    qtbase = os.path.dirname(os.path.dirname(here))
+    work = tempfile.mkdtemp(prefix='qlocale-bench-')
+    try:
+        # qlocalexml2cpp.py rewrites these, so give it copies:
+        for leaf in ('text/qlocale_data_p.h', 'text/qlocale.h', 'text/qlocale.qdoc',
+                     'time/qromancalendar_data_p.h', 'time/qjalalicalendar_data_p.h',
+                     'time/qhijricalendar_data_p.h'):
+            path = os.path.join(work, 'src', 'corelib', leaf)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            shutil.copy(os.path.join(qtbase, 'src', 'corelib', leaf), path)
+
+        def run(script, *args):
+            with open(os.devnull, 'w') as quiet:
+                subprocess.check_call((sys.executable, os.path.join(here, script)) + args,
+                                      stdout=quiet, stderr=quiet)
+
+        # Read CLDR once, into a cache, so that each timed run of
+        # cldr2qlocalexml.py mostly measures its output:
+        cache = os.path.join(work, 'cache')
+        convert = ('cldr2qlocalexml.py', '--cache', cache, opts.cldr_path)
+        run(*convert + (os.path.join(work, 'warm.xml'),))
+
+        for ext in ('.xml', JSON_EXTENSION):
+            data = os.path.join(work, 'qlocale' + ext)
+            write = min(timed(run, *convert + (data,)) for i in range(opts.repeat))
+            read = min(timed(run, 'qlocalexml2cpp.py', data, work) for i in range(opts.repeat))
+            print('{:<6} {:>10d} bytes'.format(ext, os.path.getsize(data)))
+            report('  cldr2qlocalexml.py', write)
+            report('  qlocalexml2cpp.py', read)
+            report('  total', write + read)
+    finally:
+        shutil.rmtree(work)
+
+def benchCodes(opts):
+    import enumdata
+    from qlocalexml import QLocaleXmlReader
+    reader = QLocaleXmlReader(opts.qlocalexml)
+    locales = tuple(k[0] for k, v in reader.loadLocaleMap({'gregorian': 'roman'}))
+    print('{} locales, {} languages'.format(len(locales), len(reader.languages)))
+    report('languageIndices', min(timed(tuple, reader.languageIndices(locales))
+                                  for i in range(opts.repeat)))
+
+    for kind, lookup in (('language', enumdata.languageCodeToId),
+                         ('script', enumdata.scriptCodeToId),
+                         ('country', enumdata.countryCodeToId)):
+        codes = [v[1] for v in getattr(enumdata, kind + '_list').values()]
+        def lookAll():
+            for code in codes:
+                lookup(code)
+        report(lookup.__name__, min(timed(lookAll) for i in range(opts.repeat)), len(codes))
+
+def originalCompareLocaleKeys(key1, key2, defaults):
+    """The comparison qlocalexml2cpp.py used to sort locales with.
+
+    The defaults are as the dict of QLocaleXmlReader.defaultMap()."""
+    if key1 == key2:
+        return 0
+
+    if key1[0] != key2[0]: # First sort by language:
+        return key1[0] - key2[0]
+
+    try:
+        country = defaults[key1[:2]]
+    except KeyError:
+        pass
+    else:
+        if key1[2] == country:
+            return -1
+        if key2[2] == country:
+            return 1
+
+    if key1[1] == key2[1]:
+        return key1[2] - key2[2]
+
+    try:
+        country = defaults[key2[:2]]
+    except KeyError:
+        pass
+    else:
+        if key2[2] == country:
+            return 1
+        if key1[2] == country:
+            return -1
+
+    return key1[1] - key2[1]
+
+def benchOrder(opts):
+    import random
+    from qlocalexml import QLocaleXmlReader
+    from qlocalexml2cpp import sortLocaleKeys
+    reader = QLocaleXmlReader(opts.qlocalexml)
+    # As qlocalexml2cpp.py's main() gets them:
+    keys = dict(reader.loadLocaleMap({'gregorian': 'roman'})).keys()
+    defaults = tuple(reader.defaultMap())
+    table = dict(defaults)
+    print('{} locales, {} default territories'.format(len(keys), len(defaults)))
+
+    def original(keys):
+        return sorted(keys, lambda a, b: originalCompareLocaleKeys(a, b, table))
+    def keyed(keys):
+        return sortLocaleKeys(keys, defaults)
+
+    # For some languages the old comparison's pairwise verdicts
+    # contradict one another, so its result depends on the order of its
+    # input; the new order must match it for that order and any other:
+    bad, shuffled = 0, list(keys)
+    for i in range(opts.repeat + 1):
+        old, new = original(shuffled), keyed(shuffled)
+        for language in sorted(set(k[0] for k in keys)):
+            was = [k for k in old if k[0] == language]
+            now = [k for k in new if k[0] == language]
+            if was != now:
+                print('Mismatch for language {}: {} not {}'.format(language, now, was))
+        if old != new:
+            bad += 1
+        random.shuffle(shuffled)
+
+    if bad:
+        print('Orders differ for {} of {} input orders'.format(bad, opts.repeat + 1))
+    report('original', min(timed(original, keys) for i in range(opts.repeat)), len(keys))
+    report('keyed', min(timed(keyed, keys) for i in range(opts.repeat)), len(keys))
+    return 1 if bad else 0
+
+def originalFind(scan, xpath, default = None, draft = None):
+    """LocaleScanner.find() as it was before findAll().
+
+    Walks the locale's chain of nodes from scratch for each XPath,
+    where findAll() shares the steps common to many XPaths."""
+    from ldml import Error, _parseXPath, _iterateEach
+    plan, error = scan._LocaleScanner__aliasPlan(xpath)
+    for tags, roots in plan:
+        elts = scan.nodes
+        for tag, attrs in (_parseXPath(x) for x in tags):
+            elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
+            if not elts:
+                break
+        else:
+            roots = elts + roots
+        for elt in roots:
+            try:
+                if (draft is None or elt.draft <= draft) and elt.text is not None:
+                    return elt.text
+            except (AttributeError, KeyError):
+                pass
+    if default is None:
+        raise Error(error + scan.name)
+    return default
+
+def benchBatch(opts):
+    from cldr import CldrAccess
+    from ldml import Error
+    access = CldrAccess(opts.cldr_path, opts.xml_backend)
+    names = sorted(access.fileLocales)
+    print('{} locales'.format(len(names)))
+
+    def read(name, original):
+        # A fresh scanner, so that each read starts with an empty trie:
+        scan = access.locale(name)
+        if original:
+            scan.findAll = lambda xpaths, default = None, draft = None: dict(
+                (x, originalFind(scan, x, default, draft)) for x in xpaths)
+        try:
+            return readLocale(access, scan, tuple(scan.tagCodes())[2])
+        except Error as e:
+            return [('Error', e.message)]
+
+    bad, times = [], [0, 0]
+    for name in names:
+        chain = access.locale(name) # Keeps its files loaded while we use them
+        if read(name, True) != read(name, False):
+            bad.append(name)
+        for i, original in enumerate((True, False)):
+            times[i] += min(timed(read, name, original) for j in range(opts.repeat))
+
+    for name in bad:
+        print('Mismatch: ' + name)
+    report('original', times[0], len(names))
+    report('batched', times[1], len(names))
+    return 1 if bad else 0
+
+def originalConvertPattern(pattern):
+    # patterns from http://www.unicode.org/reports/tr35/#Date_Format_Patterns
+    qt_regexps = {
+        r"yyy{3,}" : "yyyy", # more that three digits hence convert to four-digit year
+        r"L" : "M",          # stand-alone month names. not supported.
+        r"g{1,}": "",        # modified julian day. not supported.
+        r"S{1,}" : "",       # fractional seconds. not supported.
+        r"A{1,}" : ""        # milliseconds in day. not supported.
+    }
+    qt_patterns = {
+        "G" : "", "GG" : "", "GGG" : "", "GGGG" : "", "GGGGG" : "", # Era. not supported.
+        "y" : "yyyy", # four-digit year without leading zeroes
+        "Q" : "", "QQ" : "", "QQQ" : "", "QQQQ" : "", # quarter. not supported.
+        "q" : "", "qq" : "", "qqq" : "", "qqqq" : "", # quarter. not supported.
+        "MMMMM" : "MMM", # narrow month name.
+        "LLLLL" : "MMM", # stand-alone narrow month name.
+        "l" : "", # special symbol for chinese leap month. not supported.
+        "w" : "", "W" : "", # week of year/month. not supported.
+        "D" : "", "DD" : "", "DDD" : "", # day of year. not supported.
+        "F" : "", # day of week in month. not supported.
+        "E" : "ddd", "EE" : "ddd", "EEE" : "ddd", "EEEEE" : "ddd", "EEEE" : "dddd", # day of week
+        "e" : "ddd", "ee" : "ddd", "eee" : "ddd", "eeeee" : "ddd", "eeee" : "dddd", # local day of week
+        "c" : "ddd", "cc" : "ddd", "ccc" : "ddd", "ccccc" : "ddd", "cccc" : "dddd", # stand-alone local day of week
+        "a" : "AP", # AM/PM
+        "K" : "h", # Hour 0-11
+        "k" : "H", # Hour 1-24
+        "j" : "", # special reserved symbol.
+        "z" : "t", "zz" : "t", "zzz" : "t", "zzzz" : "t", # timezone
+        "Z" : "t", "ZZ" : "t", "ZZZ" : "t", "ZZZZ" : "t", # timezone
+        "v" : "t", "vv" : "t", "vvv" : "t", "vvvv" : "t", # timezone
+        "V" : "t", "VV" : "t", "VVV" : "t", "VVVV" : "t"  # timezone
+    }
+    if pattern in qt_patterns:
+        return qt_patterns[pattern]
+    for r,v in qt_regexps.items():
+        pattern = re.sub(r, v, pattern)
+    return pattern
+
+def originalConvertDate(input, convert = originalConvertPattern):
+    """The character-by-character conversion convert_date() replaced."""
+    result = ""
+    patterns = "GyYuQqMLlwWdDFgEecahHKkjmsSAzZvV"
+    last = ""
+    inquote = 0
+    chars_to_strip = " -"
+    for c in input:
+        if c == "'":
+            inquote = inquote + 1
+        if inquote % 2 == 0:
+            if c in patterns:
+                if not last:
+                    last = c
+                else:
+                    if c in last:
+                        last += c
+                    else:
+                        # pattern changed
+                        converted = convert(last)
+                        result += converted
+                        if not converted:
+                            result = result.rstrip(chars_to_strip)
+                        last = c
+                continue
+        if last:
+            # pattern ended
+            converted = convert(last)
+            result += converted
+            if not converted:
+                result = result.rstrip(chars_to_strip)
+            last = ""
+        result += c
+    if last:
+        converted = convert(last)
+        result += converted
+        if not converted:
+            result = result.rstrip(chars_to_strip)
+    return result.lstrip(chars_to_strip)
+
+def datePatterns(root):
+    """Yields each distinct date, time or date-time pattern in CLDR's locales.
+
+    Also yields, for the conversion's corner cases, every pattern
+    letter repeated one to six times, bare, with separators around it
+    and quoted."""
+    from xml.etree import ElementTree
+    seen, formats = set(), ('dateFormat', 'timeFormat', 'dateTimeFormat')
+    main = os.path.join(root, 'common', 'main')
+    for name in sorted(os.listdir(main)):
+        if not name.endswith('.xml'):
+            continue
+        stack = []
+        for event, elt in ElementTree.iterparse(os.path.join(main, name), ('start', 'end')):
+            if event == 'start':
+                stack.append(elt.tag)
+                continue
+            stack.pop()
+            if elt.tag == 'dateFormatItem' or (
+                    elt.tag == 'pattern' and stack and stack[-1] in formats):
+                if elt.text and elt.text not in seen:
+                    seen.add(elt.text)
+                    yield elt.text
+    for letter in "GyYuQqMLlwWdDFgEecahHKkjmsSAzZvV":
+        for n in range(1, 7):
+            run = letter * n
+            for pattern in (run, 'd ' + run, run + ' - h', "'" + run + "' " + run, "'" + run):
+                if pattern not in seen:
+                    seen.add(pattern)
+                    yield pattern
+
+def benchDates(opts):
+    import dateconverter
+    patterns = tuple(datePatterns(opts.cldr_path))
+    print('{} distinct patterns'.format(len(patterns)))
+    bad = [p for p in patterns if dateconverter.convert_date(p) != originalConvertDate(p)]
+    for pattern in bad:
+        print('Mismatch: {!r} -> {!r}, not {!r}'.format(
+                pattern, dateconverter.convert_date(pattern), originalConvertDate(pattern)))
+
+    def original():
+        for pattern in patterns:
+            originalConvertDate(pattern)
+    def tokenized(): # without remembering whole patterns
+        for pattern in patterns:
+            dateconverter.convert_date(pattern, {})
+    def cached():
+        for pattern in patterns:
+            dateconverter.convert_date(pattern)
+    for label, func in (('original', original), ('tokenized', tokenized), ('cached', cached)):
+        report(label, min(timed(func) for i in range(opts.repeat)), len(patterns))
+    return 1 if bad else 0
+
+def main(args, out, err):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(metavar='SUB-COMMAND')
+
+    find = commands.add_parser('find', help='Time XPath look-ups in locale chains.')
+    find.add_argument('cldr_path', help='path to the root of the unpacked CLDR archive')
+    find.add_argument('--xml-backend', choices=('etree', 'minidom'), default='etree',
+                      help='XML library to parse CLDR data with (default: etree)')
+    find.add_argument('--country', default='US',
+                      help='territory whose currency en is read with (default: US)')
+    find.add_argument('--repeat', type=int, default=5,
+                      help='number of passes after the first, of which the best is reported')
+    find.set_defaults(run=benchFind)
+
+    pipe = commands.add_parser('pipeline',
+                               help='Time regeneration with each intermediate format.')
+    pipe.add_argument('cldr_path', help='path to the root of the unpacked CLDR archive')
+    pipe.add_argument('--repeat', type=int, default=3,
+                      help='number of runs of each step, of which the best is reported')
+    pipe.set_defaults(run=benchPipeline)
+
+    codes = commands.add_parser('codes', help='Time code-to-ID look-ups.')
+    codes.add_argument('qlocalexml', help='qLocaleXML file, as written by cldr2qlocalexml.py')
+    codes.add_argument('--repeat', type=int, default=5,
+                       help='number of runs, of which the best is reported')
+    codes.set_defaults(run=benchCodes)
+
+    dates = commands.add_parser('dates', help='Check and time date format conversion.')
+    dates.add_argument('cldr_path', help='path to the root of the unpacked CLDR archive')
+    dates.add_argument('--repeat', type=int, default=5,
+                       help='number of runs, of which the best is reported')
+    dates.set_defaults(run=benchDates)
+
+    batch = commands.add_parser('batch',
+                                help='Check and time batched XPath look-ups over all locales.')
+    batch.add_argument('cldr_path', help='path to the root of the unpacked CLDR archive')
+    batch.add_argument('--xml-backend', choices=('etree', 'minidom'), default='etree',
+                       help='XML library to parse CLDR data with (default: etree)')
+    batch.add_argument('--repeat', type=int, default=3,
+                       help='number of reads of each locale, of which the best is reported')
+    batch.set_defaults(run=benchBatch)
+
+    order = commands.add_parser('order', help='Check and time the sorting of locales.')
+    order.add_argument('qlocalexml', help='qLocaleXML file, as written by cldr2qlocalexml.py')
+    order.add_argument('--repeat', type=int, default=5,
+                       help='number of shuffled checks and of timed runs (the best is reported)')
+    order.set_defaults(run=benchOrder)
+
+    opts = parser.parse_args(args[1:])
+    return opts.run(opts) or 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv, sys.stdout, sys.stderr))
@@ -27,23 +27,34 @@
 #############################################################################
 """Digesting the CLDR's data.
 
-Provides two classes:
+Provides three classes:
   CldrReader -- driver for reading CLDR data
   CldrAccess -- used by the reader to access the tree of data files
+  DigestCache -- used by the reader to remember its work between runs
 
-The former should normally be all you need to access.
+The first should normally be all you need to access.
 See individual classes for further detail.
 """
 
-from xml.dom import minidom
 from weakref import WeakValueDictionary as CacheDict
 import os
-
-from ldml import Error, Node, XmlScanner, Supplement, LocaleScanner
+import time
+import hashlib
+import tempfile
+import zlib
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from ldml import Error, XmlScanner, Supplement, LocaleScanner, backends, tallies, \
+    streamElements
 from qlocalexml import Locale
+from enumdata import codeMap
 
 class CldrReader (object):
-    def __init__(self, root, grumble = lambda msg: None, whitter = lambda msg: None):
+    def __init__(self, root, grumble = lambda msg: None, whitter = lambda msg: None,
+                 backend = 'etree', cache = None, stats = None):
         """Set up a reader object for reading CLDR data.
 
         Single parameter, root, is the file-system path to the root of
@@ -55,9 +66,18 @@ class CldrReader (object):
         suitable callable.  The default is a no-op that ignores its
         single argument.  Optional third argument is similar, used for
         less interesting output; pass sys.stderr.write for it for
-        verbose output."""
-        self.root = CldrAccess(root)
+        verbose output.  Optional fourth argument, backend, is passed
+        on to CldrAccess.  Optional fifth argument, cache, is None (the
+        default) or the path of a directory in which to keep digested
+        data between runs, see DigestCache; call saveCache() to save
+        any updates to it.  Optional sixth argument, stats, is None
+        (the default) or a localetools.Statistics in which readLocales()
+        records how long each locale took and the look-ups and file
+        reads it needed, or that it was taken from the cache."""
+        self.root = CldrAccess(root, backend)
+        self.__cache = None if cache is None else DigestCache(cache, self.root)
         self.whitter, self.grumble = whitter, grumble
+        self.stats = stats
 
     def likelySubTags(self):
         """Generator for likely subtag information.
@@ -68,7 +88,7 @@ class CldrReader (object):
         language, a script, a country (strictly territory) and a
         variant (currently ignored)."""
         skips = []
-        for got, use in self.root.likelySubTags():
+        for got, use in self.__cached('likelySubTags', self.root.likelySubTags):
             try:
                 have = self.__parseTags(got)
                 give = self.__parseTags(use)
@@ -96,38 +116,120 @@ class CldrReader (object):
             # more out.
             pass # self.__wrapped(self.whitter, 'Skipping likelySubtags (for unknown codes): ', skips)
 
-    def readLocales(self, calendars = ('gregorian',)):
-        locales = tuple(self.__allLocales(calendars))
-        return dict(((k.language_id, k.script_id, k.country_id, k.variant_code),
-                     k) for k in locales)
-
-    def __allLocales(self, calendars):
-        def skip(locale, reason):
-            return 'Skipping defaultContent locale "{}" ({})\n'.format(locale, reason)
-
-        for locale in self.root.defaultContentLocales:
-            try:
-                language, script, country, variant = self.__splitLocale(locale)
-            except ValueError:
-                self.whitter(skip(locale, 'only language tag'))
-                continue
-
-            if not (script or country):
-                self.grumble(skip(locale, 'second tag is neither script nor territory'))
-                continue
-
-            if not (language and country):
-                continue
+    def readLocales(self, calendars = ('gregorian',), jobs = 1):
+        """Reads the data for all locales.
+
+        Optional first argument, calendars, names the calendars whose
+        month names are wanted.  Optional second argument, jobs, is the
+        number of processes to share the work between; each locale's
+        data are independent of the others', so this scales well.  If
+        jobs is 1 (the default), or the platform can't fork, all work
+        is done in this process.  Either way, grumble and whitter get
+        the same messages, in the same order.
+
+        If this reader has a cache, locales none of whose files have
+        changed since it recorded them are taken from it, rather than
+        being digested afresh; the cache is updated with the rest.
+
+        Returns a mapping from (language, script, country) IDs and
+        variant code to Locale objects."""
+        calendars, cache = tuple(calendars), self.__cache
+        tasks = tuple(self.__localeTasks())
+        known = {}
+        if cache is not None:
+            for task in tasks:
+                record = cache.locale(task, calendars)
+                if record is not None:
+                    known[task] = record
+
+        todo = tuple(task for task in tasks if task not in known)
+        jobs = min(jobs, len(todo))
+        parallel = jobs > 1 and self.__canFork
+        if parallel:
+            fresh = self.__readInParallel(todo, calendars, jobs)
+        else:
+            fresh = (self.__digest(task, calendars) for task in todo)
 
+        locales, stats = {}, self.stats
+        if stats is not None:
+            stats.count('locales taken from cache', len(known))
+        for task in tasks:
             try:
-                yield self.__getLocaleData(self.root.locale(locale), calendars,
-                                           language, script, country, variant)
-            except Error as e:
-                self.grumble(skip(locale, e.message))
-
+                k, said = known[task]
+            except KeyError:
+                k, files, said, (seconds, counts) = fresh.next()
+                if cache is not None:
+                    cache.setLocale(task, calendars, files, k, said)
+                if parallel: # Counted in a worker, so not yet here:
+                    tallies.update(counts)
+                if stats is not None:
+                    stats.record('locales', dict(counts, name=task[1], seconds=seconds))
+            else:
+                if stats is not None:
+                    stats.record('locales', dict(name=task[1], cached=True))
+
+            for moan, text in said:
+                (self.grumble if moan else self.whitter)(text)
+            if k is not None:
+                locales[k.language_id, k.script_id, k.country_id, k.variant_code] = k
+        return locales
+
+    def saveCache(self):
+        """Saves any updates to this reader's cache, if it has one."""
+        if self.__cache is not None:
+            self.__cache.save(self.root.tables)
+
+    __canFork = hasattr(os, 'fork')
+    def __cached(self, name, compute):
+        """Returns tuple(compute()), using the cache if available."""
+        cache = self.__cache
+        value = None if cache is None else cache.get(name)
+        if value is None:
+            value = tuple(compute())
+            if cache is not None:
+                cache.set(name, value)
+        return value
+
+    def __localeTasks(self):
+        for locale in self.__cached('defaultContent', lambda: self.root.defaultContentLocales):
+            yield 'defaultContent', locale
         for locale in self.root.fileLocales:
+            yield 'file', locale
+
+    def __digest(self, task, calendars):
+        """Digests one locale, catching what it says.
+
+        Returns a 4-tuple (locale, files, said, usage) of __readLocale()'s
+        results followed by a list of (moan, text) pairs, one for each
+        message it would have sent to grumble (if moan is true) or
+        whitter, and a pair of the time it took, in seconds, and a
+        dict of how much it added to ldml.tallies."""
+        said, grumble, whitter = [], self.grumble, self.whitter
+        self.grumble = lambda text: said.append((True, text))
+        self.whitter = lambda text: said.append((False, text))
+        before, start = tallies.copy(), time.time()
+        try:
+            locale, files = self.__readLocale(task, calendars)
+        finally:
+            self.grumble, self.whitter = grumble, whitter
+        counts = dict((k, v - before[k]) for k, v in tallies.items() if v != before[k])
+        return locale, files, said, (time.time() - start, counts)
+
+    def __readLocale(self, task, calendars):
+        """Digests one locale, if suitable.
+
+        Single argument, task, is a pair of a kind and a locale name;
+        the kind is 'defaultContent' or 'file', according as the name
+        came from CldrAccess.defaultContentLocales or .fileLocales.
+        Returns a pair: a Locale or, if the locale is skipped, None;
+        and the files its digestion depended on, per localeFiles(), or
+        None if these can't be known."""
+        kind, locale = task
+        if kind == 'file':
+            files = None
             try:
                 chain = self.root.locale(locale)
+                files = self.root.localeFiles(locale)
                 language, script, country, variant = chain.tagCodes()
                 assert language
                 # TODO: this skip should probably be based on likely
@@ -137,10 +239,62 @@ class CldrReader (object):
                 # anyway, so don't need to record it for itself.
                 # See also QLocaleXmlReader.loadLocaleMap's grumble.
                 if not country:
-                    continue
-                yield self.__getLocaleData(chain, calendars, language, script, country, variant)
+                    return None, files
+                return self.__getLocaleData(chain, calendars, language, script,
+                                            country, variant), files
             except Error as e:
                 self.grumble('Skipping file locale "{}" ({})\n'.format(locale, e.message))
+            return None, files
+
+        def skip(locale, reason):
+            return 'Skipping defaultContent locale "{}" ({})\n'.format(locale, reason)
+
+        try:
+            language, script, country, variant = self.__splitLocale(locale)
+        except ValueError:
+            self.whitter(skip(locale, 'only language tag'))
+            return None, ()
+
+        if not (script or country):
+            self.grumble(skip(locale, 'second tag is neither script nor territory'))
+            return None, ()
+
+        if not (language and country):
+            return None, ()
+
+        files = None
+        try:
+            chain = self.root.locale(locale)
+            files = self.root.localeFiles(locale)
+            return self.__getLocaleData(chain, calendars,
+                                        language, script, country, variant), files
+        except Error as e:
+            self.grumble(skip(locale, e.message))
+        return None, files
+
+    def __readInParallel(self, tasks, calendars, jobs):
+        """Farms tasks out to a pool of forked worker processes.
+
+        The shared data is loaded before the pool forks, so that each
+        worker inherits it.  Yields __digest()'s results for the tasks,
+        in order."""
+        import multiprocessing
+        global _worker
+        self.root.preload()
+        _worker = self, calendars
+        pool = multiprocessing.Pool(jobs)
+        try:
+            for result in pool.imap(_readLocaleInWorker, tasks,
+                                    len(tasks) // (jobs * 4) + 1):
+                yield result
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+            _worker = None
 
     import textwrap
     @staticmethod
@@ -235,31 +389,60 @@ class CldrReader (object):
 
         return locale
 
-# Note: various caches assume this class is a singleton, so the
-# "default" value for a parameter no caller should pass can serve as
-# the cache. If a process were to instantiate this class with distinct
-# roots, each cache would be filled by the first to need it !
+_worker = None # (CldrReader, calendars), inherited by forked workers
+def _readLocaleInWorker(task):
+    reader, calendars = _worker
+    return reader._CldrReader__digest(task, calendars)
+
+class ReadOnlyDict (dict):
+    """A dict that refuses to be modified.
+
+    CldrAccess hands out its tables, and entries in them, directly
+    rather than as copies; making them read-only ensures no caller
+    can change them under the feet of others."""
+    def __refuse(self, *args, **kwargs):
+        raise TypeError('CLDR tables are read-only')
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __refuse
+
+    def __reduce__(self):
+        # Unpickling would otherwise fill the dict via __setitem__:
+        return self.__class__, (dict(self),)
+
 class CldrAccess (object):
-    def __init__(self, root):
+    def __init__(self, root, backend = 'etree'):
         """Set up a master object for accessing CLDR data.
 
-        Single parameter, root, is the file-system path to the root of
+        First parameter, root, is the file-system path to the root of
         the unpacked CLDR archive; its common/ sub-directory should
-        contain dtd/, main/ and supplemental/ sub-directories."""
+        contain dtd/, main/ and supplemental/ sub-directories.
+
+        Optional second parameter, backend, names the XML library to
+        parse files with; it must be a key of ldml.backends, 'etree'
+        (the default, fast and frugal) or 'minidom'."""
         self.root = root
+        try:
+            self.__Node = backends[backend]
+        except KeyError:
+            raise Error('Unknown XML backend: {}'.format(backend))
+        # Every cache belongs to this instance, so that instances for
+        # distinct CLDR versions can be used side by side:
+        self.__tables = {}
+        self.__docs, self.__chains = CacheDict(), CacheDict()
+        self.__plans = {} # LocaleScanner's alias plans, for our root locale
+        self.__rootScan = self.__dull = None
 
     def xml(self, *path):
         """Load a single XML file and return its root element as an XmlScanner.
 
         The path is interpreted relative to self.root"""
-        return XmlScanner(Node(self.__xml(path)))
+        return XmlScanner(self.__Node.fromDocument(self.__xml(path)))
 
     def supplement(self, name):
         """Loads supplemental data as a Supplement object.
 
         The name should be that of a file in common/supplemental/, without path.
         """
-        return Supplement(Node(self.__xml(('common', 'supplemental', name))))
+        return Supplement(self.__Node.fromDocument(self.__xml(('common', 'supplemental', name))))
 
     def locale(self, name):
         """Loads all data for a locale as a LocaleScanner object.
@@ -269,7 +452,7 @@ class CldrAccess (object):
         LocaleScanner object packages this file along with all those
         from which it inherits; its methods know how to handle that
         inheritance, where relevant."""
-        return LocaleScanner(name, self.__localeRoots(name), self.__rootLocale)
+        return LocaleScanner(name, self.__localeRoots(name), self.__rootLocale, self.__plans)
 
     @property
     def fileLocales(self, joinPath = os.path.join, listDirectory = os.listdir,
@@ -295,6 +478,45 @@ class CldrAccess (object):
                 for locale in locales.split():
                     yield locale
 
+    def preload(self):
+        """Loads, in advance, all data shared between locales.
+
+        These data are otherwise loaded lazily, when first needed.
+        Calling this before forking worker processes that read locale
+        data spares each worker from repeating the work."""
+        self.__unDistinguishedAttributes, self.__rootLocale, self.__parentLocales
+        self.__numberSystems, self.__weekData, self.__currencyData
+        for key in ('language', 'script', 'country', 'variant'):
+            self.__enumMap(key), self.__codeMap(key)
+
+    @property
+    def tables(self):
+        """The supplemental tables digested so far.
+
+        A mapping from names to tables, suitable for saving (e.g. with
+        pickle) to pass to useTables() in a later run, on the same
+        CLDR data, to spare it the work of digesting them again.  Each
+        table is a ReadOnlyDict, built when first needed."""
+        return dict((k, v) for k, v in self.__tables.items() if v)
+
+    def useTables(self, tables):
+        """Adopts supplemental tables previously digested.
+
+        Single argument, tables, should be the value of the tables
+        property of a CldrAccess object for the same CLDR data."""
+        self.__tables.update(tables)
+
+    def localeFiles(self, name):
+        """The files a locale's data depend on.
+
+        Returns a tuple of paths, relative to the CLDR root, using '/'
+        as separator, of every file whose existence or content
+        affected the locale's inheritance chain, as loaded by
+        locale(); this includes files sought but found missing.  This
+        is cheap while the LocaleScanner locale() returned for the
+        name is still in use."""
+        return self.__localeRoots(name).files
+
     def likelySubTags(self):
         for ignore, attrs in self.supplement('likelySubtags.xml').find('likelySubtags'):
             yield attrs['from'], attrs['to']
@@ -443,105 +665,152 @@ class CldrAccess (object):
         return self.__cldrVersion
 
     # Implementation details
-    def __xml(self, path, cache = CacheDict(), read = minidom.parse, joinPath = os.path.join):
+    def __xml(self, path, joinPath = os.path.join):
+        # Returns a document, for self.__Node.fromDocument(); the
+        # cache only holds it as long as some Node made from it lives.
         try:
-            doc = cache[path]
+            doc = self.__docs[path]
         except KeyError:
-            cache[path] = doc = read(joinPath(self.root, *path)).documentElement
+            name = joinPath(self.root, *path)
+            self.__docs[path] = doc = self.__Node.parse(name)
+            tallies['XML files parsed'] += 1
+            tallies['XML bytes parsed'] += os.path.getsize(name)
         return doc
 
+    def __stream(self, path, wanted, joinPath = os.path.join):
+        # Yields (path, element) pairs; see ldml.streamElements().
+        name = joinPath(self.root, *path)
+        tallies['XML files parsed'] += 1
+        tallies['XML bytes parsed'] += os.path.getsize(name)
+        return streamElements(name, wanted)
+
     def __open(self, path, joinPath=os.path.join):
         return open(joinPath(self.root, *path))
 
     @property
-    def __rootLocale(self, cache = []):
-        if not cache:
-            cache.append(self.xml('common', 'main', 'root.xml'))
-        return cache[0]
-
-    @property
-    def __supplementalData(self, cache = []):
-        if not cache:
-            cache.append(self.supplement('supplementalData.xml'))
-        return cache[0]
+    def __rootLocale(self):
+        if self.__rootScan is None:
+            self.__rootScan = self.xml('common', 'main', 'root.xml')
+        return self.__rootScan
+
+    def __table(self, name, build):
+        """Returns the named table, building it if not yet known.
+
+        Second argument, build, is called, with no arguments, if the
+        table is needed but not yet known; it must return a mapping
+        from table names to tables, including the one sought.  All
+        tables it returns are remembered, so that a single pass over
+        a file can serve several tables."""
+        try:
+            return self.__tables[name]
+        except KeyError:
+            pass
+        tables = build()
+        self.__tables.update(tables)
+        return tables[name]
 
     @property
-    def __numberSystems(self, cache = {}, joinPath=os.path.join):
-        if not cache:
-            for ignore, attrs in self.supplement('numberingSystems.xml').find('numberingSystems'):
-                cache[attrs['id']] = attrs
-            assert cache
-        return cache
+    def __numberSystems(self):
+        return self.__table('numberSystems', self.__scanNumberingSystems)
+
+    def __scanNumberingSystems(self):
+        cache = {}
+        for ignore, elt in self.__stream(('common', 'supplemental', 'numberingSystems.xml'),
+                                         ('numberingSystems',)):
+            for child in elt:
+                if child.attrib:
+                    cache[child.attrib['id']] = ReadOnlyDict(child.attrib)
+        assert cache
+        return dict(numberSystems = ReadOnlyDict(cache))
 
     @property
-    def __weekData(self, cache = {}):
-        if not cache:
-            firstDay, weStart, weEnd = self.__getWeekData()
-            # Massage those into an easily-consulted form:
-            # World defaults given for code '001':
-            mon, sat, sun = firstDay['001'], weStart['001'], weEnd['001']
-            lands = set(firstDay) | set(weStart) | set(weEnd)
-            cache.update((land,
-                          (firstDay.get(land, mon), weStart.get(land, sat), weEnd.get(land, sun)))
-                         for land in lands)
-            assert cache
-        return cache
-
-    def __getWeekData(self):
-        """Scan for data on the weekly cycle.
-
-        Yields three mappings from locales to en's short names for
-        week-days; if a locale isn't a key of a given mapping, it
-        should use the '001' (world) locale's value. The first mapping
-        gives the day on which the week starts, the second gives the
-        day on which the week-end starts, the third gives the last day
-        of the week-end."""
-        source = self.__supplementalData
-        for key in ('firstDay', 'weekendStart', 'weekendEnd'):
-            result = {}
-            for ignore, attrs in source.find('weekData/' + key):
-                assert ignore == key
-                day = attrs['day']
-                assert day in ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'), day
-                if 'alt' in attrs:
-                    continue
-                for loc in attrs.get('territories', '').split():
-                    result[loc] = day
-            yield result
+    def __weekData(self):
+        return self.__table('weekData', self.__scanSupplementalData)
 
     @property
-    def __currencyData(self, cache = {}):
-        if not cache:
-            source = self.__supplementalData
-            for elt in source.findNodes('currencyData/region'):
-                iso, digits, rounding = '', 2, 1
-                try:
-                    country = elt.dom.attributes['iso3166'].nodeValue
-                except KeyError:
+    def __currencyData(self):
+        return self.__table('currencyData', self.__scanSupplementalData)
+
+    def __scanSupplementalData(self):
+        """Digest the tables we need from supplementalData.xml.
+
+        Makes one streaming pass over the file, attending only to the
+        elements these tables are built from, discarding all else as
+        it goes.  Returns a mapping from table names to tables:
+
+          * weekData maps each country code to a triple of en's short
+            names for week-days: the first day of the week and the
+            first and last days of the week-end; countries CLDR gives
+            no specific data for are omitted, except '001' (world),
+            whose data are the default for them.
+          * currencyData maps each country code to a triple (ISO4217
+            code, digit count, rounding mode).
+          * parentLocales maps locale names to their parent's name,
+            where this isn't obtained simply by truncation."""
+        days = dict(firstDay = {}, weekendStart = {}, weekendEnd = {})
+        regions, fractions, parents = [], {}, {}
+        for path, elt in self.__stream(('common', 'supplemental', 'supplementalData.xml'),
+                                       ('weekData', 'currencyData/region',
+                                        'currencyData/fractions', 'parentLocales')):
+            if path == 'weekData':
+                for child in elt:
+                    attrs = child.attrib
+                    if child.tag not in days or not attrs:
+                        continue
+                    day = attrs['day']
+                    assert day in ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'), day
+                    if 'alt' in attrs:
+                        continue
+                    for loc in attrs.get('territories', '').split():
+                        days[child.tag][loc] = day
+
+            elif path == 'currencyData/region':
+                country, iso = elt.get('iso3166'), ''
+                if country is None:
                     continue
-                for child in elt.findAllChildren('currency'):
-                    try:
-                        if child.dom.attributes['tender'].nodeValue == 'false':
-                            continue
-                    except KeyError:
-                        pass
-                    try:
-                        child.dom.attributes['to'] # Is set if this element has gone out of date.
-                    except KeyError:
-                        iso = child.dom.attributes['iso4217'].nodeValue
+                for child in elt:
+                    attrs = child.attrib
+                    if child.tag != 'currency' or attrs.get('tender') == 'false':
+                        continue
+                    if 'to' not in attrs: # Is set if this element has gone out of date.
+                        iso = attrs['iso4217']
                         break
-                if iso:
-                    for tag, data in source.find(
-                        'currencyData/fractions/info[iso4217={}]'.format(iso)):
-                        digits = data['digits']
-                        rounding = data['rounding']
-                cache[country] = iso, digits, rounding
-            assert cache
-
-        return cache
+                regions.append((country, iso))
+
+            elif path == 'currencyData/fractions':
+                for child in elt:
+                    attrs = child.attrib
+                    if child.tag == 'info' and attrs:
+                        fractions[attrs['iso4217']] = attrs['digits'], attrs['rounding']
+
+            else: # parentLocales; see http://www.unicode.org/reports/tr35/#Parent_Locales
+                for child in elt:
+                    attrs = child.attrib
+                    if attrs:
+                        parent = attrs.get('parent', '')
+                        for loc in attrs['locales'].split():
+                            parents[loc] = parent
+
+        # Massage week data into an easily-consulted form:
+        firstDay, weStart, weEnd = days['firstDay'], days['weekendStart'], days['weekendEnd']
+        # World defaults given for code '001':
+        mon, sat, sun = firstDay['001'], weStart['001'], weEnd['001']
+        lands = set(firstDay) | set(weStart) | set(weEnd)
+        weekData = dict((land,
+                         (firstDay.get(land, mon), weStart.get(land, sat), weEnd.get(land, sun)))
+                        for land in lands)
+
+        # The last record for each country, or for each currency, wins:
+        currencyData = dict((country, (iso,) + fractions.get(iso, (2, 1)))
+                            for country, iso in regions)
+
+        assert weekData and currencyData and parents
+        return dict(weekData = ReadOnlyDict(weekData),
+                    currencyData = ReadOnlyDict(currencyData),
+                    parentLocales = ReadOnlyDict(parents))
 
     @property
-    def __unDistinguishedAttributes(self, cache = {}, joinPath = os.path.join):
+    def __unDistinguishedAttributes(self):
         """Mapping from tag names to lists of attributes.
 
         LDML defines some attributes as 'distinguishing': if a node
@@ -551,15 +820,15 @@ class CldrAccess (object):
 
         This property is a mapping from tag names to tuples of
         attribute names that *aren't* distinguishing for that tag.
-        Its value is cached (so its costly computation isonly done
-        once) and there's a side-effect of populating its cache: it
-        sets self.__cldrVersion to the value found in ldml.dtd, during
-        parsing."""
-        if not cache:
-            cache.update(self.__scanLdmlDtd())
-            assert cache
+        Its value is cached (so its costly computation is only done
+        once per instance) and there's a side-effect of populating its
+        cache: it sets self.__cldrVersion to the value found in
+        ldml.dtd, during parsing."""
+        if self.__dull is None:
+            self.__dull = dict(self.__scanLdmlDtd())
+            assert self.__dull
 
-        return cache
+        return self.__dull
 
     def __scanLdmlDtd(self, joinPath = os.path.join):
         """Scan the LDML DTD, record CLDR version
@@ -603,40 +872,22 @@ class CldrAccess (object):
             if tag and ignored:
                 yield tag, tuple(ignored)
 
-    def __enumMap(self, key, cache = {}):
-        if not cache:
-            cache['variant'] = {'': (0, 'This should never be seen outside ldml.py')}
-            # They're not actually lists: mappings from numeric value
-            # to pairs of full name and short code. What we want, in
-            # each case, is a mapping from code to the other two.
-            from enumdata import language_list, script_list, country_list
-            for form, book, empty in (('language', language_list, 'AnyLanguage'),
-                                      ('script', script_list, 'AnyScript'),
-                                      ('country', country_list, 'AnyCountry')):
-                cache[form] = dict((pair[1], (num, pair[0]))
-                                   for num, pair in book.items() if pair[0] != 'C')
-                # (Have to filter out the C locale, as we give it the
-                # same (all space) code as AnyLanguage, whose code
-                # should probably be 'und' instead.)
-
-                # Map empty to zero and the any value:
-                cache[form][''] = (0, empty)
-            # and map language code 'und' also to (0, any):
-            cache['language']['und'] = (0, 'AnyLanguage')
-
-        return cache[key]
-
-    def __codeMap(self, key, cache = {},
+    @staticmethod
+    def __enumMap(key, variant = {'': (0, 'This should never be seen outside ldml.py')}):
+        # Mappings from code to (ID, name); see enumdata.codeMap().
+        return variant if key == 'variant' else codeMap(key)
+
+    def __codeMap(self, key,
                   # Maps our name for it to CLDR's name:
                   naming = {'language': 'languages', 'script': 'scripts',
                             'country': 'territories', 'variant': 'variants'}):
-        if not cache:
+        def build():
             root = self.xml('common', 'main', 'en.xml').root.findUniqueChild('localeDisplayNames')
-            for dst, src in naming.items():
-                cache[dst] = dict(self.__codeMapScan(root.findUniqueChild(src)))
-            assert cache
+            return dict(codeMap = ReadOnlyDict(
+                    (dst, ReadOnlyDict(self.__codeMapScan(root.findUniqueChild(src))))
+                    for dst, src in naming.items()))
 
-        return cache[key]
+        return self.__table('codeMap', build)[key]
 
     def __codeMapScan(self, node):
         """Get mapping from codes to element values.
@@ -651,40 +902,35 @@ class CldrAccess (object):
         in node's children (skipping any with an alt attribute, if
         their type has been seen previously)."""
         seen = set()
-        for elt in node.dom.childNodes:
+        for elt in node.allChildren():
+            attrs = elt.attributes
             try:
-                key, value = elt.attributes['type'].nodeValue, elt.childNodes[0].wholeText
-            except (KeyError, ValueError, TypeError):
+                key, value = attrs['type'], elt.text
+            except KeyError:
                 pass
             else:
-                if key not in seen or not elt.attributes.has_key('alt'):
+                if key not in seen or 'alt' not in attrs:
                     yield key, value
                     seen.add(key)
 
     # CLDR uses inheritance between locales to save repetition:
-    def __parentLocale(self, name, cache = {}):
-        # see http://www.unicode.org/reports/tr35/#Parent_Locales
-        if not cache:
-            for tag, attrs in self.__supplementalData.find('parentLocales'):
-                parent = attrs.get('parent', '')
-                for child in attrs['locales'].split():
-                    cache[child] = parent
-            assert cache
-
-        return cache[name]
-
-    def __localeAsDoc(self, name, aliasFor = None,
+    @property
+    def __parentLocales(self):
+        return self.__table('parentLocales', self.__scanSupplementalData)
+
+    def __localeAsDoc(self, name, files, aliasFor = None,
                       joinPath = os.path.join, exists = os.path.isfile):
         path = ('common', 'main', name + '.xml')
+        files.append('/'.join(path))
         if exists(joinPath(self.root, *path)):
             elt = self.__xml(path)
-            for child in Node(elt).findAllChildren('alias'):
+            for child in self.__Node.fromDocument(elt).findAllChildren('alias'):
                 try:
-                    alias = child.dom.attributes['source'].nodeValue
-                except (KeyError, AttributeError):
+                    alias = child.attributes['source']
+                except KeyError:
                     pass
                 else:
-                    return self.__localeAsDoc(alias, aliasFor or name)
+                    return self.__localeAsDoc(alias, files, aliasFor or name)
             # No alias child with a source:
             return elt
 
@@ -692,14 +938,14 @@ class CldrAccess (object):
             raise Error('Fatal error: found an alias "{}" -> "{}", but found no file for the alias'
                         .format(aliasFor, name))
 
-    def __scanLocaleRoots(self, name):
+    def __scanLocaleRoots(self, name, files):
         while name and name != 'root':
-            doc = self.__localeAsDoc(name)
+            doc = self.__localeAsDoc(name, files)
             if doc is not None:
-                yield Node(doc, self.__unDistinguishedAttributes)
+                yield self.__Node.fromDocument(doc, self.__unDistinguishedAttributes)
 
             try:
-                name = self.__parentLocale(name)
+                name = self.__parentLocales[name]
             except KeyError:
                 try:
                     name, tail = name.rsplit('_', 1)
@@ -707,12 +953,162 @@ class CldrAccess (object):
                     break
 
     class __Seq (list): pass # No weakref for tuple and list, but list sub-class is ok.
-    def __localeRoots(self, name, cache = CacheDict()):
+    def __localeRoots(self, name):
         try:
-            chain = cache[name]
+            chain = self.__chains[name]
         except KeyError:
-            cache[name] = chain = self.__Seq(self.__scanLocaleRoots(name))
+            files = []
+            chain = self.__Seq(self.__scanLocaleRoots(name, files))
+            chain.files = tuple(files)
+            self.__chains[name] = chain
         return chain
 
-# Unpolute the namespace: we don't need to export these.
-del minidom, CacheDict, os
+class DigestCache (object):
+    """Remembers the results of digesting CLDR data between runs.
+
+    Reading all of CLDR takes a while.  When few of its files (or
+    none) have changed since the last run, most of that work can be
+    skipped by reusing its results.  An instance of this class keeps,
+    in a file in a given directory, the supplemental tables CldrAccess
+    digests, some other shared data and, for each locale, the Locale
+    object (and messages) digesting it produced, with a hash of each
+    file it depended on, so as to tell whether that is still valid.
+
+    The whole cache is discarded if CLDR's version, the content of the
+    files all locales depend on (the DTD, supplemental data, root.xml
+    and en.xml) or the source code of the scripts that digest them
+    changes.  The data are saved as a zlib-compressed pickle, in a
+    file per CLDR version."""
+
+    def __init__(self, directory, access):
+        """Loads the cache, if any, for the given CLDR data.
+
+        First argument, directory, is where to keep the cache; it is
+        created, if missing, when saving.  Second argument, access, is
+        the CldrAccess object for the CLDR data; it is given any
+        supplemental tables this cache remembers."""
+        self.__root, self.__hashes = access.root, {}
+        self.__dir = directory
+        self.__path = os.path.join(directory, 'cldr-{}.digest'.format(access.cldrVersion))
+        key = hashlib.sha1(repr(self.__FORMAT))
+        for path in self.__sources():
+            with open(path, 'rb') as fd:
+                key.update(fd.read())
+        for path in self.__shared:
+            key.update(repr((path, self.__hash(path))))
+        key = key.digest()
+
+        data = self.__load()
+        if data is None or data.get('format') != self.__FORMAT or data.get('key') != key:
+            data = dict(format = self.__FORMAT, key = key, tables = {}, shared = {}, locales = {})
+        self.__data, self.__changed, self.__used = data, False, None
+        access.useTables(data['tables'])
+
+    def get(self, name):
+        """Returns a remembered shared datum, or None if unknown."""
+        return self.__data['shared'].get(name)
+
+    def set(self, name, value):
+        """Remembers a shared datum; it should be immutable."""
+        self.__data['shared'][name] = value
+        self.__changed = True
+
+    def locale(self, task, calendars):
+        """Returns a (locale, said) pair, if still valid, else None.
+
+        See CldrReader.__digest() for the meanings of task, locale and
+        said.  The calendars must be a tuple."""
+        if self.__used is None:
+            self.__used = set()
+        try:
+            depends, locale, said = self.__data['locales'][task, calendars]
+        except KeyError:
+            return None
+        if any(self.__hash(path) != digest for path, digest in depends):
+            return None
+        self.__used.add((task, calendars))
+        return locale, said
+
+    def setLocale(self, task, calendars, files, locale, said):
+        """Remembers the results of digesting a locale.
+
+        See CldrReader.__digest() for the meanings of task, files,
+        locale and said; if files is None, nothing is remembered.  The
+        calendars must be a tuple."""
+        if files is None:
+            return
+        if self.__used is None:
+            self.__used = set()
+        depends = tuple((path, self.__hash(path)) for path in files)
+        self.__data['locales'][task, calendars] = depends, locale, said
+        self.__used.add((task, calendars))
+        self.__changed = True
+
+    def save(self, tables):
+        """Saves the cache, if changed.
+
+        Single argument, tables, should be CldrAccess.tables.  If any
+        locales have been sought in this cache, records for any not
+        sought are discarded."""
+        data = self.__data
+        if tables != data['tables']:
+            data['tables'] = tables
+            self.__changed = True
+        if self.__used is not None and len(self.__used) != len(data['locales']):
+            data['locales'] = dict((k, v) for k, v in data['locales'].items()
+                                   if k in self.__used)
+            self.__changed = True
+        if not self.__changed:
+            return
+
+        if not os.path.isdir(self.__dir):
+            os.makedirs(self.__dir)
+        fd, temp = tempfile.mkstemp('.digest', dir = self.__dir)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                out.write(zlib.compress(pickle.dumps(data, pickle.HIGHEST_PROTOCOL)))
+            if os.path.exists(self.__path):
+                os.remove(self.__path)
+            os.rename(temp, self.__path)
+        except:
+            os.remove(temp)
+            raise
+        self.__changed = False
+
+    # Implementation details
+    __FORMAT = 1 # Increment when changing the layout of the data.
+    # Files whose changes might affect any locale:
+    __shared = ('common/dtd/ldml.dtd', 'common/main/root.xml', 'common/main/en.xml',
+                'common/supplemental/supplementalData.xml',
+                'common/supplemental/supplementalMetadata.xml',
+                'common/supplemental/likelySubtags.xml',
+                'common/supplemental/numberingSystems.xml')
+
+    @staticmethod
+    def __sources(names = ('cldr.py', 'ldml.py', 'qlocalexml.py', 'dateconverter.py',
+                           'enumdata.py', 'localetools.py')):
+        here = os.path.dirname(os.path.abspath(__file__))
+        return tuple(os.path.join(here, name) for name in names)
+
+    def __hash(self, path):
+        """Content hash of a file, given relative to the CLDR root.
+
+        Returns None if there is no such file."""
+        try:
+            return self.__hashes[path]
+        except KeyError:
+            pass
+        try:
+            with open(os.path.join(self.__root, *path.split('/')), 'rb') as fd:
+                digest = hashlib.sha1(fd.read()).digest()
+        except IOError:
+            digest = None
+        self.__hashes[path] = digest
+        return digest
+
+    def __load(self):
+        try:
+            with open(self.__path, 'rb') as fd:
+                return pickle.loads(zlib.decompress(fd.read()))
+        except Exception: # Missing, unreadable or corrupt: start afresh
+            return None
@@ -40,6 +40,34 @@ output as the second argument; either omit it or use '-' to select the
 standard output. This file is the input needed by
 ``./qlocalexml2cpp.py``
 
+CLDR's files are parsed with xml.etree.ElementTree by default; pass
+``--xml-backend=minidom`` to use xml.dom.minidom instead, e.g. to
+compare their results, run-times or memory use.  Locales are read in
+parallel, using a process per CPU unless ``--jobs`` says otherwise.
+Pass ``--cache`` a directory in which to remember digested data, so
+that later runs only re-read locales whose files have changed.
+Pass ``--stats`` a file name (or '-' for the standard error stream) to
+have it report where the time went: how long each phase and locale
+took, how many XPath look-ups were needed and how many files were
+parsed, as text or, if the name ends in ``.json``, as JSON.  With
+this option, the supplemental data shared by all locales are loaded
+before reading any locale, so as to time them separately.
+
+Pass ``--changed-only`` when regenerating from CLDR data in which
+only a few locales have changed: it keeps the cache (unless ``--cache``
+says where) in a directory named after the output file, with suffix
+``.cache``, and a fingerprint of each locale's data, in a file with
+suffix ``.fingerprints``.  Only locales whose own files, or those of
+their inheritance chain, have changed are read again; the rest are
+taken from the cache.  It reports which locales' data changed since
+the last run that recorded fingerprints and how much time reusing
+the rest saved.
+
+If the output file's name ends in ``.jsonl`` in place of ``.xml``, a
+compact JSON-lines form of the same data is written, which
+``./qlocalexml2cpp.py`` reads faster; it is meant for quick iteration
+on the scripts, not for reading.
+
 When you update the CLDR data, be sure to also update
 src/corelib/text/qt_attribution.json's entry for unicode-cldr. Check
 this script's output for unknown language, country or script messages;
@@ -56,65 +84,150 @@ time zone names; see cldr2qtimezone.py for details.
 
 import os
 import sys
+import json
+import argparse
+import multiprocessing
 
 from cldr import CldrReader
-from qlocalexml import QLocaleXmlWriter
+from qlocalexml import QLocaleXmlWriter, QLocaleJsonWriter, JSON_EXTENSION
 from enumdata import language_list, script_list, country_list
-
-def usage(name, err, message = ''):
-    err.write("""Usage: {} path/to/cldr/common/main [out-file.xml]
-""".format(name)) # TODO: expand command-line, improve help message
-    if message:
-        err.write('\n' + message + '\n')
+from ldml import backends, tallies
+from localetools import Statistics
+
+def reportChanges(path, locales, calendars, stats, err):
+    """Reports which locales have changed, then records their fingerprints.
+
+    The fingerprints, along with how long each CLDR locale took to
+    read when last read, are kept at path, as JSON.  The given
+    locales, as returned by CldrReader.readLocales(), are compared
+    with these and the changes reported to err, along with roughly
+    how much time was saved by taking locales from the cache, based
+    on the Statistics readLocales() recorded."""
+    try:
+        with open(path) as fd:
+            old = json.load(fd)
+    except (IOError, ValueError):
+        old = dict(locales = {}, seconds = {})
+
+    prints = dict(('_'.join(code for code in (k.language_code, k.script_code,
+                                              k.country_code, k.variant_code) if code),
+                   k.fingerprint(calendars))
+                  for k in locales.values())
+    seconds, saved = {}, 0
+    for row in stats.tables.get('locales', ()):
+        if row.get('cached'):
+            seconds[row['name']] = old['seconds'].get(row['name'], 0)
+            saved += seconds[row['name']]
+        else:
+            seconds[row['name']] = row['seconds']
+
+    changed = sorted(k for k, v in prints.items() if old['locales'].get(k) != v)
+    gone = sorted(k for k in old['locales'] if k not in prints)
+    err.write('Changed locales ({}): {}\n'.format(len(changed), ', '.join(changed) or 'none'))
+    if gone:
+        err.write('Removed locales ({}): {}\n'.format(len(gone), ', '.join(gone)))
+    err.write('Re-read {} of {} CLDR locales; reusing the rest saved about {:.2f} s\n'.format(
+            sum(1 for row in stats.tables.get('locales', ()) if not row.get('cached')),
+            len(seconds), saved))
+
+    with open(path, 'w') as fd:
+        json.dump(dict(locales = prints, seconds = seconds), fd, indent = 0, sort_keys = True)
 
 def main(args, out, err):
     # TODO: make calendars a command-line option
     calendars = ['gregorian', 'persian', 'islamic'] # 'hebrew'
 
-    # TODO: make argument parsing more sophisticated
-    name = args.pop(0)
-    if not args:
-        usage(name, err, 'Where is your CLDR data tree ?')
-        return 1
-
-    root = args.pop(0)
+    parser = argparse.ArgumentParser(
+        prog = args[0],
+        description = 'Generate QLocaleXML from CLDR data.')
+    parser.add_argument('cldr_path', help = 'path to the root of the CLDR tree')
+    parser.add_argument('out_file', nargs = '?', default = '-',
+                        help = 'output file name, .xml or .jsonl (default: XML on standard output)')
+    parser.add_argument('--xml-backend', default = 'etree', choices = sorted(backends),
+                        help = 'XML library to parse CLDR files with (default: etree)')
+    parser.add_argument('-j', '--jobs', type = int, default = multiprocessing.cpu_count(),
+                        help = 'number of processes to read locales with'
+                        ' (default: one per CPU; 1 reads them all in this process)')
+    parser.add_argument('--cache', metavar = 'DIR',
+                        help = 'directory in which to keep digested CLDR data between'
+                        ' runs, so as to only re-read locales whose files have changed')
+    parser.add_argument('--changed-only', action = 'store_true',
+                        help = 'only re-read locales whose files have changed, keeping a'
+                        ' cache (unless --cache is given) and fingerprints of each locale'
+                        ' beside the output file; report which locales changed')
+    parser.add_argument('--no-indent', action = 'store_true',
+                        help = 'write XML output without indentation, for a smaller file')
+    parser.add_argument('--stats', metavar = 'FILE',
+                        help = 'file to report timings and counts to, as JSON if it ends'
+                        ' in .json (use - for the standard error stream)')
+    opts = parser.parse_args(args[1:])
+
+    root = opts.cldr_path
     if not os.path.exists(os.path.join(root, 'common', 'main', 'root.xml')):
-        usage(name, err,
-              'First argument is the root of the CLDR tree: found no common/main/root.xml under '
-              + root)
-        return 1
+        parser.error('First argument is the root of the CLDR tree: found no common/main/root.xml under '
+                     + root)
+
+    xml = opts.out_file
+    if opts.changed_only:
+        if not xml or xml == '-':
+            parser.error('With --changed-only, please name an output file')
+        if opts.cache is None:
+            opts.cache = xml + '.cache'
 
-    xml = args.pop(0) if args else None
     if not xml or xml == '-':
         emit = out
-    elif not xml.endswith('.xml'):
-        usage(name, err, 'Please use a .xml extension on your output file name, not ' + xml)
-        return 1
+    elif not xml.endswith(('.xml', JSON_EXTENSION)):
+        parser.error('Please use a .xml (or, for the compact form, {}) extension'
+                     ' on your output file name, not {}'.format(JSON_EXTENSION, xml))
     else:
         try:
             emit = open(xml, 'w')
         except IOError as e:
-            usage(name, err, 'Failed to open "{}" to write output to it\n'.format(xml))
-            return 1
-
-    if args:
-        usage(name, err, 'Too many arguments - excess: ' + ' '.join(args))
-        return 1
+            parser.error('Failed to open "{}" to write output to it'.format(xml))
 
     if emit.encoding != 'UTF-8' or (emit.encoding is None and sys.getdefaultencoding() != 'UTF-8'):
         reload(sys) # Weirdly, this gets a richer sys module than the plain import got us !
         sys.setdefaultencoding('UTF-8')
 
+    stats = Statistics()
+    phase = stats.phase
+
     # TODO - command line options to tune choice of grumble and whitter:
-    reader = CldrReader(root, err.write, err.write)
-    writer = QLocaleXmlWriter(emit.write)
+    with phase('set-up'):
+        reader = CldrReader(root, err.write, err.write, opts.xml_backend, opts.cache, stats)
+    if xml.endswith(JSON_EXTENSION):
+        writer = QLocaleJsonWriter(emit.write)
+    else:
+        writer = QLocaleXmlWriter(emit.write, 0 if opts.no_indent else 4)
 
-    writer.version(reader.root.cldrVersion)
+    with phase('DTD scan'):
+        writer.version(reader.root.cldrVersion)
     writer.enumData(language_list, script_list, country_list)
-    writer.likelySubTags(reader.likelySubTags())
-    writer.locales(reader.readLocales(calendars), calendars)
-
-    writer.close()
+    with phase('likely subtags'):
+        writer.likelySubTags(reader.likelySubTags())
+    if opts.stats is not None:
+        # Otherwise loaded when (and if) first needed, timed with the locales:
+        with phase('supplemental tables'):
+            reader.root.preload()
+    with phase('locales'):
+        locales = reader.readLocales(calendars, max(opts.jobs, 1))
+    with phase('writing'):
+        writer.locales(locales, calendars)
+        writer.close()
+    with phase('saving cache'):
+        reader.saveCache()
+    if opts.changed_only:
+        reportChanges(xml + '.fingerprints', locales, calendars, stats, err)
+
+    if opts.stats is not None:
+        for name, n in tallies.items():
+            stats.count(name, n)
+        hits = tallies['alias plan cache hits']
+        looks = hits + tallies['alias plan cache misses']
+        stats.count('XPath look-ups', looks)
+        stats.count('alias plan cache hit rate', round(hits / float(looks or 1), 4))
+        with Statistics.writeTo(opts.stats, err) as report:
+            stats.report(report, opts.stats.endswith('.json'))
     return 0
 
 if __name__ == '__main__':
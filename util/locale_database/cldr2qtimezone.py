@@ -37,6 +37,7 @@ use.
 """
 
 import os
+import bisect
 import datetime
 import textwrap
 
@@ -242,22 +243,53 @@ utcIdList = (
 ### End of data that may need updates in response to CLDR ###
 
 class ByteArrayData:
+    """Pool of strings, packed into one array of NUL-terminated chars.
+
+    Call append() with each string to be stored, then pack(), before
+    asking for the index() of any string, then write()."""
     def __init__(self):
         self.data = []
         self.hash = {}
+        self.strings = [] # Each distinct string, NUL-terminated, in order of arrival
 
     def append(self, s):
         s = s + '\0'
-        if s in self.hash:
-            return self.hash[s]
-
-        lst = unicode2hex(s)
-        index = len(self.data)
-        if index > 0xffff:
-            raise Error('Index ({}) outside the uint16 range !'.format(index))
-        self.hash[s] = index
-        self.data += lst
-        return index
+        if s not in self.hash:
+            self.hash[s] = None
+            self.strings.append(s)
+
+    def index(self, s):
+        return self.hash[s + '\0']
+
+    def pack(self):
+        """Lay out all strings appended, sharing suffixes.
+
+        Each string that is a suffix of another (counting the NUL
+        terminator, so a string's tail) uses the end of that other's
+        text.  Returns a pair: the number of chars needed without
+        sharing and the number needed with it."""
+        # Sorted on their reversals, each string that is a suffix of
+        # any other is followed by one it is a suffix of:
+        ordered = sorted(self.strings, key=lambda s: s[::-1])
+        within = dict((s, t) for s, t in zip(ordered, ordered[1:]) if t.endswith(s))
+        for s in self.strings:
+            if s not in within:
+                self.hash[s] = len(self.data)
+                self.data += unicode2hex(s)
+        for s in self.strings:
+            t = s
+            while t in within:
+                t = within[t]
+            if t is not s:
+                self.hash[s] = self.hash[t] + len(t) - len(s)
+
+        for s in self.strings:
+            index = self.hash[s]
+            if index > 0xffff:
+                raise Error('Index ({}) outside the uint16 range !'.format(index))
+            if self.data[index:index + len(s)] != unicode2hex(s):
+                raise Error('Packed data lost "{}"'.format(s[:-1]))
+        return sum(len(s) for s in self.strings), len(self.data)
 
     def write(self, out, name):
         out('\nstatic const char {}[] = {{\n'.format(name))
@@ -266,10 +298,15 @@ class ByteArrayData:
 
 class ZoneIdWriter (SourceFileEditor):
     def write(self, version, defaults, windowsIds):
+        """Writes the tables; returns the sizes of the string data.
+
+        Returns a sequence of (name, unshared, packed) triples, one for
+        each char array, with pack()'s sizes for it."""
         self.__writeWarning(version)
         windows, iana = self.__writeTables(self.writer.write, defaults, windowsIds)
         windows.write(self.writer.write, 'windowsIdData')
         iana.write(self.writer.write, 'ianaIdData')
+        return (('windowsIdData',) + windows.sizes, ('ianaIdData',) + iana.sizes)
 
     def __writeWarning(self, version):
         self.writer.write("""
@@ -286,16 +323,57 @@ class ZoneIdWriter (SourceFileEditor):
 """.format(str(datetime.date.today()), version))
 
     @staticmethod
-    def __writeTables(out, defaults, windowsIds):
+    def __ianaIndex(zones):
+        """Sorts the IANA IDs of zones, checking a search finds each.
+
+        Returns a list of (ID, zone) pairs sorted by ID; zone is the
+        index in zones of the first to list the ID.  QTimeZone does a
+        binary search of this, so check each ID is found, with the
+        right zone, by a search of this list."""
+        first = {}
+        for i, (index, data) in enumerate(zones):
+            for iana in data['ianaList'].split():
+                first.setdefault(iana, i)
+        table = sorted(first.items())
+
+        keys = [iana for iana, zone in table]
+        for i, (index, data) in enumerate(zones):
+            for iana in data['ianaList'].split():
+                at = bisect.bisect_left(keys, iana)
+                if at == len(keys) or keys[at] != iana:
+                    raise Error('IANA ID {} is missing from the sorted table'.format(iana))
+                zone = zones[table[at][1]][1]
+                if iana not in zone['ianaList'].split() or table[at][1] > i:
+                    raise Error('IANA ID {} maps to {}, not {}'.format(
+                            iana, zone['windowsId'], data['windowsId']))
+        return table
+
+    @classmethod
+    def __writeTables(cls, out, defaults, windowsIds):
         windowsIdData, ianaIdData = ByteArrayData(), ByteArrayData()
+        zones = sorted(windowsIds.items())
+
+        # Collect the strings, so as to pack them before writing any index:
+        for index, data in zones:
+            ianaIdData.append(data['ianaList'])
+            # Each on its own, too, for the sorted IANA ID table:
+            for iana in data['ianaList'].split():
+                ianaIdData.append(iana)
+        for index, pair in enumerate(windowsIdList, 1):
+            windowsIdData.append(pair[0])
+            ianaIdData.append(defaults[index])
+        for pair in utcIdList:
+            ianaIdData.append(pair[0])
+        windowsIdData.sizes = windowsIdData.pack()
+        ianaIdData.sizes = ianaIdData.pack()
 
         # Write Windows/IANA table
         out('// Windows ID Key, Country Enum, IANA ID Index\n')
         out('static const QZoneData zoneDataTable[] = {\n')
-        for index, data in sorted(windowsIds.items()):
+        for index, data in zones:
             out('    {{ {:6d},{:6d},{:6d} }}, // {} / {}\n'.format(
                     data['windowsKey'], data['countryId'],
-                    ianaIdData.append(data['ianaList']),
+                    ianaIdData.index(data['ianaList']),
                     data['windowsId'], data['country']))
         out('    {      0,     0,     0 } // Trailing zeroes\n')
         out('};\n\n')
@@ -306,8 +384,8 @@ class ZoneIdWriter (SourceFileEditor):
         for index, pair in enumerate(windowsIdList, 1):
             out('    {{ {:6d},{:6d},{:6d},{:6d} }}, // {}\n'.format(
                     index,
-                    windowsIdData.append(pair[0]),
-                    ianaIdData.append(defaults[index]),
+                    windowsIdData.index(pair[0]),
+                    ianaIdData.index(defaults[index]),
                     pair[1], pair[0]))
         out('    {      0,     0,     0,     0 } // Trailing zeroes\n')
         out('};\n\n')
@@ -317,8 +395,16 @@ class ZoneIdWriter (SourceFileEditor):
         out('static const QUtcData utcDataTable[] = {\n')
         for pair in utcIdList:
             out('    {{ {:6d},{:6d} }}, // {}\n'.format(
-                    ianaIdData.append(pair[0]), pair[1], pair[0]))
+                    ianaIdData.index(pair[0]), pair[1], pair[0]))
         out('    {     0,      0 } // Trailing zeroes\n')
+        out('};\n\n')
+
+        # Write IANA ID table, sorted by ID, for binary search
+        out('// IANA ID Index, Zone Data Index (first to list the IANA ID)\n')
+        out('static const QIanaData ianaIdTable[] = {\n')
+        for iana, zone in cls.__ianaIndex(zones):
+            out('    {{ {:6d},{:6d} }}, // {}\n'.format(ianaIdData.index(iana), zone, iana))
+        out('    {      0,     0 } // Trailing zeroes\n')
         out('};\n')
 
         return windowsIdData, ianaIdData
@@ -378,14 +464,19 @@ def main(args, out, err):
         return 1
 
     try:
-        writer.write(version, defaults, winIds)
+        sizes = writer.write(version, defaults, winIds)
     except Error as e:
         writer.cleanup()
         err.write('\nError in Windows ID data: ' + e.message + '\n')
         return 1
 
-    writer.close()
-    out.write('Data generation completed, please check the new file at ' + dataFilePath + '\n')
+    for table, unshared, packed in sizes:
+        out.write('{}: {} -> {} chars\n'.format(table, unshared, packed))
+
+    if writer.close():
+        out.write('Data generation completed, please check the new file at ' + dataFilePath + '\n')
+    else:
+        out.write('Data generation completed, no change to ' + dataFilePath + '\n')
     return 0
 
 if __name__ == '__main__':
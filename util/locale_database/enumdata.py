@@ -858,26 +858,56 @@ script_aliases = {
     'TraditionalChineseScript': 'TraditionalHanScript',
 }
 
+def __byCode(book):
+    # Maps each code to its (id, name); where two share a code, the
+    # lower id wins, matching the linear searches this replaces.
+    result = {}
+    for num in sorted(book):
+        name, code = book[num]
+        result.setdefault(code, (num, name))
+    return result
+
+__ids = dict(language = __byCode(language_list),
+             script = __byCode(script_list),
+             country = __byCode(country_list))
+__codes = {}
+for kind, anyName in (('language', 'AnyLanguage'),
+                      ('script', 'AnyScript'),
+                      ('country', 'AnyCountry')):
+    # Map empty to zero and the any value:
+    __codes[kind] = dict(__ids[kind])
+    __codes[kind][''] = (0, anyName)
+# and map language code 'und' also to (0, any):
+__codes['language']['und'] = (0, 'AnyLanguage')
+del kind, anyName
+
+def codeMap(kind):
+    """Maps each code of the given kind to its (id, name) pair.
+
+    Single argument, kind, is 'language', 'script' or 'country'.  The
+    empty code, and 'und' for language, map to the Any* value. The
+    mapping returned is shared, so must not be modified."""
+    return __codes[kind]
+
+def codeToIdName(kind, code):
+    """Returns the (id, name) pair for the given code of kind.
+
+    Raises KeyError if the code is unknown.  See codeMap()."""
+    return __codes[kind][code]
+
 def countryCodeToId(code):
     if not code:
         return 0
-    for country_id in country_list:
-        if country_list[country_id][1] == code:
-            return country_id
-    return -1
+    return __ids['country'].get(code, (-1,))[0]
 
 def languageCodeToId(code):
     if not code:
         return 0
-    for language_id in language_list:
-        if language_list[language_id][1] == code:
-            return language_id
-    return -1
+    return __ids['language'].get(code, (-1,))[0]
 
 def scriptCodeToId(code):
     if not code:
         return 0
-    for script_id in script_list:
-        if script_list[script_id][1] == code:
-            return script_id
-    return -1
+    return __ids['script'].get(code, (-1,))[0]
+
+del __byCode
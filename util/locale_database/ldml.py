@@ -28,21 +28,34 @@
 """Parsing the Locale Data Markup Language
 
 It's an XML format, so the raw parsing of XML is, of course, delegated
-to xml.dom.minidom; but it has its own specific schemata and some
-funky rules for combining data from various files (inheritance between
+to a general-purpose XML library: either xml.etree.ElementTree or
+xml.dom.minidom; but it has its own specific schemata and some funky
+rules for combining data from various files (inheritance between
 locales). The use of it we're interested in is extraction of CLDR's
 data, so some of the material here is specific to CLDR; see cldr.py
 for how it is mainly used.
 
-Provides various classes to wrap xml.dom's objects, specifically those
-returned by minidom.parse() and their child-nodes:
-  Node -- wraps any node in the DOM tree
+Provides various classes to wrap the XML library's objects,
+specifically the roots of parsed files and their child-nodes:
+  Node -- wraps any node in a minidom tree
+  EtreeNode -- wraps any node in an ElementTree tree
   XmlScanner -- wraps the root element of a stand-alone XML file
   Supplement -- specializes XmlScanner for supplemental data files
   LocaleScanner -- wraps a locale's inheritance-chain of file roots
 
+The mapping backends maps the names of the supported XML libraries to
+the corresponding Node class.  The Counter tallies counts look-ups
+and files parsed, for statistics.
+
 See individual classes for further detail.
 """
+from collections import Counter
+from xml.dom import minidom
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError: # Python 3.9 dropped it; the plain module is accelerated anyway.
+    from xml.etree import ElementTree
+
 from localetools import Error
 from dateconverter import convert_date
 
@@ -51,7 +64,12 @@ class Node (object):
 
     Provides various ways to select chldren of a node. Selected child
     nodes are returned wrapped as Node objects.  A Node exposes the
-    raw DOM node it wraps via its .dom attribute."""
+    raw DOM node it wraps via its .dom attribute.
+
+    This class wraps nodes of xml.dom.minidom's trees; EtreeNode does
+    the same for xml.etree.ElementTree's.  Code that only uses the
+    methods and properties of Node, rather than its .dom, works with
+    either."""
 
     def __init__(self, elt, dullAttrs = None, draft = 0):
         """Wraps a DOM node for ease of access.
@@ -68,13 +86,71 @@ class Node (object):
         this class's creation of child nodes; it is the maximum draft
         score of any ancestor of the new node.)"""
         self.dom, self.__dull = elt, dullAttrs
+        self.__attrs = self._attributes(elt)
         try:
-            attr = elt.attributes['draft'].nodeValue
+            attr = self.__attrs['draft']
         except KeyError:
             self.draft = draft
         else:
             self.draft = max(draft, self.draftScore(attr))
 
+    @classmethod
+    def parse(cls, path):
+        """Parses the XML file at path, returning its document.
+
+        The return is only useful to pass to fromDocument(); a caller
+        that wants to cache it may hold a weak reference to it; it
+        shall be kept alive by any Node fromDocument() made of it."""
+        return minidom.parse(path)
+
+    @classmethod
+    def fromDocument(cls, doc, dullAttrs = None):
+        """Wraps the root element of a document returned by parse().
+
+        Optional second argument, dullAttrs, is as for the
+        constructor."""
+        node = cls(cls._documentElement(doc), dullAttrs)
+        node.document = doc
+        return node
+
+    @property
+    def tag(self):
+        """The tag name of this node."""
+        return self.dom.nodeName
+
+    @property
+    def attributes(self):
+        """Mapping from attribute names to values for this node.
+
+        Callers must not modify it: it is shared."""
+        return self.__attrs
+
+    @property
+    def text(self):
+        """The text of this node's first child, if it has one.
+
+        This is None if the node has no children or its first child is
+        an element."""
+        child = self.dom.firstChild
+        return None if child is None else child.nodeValue
+
+    def allChildren(self):
+        """All child elements, regardless of tag or attributes."""
+        for child in self._childElements(self.dom):
+            yield self.__class__(child, self.__dull, self.draft)
+
+    def attributedChildren(self):
+        """Yields (tag, attributes) for each child with attributes.
+
+        If this node has no content at all, it is treated as if it
+        were its own only child.  This is the form supplemental data
+        usually take."""
+        for elt in self.dom.childNodes or (self.dom,):
+            if elt.attributes:
+                yield (elt.nodeName,
+                       dict((k, v if isinstance(v, basestring) else v.nodeValue)
+                            for k, v in elt.attributes.items()))
+
     def findAllChildren(self, tag, wanted = None, allDull = False):
         """All children that do have the given tag and attributes.
 
@@ -93,29 +169,21 @@ class Node (object):
             allDull = True
         dull = () if allDull else self.__dull[tag]
 
-        for child in self.dom.childNodes:
-            if child.nodeType != child.ELEMENT_NODE:
-                continue
-            if child.nodeName != tag:
-                continue
-
+        for child in self.__children(tag):
             if wanted:
-                try:
-                    if any(child.attributes[k].nodeValue != v
-                           for k, v in wanted.items()):
-                        continue
-                except KeyError: # Some wanted attribute is missing
+                attrs = child.__attrs
+                # A missing wanted attribute's None never matches:
+                if any(attrs.get(k) != v for k, v in wanted.items()):
                     continue
 
                 if not (allDull or all(k in dull or k in wanted
-                                       for k in child.attributes.keys())):
+                                       for k in attrs.keys())):
                     continue
 
-            elif not (allDull or all(k in dull
-                                     for k in child.attributes.keys())):
+            elif not (allDull or all(k in dull for k in child.__attrs.keys())):
                 continue
 
-            yield Node(child, self.__dull, self.draft)
+            yield child
 
     def findUniqueChild(self, tag):
         """Returns the single child with the given nodeName.
@@ -154,8 +222,122 @@ class Node (object):
     __draftScores = dict(true = 4, unconfirmed = 3, provisional = 2,
                          contributed = 1, approved = 0, false = 0)
 
-def _parseXPath(selector):
-    # Split "tag[attr=val][...]" into tag-name and attribute mapping
+    __index = None
+    def __children(self, tag):
+        """The children with the given tag, wrapped.
+
+        On first use, indexes all children by tag, in one pass; the
+        children with any given tag are only wrapped when first asked
+        for, after which the same wrappers are returned each time."""
+        index = self.__index
+        if index is None:
+            index = self.__index = {}
+            for child in self._childElements(self.dom):
+                index.setdefault(self._tagName(child), []).append(child)
+
+        kids = index.get(tag, ())
+        if isinstance(kids, list):
+            kids = index[tag] = tuple(self.__class__(child, self.__dull, self.draft)
+                                      for child in kids)
+        return kids
+
+    # Backend-specific access to raw nodes; derived classes override these:
+    @staticmethod
+    def _documentElement(doc):
+        return doc.documentElement
+
+    @staticmethod
+    def _childElements(elt, ELEMENT=minidom.Node.ELEMENT_NODE):
+        return (child for child in elt.childNodes if child.nodeType == ELEMENT)
+
+    @staticmethod
+    def _tagName(elt):
+        return elt.nodeName
+
+    @staticmethod
+    def _attributes(elt):
+        return dict(elt.attributes.items())
+
+class EtreeNode (Node):
+    """Wrapper for an arbitrary node of an ElementTree tree.
+
+    Behaves exactly as Node, but wraps the far lighter element objects
+    of xml.etree.ElementTree, whose parser is implemented in C."""
+
+    @classmethod
+    def parse(cls, path):
+        return ElementTree.parse(path)
+
+    @property
+    def tag(self):
+        return self.dom.tag
+
+    @property
+    def text(self):
+        return self.dom.text
+
+    def attributedChildren(self):
+        # Match minidom's view: text, with no element, counts as content.
+        kids = list(self.dom)
+        for elt in kids if kids or self.dom.text else (self.dom,):
+            if elt.attrib:
+                yield elt.tag, dict(elt.attrib)
+
+    # Implementation details:
+    @staticmethod
+    def _documentElement(doc):
+        return doc.getroot()
+
+    @staticmethod
+    def _childElements(elt):
+        return elt
+
+    @staticmethod
+    def _tagName(elt):
+        return elt.tag
+
+    @staticmethod
+    def _attributes(elt):
+        return elt.attrib
+
+backends = { 'etree': EtreeNode, 'minidom': Node }
+tallies = Counter()
+
+def streamElements(path, wanted):
+    """Streams selected elements out of an XML file.
+
+    First argument, path, is the file to read.  Second, wanted, is a
+    collection of paths, relative to the document element, with tags
+    separated by '/', such as 'currencyData/region'.  Yields (path,
+    element) pairs, each element being an xml.etree element, complete
+    with its descendants, whose path is in wanted; no such element is
+    yielded as part of another.  The file is parsed incrementally and
+    all other elements are discarded as soon as they are complete,
+    so no DOM of the whole file is ever kept.  Each element yielded
+    is emptied once the caller asks for the next, so callers must
+    extract what they need from it before then."""
+    tags, depth = [], None # depth: len(tags) when inside a wanted element
+    for event, elt in ElementTree.iterparse(path, ('start', 'end')):
+        if event == 'start':
+            tags.append(elt.tag)
+            if depth is None and '/'.join(tags[1:]) in wanted:
+                depth = len(tags)
+            continue
+
+        if depth == len(tags):
+            yield '/'.join(tags[1:]), elt
+            depth = None
+        if depth is None:
+            elt.clear()
+        tags.pop()
+
+def _parseXPath(selector, cache = {}):
+    # Split "tag[attr=val][...]" into tag-name and attribute mapping.
+    # Memoized: callers must not modify the mapping returned.
+    try:
+        return cache[selector]
+    except KeyError:
+        pass
     attrs = selector.split('[')
     name = attrs.pop(0)
     if attrs:
@@ -164,7 +346,8 @@ def _parseXPath(selector):
         attrs = [x[:-1].split('=') for x in attrs]
         assert all(len(x) in (1, 2) for x in attrs)
         attrs = (('type', x[0]) if len(x) == 1 else x for x in attrs)
-    return name, dict(attrs)
+    cache[selector] = name, dict(attrs)
+    return cache[selector]
 
 def _iterateEach(iters):
     # Flatten a two-layer iterator.
@@ -193,16 +376,23 @@ class XmlScanner (object):
 class Supplement (XmlScanner):
     def find(self, xpath):
         elts = self.findNodes(xpath)
-        for elt in _iterateEach(e.dom.childNodes if e.dom.childNodes else (e.dom,)
-                                for e in elts):
-            if elt.attributes:
-                yield (elt.nodeName,
-                       dict((k, v if isinstance(v, basestring) else v.nodeValue)
-                            for k, v in elt.attributes.items()))
+        return _iterateEach(e.attributedChildren() for e in elts)
 
 class LocaleScanner (object):
-    def __init__(self, name, nodes, root):
+    def __init__(self, name, nodes, root, plans = None):
+        """Set up to read a locale's data.
+
+        First argument, name, is the locale's name; second, nodes, is
+        its chain of nodes, from its own file to the last it inherits
+        from before the root locale, root, which is the third
+        argument.  Optional fourth argument, plans, is a dict in which
+        to cache how aliases redirect XPaths (see __aliasPlan()); as
+        this only depends on root, all scanners with the same root
+        should share one.  If omitted, this scanner uses its own."""
         self.name, self.nodes, self.base = name, nodes, root
+        self.__plans = {} if plans is None else plans
+        # Trie of the XPaths sought so far; see __matches():
+        self.__trie = tuple(nodes), {}
 
     def find(self, xpath, default = None, draft = None):
         """XPath search for the content of an element.
@@ -212,17 +402,33 @@ class LocaleScanner (object):
         found.  Optional third argument is a draft score (see
         Node.draftScore() for details); if given, leaf elements with
         higher draft scores are ignored."""
-        try:
-            for elt in self.__find(xpath):
-                try:
-                    if draft is None or elt.draft <= draft:
-                        return elt.dom.firstChild.nodeValue
-                except (AttributeError, KeyError):
-                    pass
-        except Error as e:
-            if default is None:
-                raise
-            return default
+        return self.findAll((xpath,), default, draft)[xpath]
+
+    def findAll(self, xpaths, default = None, draft = None):
+        """XPath search for the contents of several elements.
+
+        First argument, xpaths, is a sequence of XPaths to search for;
+        optional second and third arguments are as for find().
+        Returns a mapping from each XPath to what find() would return
+        for it.  If default is None and some XPath is not found, the
+        Error find() would raise for the first such XPath is raised.
+
+        Each step of the XPaths sought, and of the paths to which
+        aliases redirect them, is resolved in this locale's chain of
+        nodes only once, for the first XPath to need it: thereafter,
+        all XPaths that begin with the same steps share the result.
+        Related XPaths, such as the names of a calendar's months,
+        should be sought together, or at least from the same
+        LocaleScanner, to take advantage of this."""
+        found = {}
+        for xpath in xpaths:
+            text = self.__lookup(xpath, draft)
+            if text is None:
+                if default is None:
+                    raise Error(self.__aliasPlan(xpath)[1] + self.name)
+                text = default
+            found[xpath] = text
+        return found
 
     def tagCodes(self):
         """Yields four tag codes
@@ -237,7 +443,7 @@ class LocaleScanner (object):
         root = self.nodes[0]
         for alias in root.findAllChildren('alias', allDull=True):
             try:
-                source = alias.dom.attributes['source'].nodeValue
+                source = alias.attributes['source']
             except (KeyError, AttributeError):
                 pass
             else:
@@ -247,7 +453,7 @@ class LocaleScanner (object):
         for code in ('language', 'script', 'territory', 'variant'):
             for node in ids.findAllChildren(code, allDull=True):
                 try:
-                    yield node.dom.attributes['type'].nodeValue
+                    yield node.attributes['type']
                 except (KeyError, AttributeError):
                     pass
                 else:
@@ -264,11 +470,13 @@ class LocaleScanner (object):
         """
         if isoCode:
             stem = 'numbers/currencies/currency[{}]/'.format(isoCode)
-            symbol = self.find(stem + 'symbol', '')
-            displays = tuple(self.find(stem + 'displayName' + tail, '')
+            paths = tuple(stem + 'displayName' + tail
                 for tail in ('',) + tuple(
                     '[count={}]'.format(x) for x in ('zero', 'one', 'two',
                                                      'few', 'many', 'other')))
+            found = self.findAll((stem + 'symbol',) + paths, '')
+            symbol = found[stem + 'symbol']
+            displays = tuple(found[x] for x in paths)
             while displays and not displays[-1]:
                 displays = displays[:-1]
             name = ';'.join(displays)
@@ -286,14 +494,16 @@ class LocaleScanner (object):
         """
         system = self.find('numbers/defaultNumberingSystem')
         stem = 'numbers/symbols[numberSystem={}]/'.format(system)
-        decimal = self.find(stem + 'decimal')
-        group = self.find(stem + 'group')
+        symbols = self.findAll(tuple(stem + key for key in (
+                    'decimal', 'group', 'percentSign', 'list', 'exponential',
+                    'plusSign', 'minusSign')))
+        decimal, group = symbols[stem + 'decimal'], symbols[stem + 'group']
         assert decimal != group, (self.name, system, decimal)
         yield 'decimal', decimal
         yield 'group', group
-        yield 'percent', self.find(stem + 'percentSign')
-        yield 'list', self.find(stem + 'list')
-        yield 'exp', self.find(stem + 'exponential')
+        yield 'percent', symbols[stem + 'percentSign']
+        yield 'list', symbols[stem + 'list']
+        yield 'exp', symbols[stem + 'exponential']
         yield 'groupSizes', self.__numberGrouping(system)
 
         digits = lookup(system)['digits']
@@ -305,8 +515,7 @@ class LocaleScanner (object):
                    for i, c in enumerate(digits[1:], 1))
         yield 'zero', zero
 
-        plus = self.find(stem + 'plusSign')
-        minus = self.find(stem + 'minusSign')
+        plus, minus = symbols[stem + 'plusSign'], symbols[stem + 'minusSign']
         yield 'plus', plus
         yield 'minus', minus
 
@@ -326,54 +535,53 @@ class LocaleScanner (object):
         yield 'currencyNegativeFormat', neg
 
     def textPatternData(self):
-        for key in ('quotationStart', 'alternateQuotationEnd',
-                    'quotationEnd', 'alternateQuotationStart'):
-            yield key, self.find('delimiters/' + key)
-
-        for key in ('start', 'middle', 'end'):
-            yield ('listPatternPart' + key.capitalize(),
-                   self.__fromLdmlListPattern(self.find(
-                        'listPatterns/listPattern/listPatternPart[{}]'.format(key))))
-        yield ('listPatternPartTwo',
-               self.__fromLdmlListPattern(self.find(
-                    'listPatterns/listPattern/listPatternPart[2]')))
+        keys = ('quotationStart', 'alternateQuotationEnd',
+                'quotationEnd', 'alternateQuotationStart')
+        found = self.findAll(tuple('delimiters/' + key for key in keys))
+        for key in keys:
+            yield key, found['delimiters/' + key]
+
+        stem = 'listPatterns/listPattern/listPatternPart[{}]'
+        keys = (('Start', 'start'), ('Middle', 'middle'), ('End', 'end'), ('Two', '2'))
+        found = self.findAll(tuple(stem.format(key) for ignore, key in keys))
+        for name, key in keys:
+            yield ('listPatternPart' + name,
+                   self.__fromLdmlListPattern(found[stem.format(key)]))
 
         stem = 'dates/calendars/calendar[gregorian]/'
         # TODO: is wide really the right width to use here ?
         # abbreviated might be an option ... or try both ?
-        meridiem = stem + 'dayPeriods/dayPeriodContext[format]/dayPeriodWidth[wide]/'
+        meridiem = stem + 'dayPeriods/dayPeriodContext[format]/dayPeriodWidth[wide]/dayPeriod[{}]'
+        found = self.findAll((meridiem.format('am'), meridiem.format('pm')),
+                             draft = Node.draftScore('contributed'))
         for key in ('am', 'pm'):
-            yield key, self.find(meridiem + 'dayPeriod[{}]'.format(key),
-                                 draft = Node.draftScore('contributed'))
+            yield key, found[meridiem.format(key)]
 
-        for pair in (('long', 'full'), ('short', 'short')):
-            for key in ('time', 'date'):
-                yield (pair[0] + key.capitalize() + 'Format',
-                       convert_date(self.find(
-                            stem + '{}Formats/{}FormatLength[{}]/{}Format/pattern'.format(
-                                key, key, pair[1], key))))
+        stem += '{0}Formats/{0}FormatLength[{1}]/{0}Format/pattern'
+        keys = tuple((pair[0] + key.capitalize() + 'Format', stem.format(key, pair[1]))
+                     for pair in (('long', 'full'), ('short', 'short'))
+                     for key in ('time', 'date'))
+        found = self.findAll(tuple(xpath for ignore, xpath in keys))
+        for name, xpath in keys:
+            yield name, convert_date(found[xpath])
 
     def endonyms(self, language, script, country, variant):
         # TODO: take variant into account ?
-        for seq in ((language, script, country),
-                    (language, script), (language, country), (language,)):
-            if not all(seq):
-                continue
-            try:
-                yield ('languageEndonym',
-                       self.find('localeDisplayNames/languages/language[{}]'
-                                 .format('_'.join(seq))))
-            except Error:
-                pass
-            else:
+        paths = tuple('localeDisplayNames/languages/language[{}]'.format('_'.join(seq))
+                      for seq in ((language, script, country),
+                                  (language, script), (language, country), (language,))
+                      if all(seq))
+        land = 'localeDisplayNames/territories/territory[{}]'.format(country)
+        found = self.findAll(paths + (land,), '')
+        for xpath in paths:
+            if found[xpath]:
+                yield 'languageEndonym', found[xpath]
                 break
         else:
             # grumble(failed to find endonym for language)
             yield 'languageEndonym', ''
 
-        yield ('countryEndonym',
-               self.find('localeDisplayNames/territories/territory[{}]'
-                         .format(country), ''))
+        yield 'countryEndonym', found[land]
 
     def unitData(self):
         yield ('byte_unit',
@@ -395,18 +603,18 @@ class LocaleScanner (object):
             stem = 'dates/calendars/calendar[' + cal + ']/months/'
             for key, mode, size in namings:
                 prop = 'monthContext[' + mode + ']/monthWidth[' + size + ']/'
-                yield (key + 'Months_' + cal,
-                       ';'.join(self.find(stem + prop + 'month[{}]'.format(i))
-                                for i in range(1, 13)))
+                paths = tuple(stem + prop + 'month[{}]'.format(i) for i in range(1, 13))
+                found = self.findAll(paths)
+                yield key + 'Months_' + cal, ';'.join(found[x] for x in paths)
 
         # Day data (for Gregorian, at least):
         stem = 'dates/calendars/calendar[gregorian]/days/'
         days = ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat')
         for (key, mode, size) in namings:
             prop = 'dayContext[' + mode + ']/dayWidth[' + size + ']/day'
-            yield (key + 'Days',
-                   ';'.join(self.find(stem + prop + '[' + day + ']')
-                            for day in days))
+            paths = tuple(stem + prop + '[' + day + ']' for day in days)
+            found = self.findAll(paths)
+            yield key + 'Days', ';'.join(found[x] for x in paths)
 
     # Implementation details
     __nameForms = (
@@ -418,21 +626,67 @@ class LocaleScanner (object):
         ('narrow', 'format', 'narrow'),
         ) # Used for month and day names
 
-    def __find(self, xpath):
-        retries = [ xpath.split('/') ]
-        while retries:
-            tags, elts, roots = retries.pop(), self.nodes, (self.base.root,)
-            for selector in tags:
-                tag, attrs = _parseXPath(selector)
-                elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
-                if not elts:
-                    break
+    def __lookup(self, xpath, draft):
+        """The content of the element xpath selects, or None.
 
-            else: # Found matching elements
-                # Possibly filter elts to prefer the least drafty ?
-                for elt in elts:
-                    yield elt
+        Tries the matches for each (selectors, roots) entry in the
+        plan for xpath, in turn, taking the text of the first element
+        with text and an acceptable draft score."""
+        for tags, roots in self.__aliasPlan(xpath)[0]:
+            # Possibly filter elts to prefer the least drafty ?
+            for elt in _iterateEach((self.__matches(tags), roots)):
+                try:
+                    if (draft is None or elt.draft <= draft) and elt.text is not None:
+                        return elt.text
+                except (AttributeError, KeyError):
+                    pass
+        return None
+
+    def __matches(self, tags):
+        """The nodes, in this locale's chain, that a path selects.
+
+        Single argument, tags, is a sequence of XPath selectors.  Each
+        node of self.__trie is a pair: the tuple of nodes its path
+        selects and a mapping from selectors to the nodes for the
+        paths that extend it with one more step.  A path's nodes are
+        only computed when first sought, from its parent's, after
+        which all paths through it share them."""
+        node = self.__trie
+        for selector in tags:
+            try:
+                node = node[1][selector]
+            except KeyError:
+                elts = node[0]
+                if elts:
+                    tag, attrs = _parseXPath(selector)
+                    elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
+                node[1][selector] = node = elts, {}
+        return node[0]
+
+    def __aliasPlan(self, xpath):
+        """Resolves the alias rewrites of xpath, once per root locale.
+
+        Returns a pair: a sequence of (selectors, roots) pairs and the
+        start of the message for the Error to raise once they're all
+        exhausted.  Each selectors is a parsed XPath, xpath itself or
+        one of its rewrites, to look up in the locale's own nodes; the
+        matching nodes found in the root locale, if any, follow those.
+        Following the aliases only involves the root locale, so the
+        result is shared by all locales with the same root, via the
+        plans passed to the constructor.  Each selectors is a tuple of
+        the XPath's steps, as strings."""
+        cache, key = self.__plans, xpath
+        try:
+            plan = cache[key]
+        except KeyError:
+            tallies['alias plan cache misses'] += 1
+        else:
+            tallies['alias plan cache hits'] += 1
+            return plan
 
+        plan, retries = [], [ xpath.split('/') ]
+        while retries:
+            tags, roots = retries.pop(), (self.base.root,)
             # Process roots separately: otherwise the alias-processing
             # is excessive.
             for i, selector in enumerate(tags):
@@ -440,28 +694,29 @@ class LocaleScanner (object):
 
                 for alias in tuple(_iterateEach(r.findAllChildren('alias', allDull=True)
                                                 for r in roots)):
-                    if alias.dom.attributes['source'].nodeValue == 'locale':
-                        replace = alias.dom.attributes['path'].nodeValue.split('/')
+                    if alias.attributes['source'] == 'locale':
+                        replace = alias.attributes['path'].split('/')
                         retries.append(self.__xpathJoin(tags[:i], replace, tags[i:]))
 
                 roots = tuple(_iterateEach(r.findAllChildren(tag, attrs) for r in roots))
                 if not roots:
+                    plan.append((tuple(tags), ()))
                     if retries: # Let outer loop fall back on an alias path:
                         break
                     sought = '/'.join(tags)
                     if sought != xpath:
                         sought += ' (for {})'.format(xpath)
-                    raise Error('All lack child {} for {} in {}'.format(
-                            selector, sought, self.name))
+                    cache[key] = plan, 'All lack child {} for {} in '.format(selector, sought)
+                    return cache[key]
 
             else: # Found matching elements
-                for elt in roots:
-                    yield elt
+                plan.append((tuple(tags), roots))
 
         sought = '/'.join(tags)
         if sought != xpath:
             sought += ' (for {})'.format(xpath)
-        raise Error('No {} in {}'.format(sought, self.name))
+        cache[key] = plan, 'No {} in '.format(sought)
+        return cache[key]
 
     def __findUnit(self, keySuffix, quantify, fallback=''):
         # The displayName for a quantified unit in en.xml is kByte
@@ -469,12 +724,11 @@ class LocaleScanner (object):
         # prefer any unitPattern provided, but prune its placeholder:
         for size in ('short', 'narrow'): # TODO: reverse order ?
             stem = 'units/unitLength[{}]/unit[digital-{}byte]/'.format(size + keySuffix, quantify)
-            for count in ('many', 'few', 'two', 'other', 'zero', 'one'):
-                try:
-                    ans = self.find(stem + 'unitPattern[count={}]'.format(count))
-                except Error:
-                    continue
-
+            paths = tuple(stem + 'unitPattern[count={}]'.format(count)
+                          for count in ('many', 'few', 'two', 'other', 'zero', 'one'))
+            found = self.findAll(paths + (stem + 'displayName',), '')
+            for xpath in paths:
+                ans = found[xpath]
                 # TODO: do count-handling, instead of discarding placeholders
                 if False: # TODO: do it this way, instead !
                     ans = ans.replace('{0}', '').strip()
@@ -483,10 +737,8 @@ class LocaleScanner (object):
                 if ans:
                     return ans
 
-            try:
-                return self.find(stem + 'displayName')
-            except Error:
-                pass
+            if found[stem + 'displayName']:
+                return found[stem + 'displayName']
 
         return fallback
 
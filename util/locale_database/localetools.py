@@ -35,10 +35,21 @@ Classes:
   Error -- A shared error class.
   Transcriber -- edit a file by writing a temporary file, then renaming.
   SourceFileEditor -- adds standard prelude and tail handling to Transcriber.
+  Statistics -- gathers timings and counts, for a --stats report.
 """
 
 import os
+import re
+import sys
+import json
+import time
 import tempfile
+from contextlib import contextmanager
+from itertools import izip_longest
+try:
+    import resource
+except ImportError: # Not available on MS-Win
+    resource = None
 
 class Error (StandardError):
     __upinit = StandardError.__init__
@@ -77,27 +88,61 @@ class Transcriber (object):
     classes need to implement transcribing of the content, with
     whatever modifications they may want.  Members reader and writer
     are exposed; use writer.write() to output to the new file; use
-    reader.readline() or iterate reader to read the original.
+    reader.readline() or iterate reader to read the original.  Member
+    path is the path of the file being rewritten.
 
     Callers should call close() on success or cleanup() on failure (to
-    clear away the temporary file).
+    clear away the temporary file).  If the new version has the same
+    content as the original, close() leaves the original untouched, so
+    that its modification time doesn't prompt needless rebuilds.
+    Callers updating several files together may instead call finish()
+    on each and, once all have succeeded, replace() the originals; or,
+    if any has failed, discard() the new versions.
     """
     def __init__(self, path, temp):
         # Open the old file
-        self.reader = open(path)
+        self.path, self.reader = path, open(path)
         # Create a temp file to write the new data into
         temp, tempPath = tempfile.mkstemp(os.path.split(path)[1], dir = temp)
         self.__names = path, tempPath
         self.writer = os.fdopen(temp, "w")
 
     def close(self):
+        """Replaces the original with the new version, if they differ.
+
+        Returns true if it did so, false if the original was left
+        alone."""
+        names = self.finish()
+        if names is None:
+            return False
+        self.replace(*names)
+        return True
+
+    def finish(self):
+        """Completes the new version, without replacing the original.
+
+        Returns None if the new version has the same content as the
+        original, having removed it; else a pair (original, new) of
+        paths, to pass to replace() or discard()."""
         self.reader.close()
         self.writer.close()
         self.reader = self.writer = None
         source, temp = self.__names
+        self.__names = ()
+        if self.__sameContent(source, temp):
+            os.remove(temp)
+            return None
+        return source, temp
+
+    @staticmethod
+    def replace(source, temp):
         os.remove(source)
         os.rename(temp, source)
 
+    @staticmethod
+    def discard(source, temp):
+        os.remove(temp)
+
     def cleanup(self):
         if self.__names:
             self.reader.close()
@@ -106,6 +151,21 @@ class Transcriber (object):
             os.remove(self.__names[1])
             self.__names = ()
 
+    # Implementation details:
+    def _comparable(self, line):
+        """What of line matters when checking for changes.
+
+        Derived classes may override this to ignore incidental parts
+        of a line, that needn't be updated if nothing else changed."""
+        return line
+
+    def __sameContent(self, source, temp):
+        with open(source) as old:
+            with open(temp) as new:
+                return all(a is not None and b is not None
+                           and self._comparable(a) == self._comparable(b)
+                           for a, b in izip_longest(old, new))
+
 class SourceFileEditor (Transcriber):
     """Transcriber with transcription of code around a gnerated block.
 
@@ -123,8 +183,8 @@ class SourceFileEditor (Transcriber):
     marker. Derived classes need only implement the generation of the
     content in between.
 
-    Callers should call close() on success or cleanup() on failure (to
-    clear away the temporary file); see Transcriber.
+    Callers should call close() (or finish()) on success or cleanup()
+    on failure (to clear away the temporary file); see Transcriber.
     """
     __upinit = Transcriber.__init__
     def __init__(self, path, temp):
@@ -137,15 +197,19 @@ class SourceFileEditor (Transcriber):
         self.__upinit(path, temp)
         self.__copyPrelude()
 
-    __upclose = Transcriber.close
-    def close(self):
+    __upfinish = Transcriber.finish
+    def finish(self):
         self.__copyTail()
-        self.__upclose()
+        return self.__upfinish()
 
     # Implementation details:
     GENERATED_BLOCK_START = '// GENERATED PART STARTS HERE'
     GENERATED_BLOCK_END = '// GENERATED PART ENDS HERE'
 
+    # Don't replace a file just to update when it was generated:
+    def _comparable(self, line, date = re.compile(r'(generated on) \d{4}-\d\d-\d\d\b')):
+        return date.sub(r'\1', line)
+
     def __copyPrelude(self):
         # Copy over the first non-generated section to the new file
         for line in self.reader:
@@ -162,3 +226,94 @@ class SourceFileEditor (Transcriber):
         # Transcribe the remainder:
         for line in self.reader:
             self.writer.write(line)
+
+class Statistics (object):
+    """Gathers timings and counts, for a --stats report.
+
+    Time each phase of the work with a with-statement on phase(name);
+    add to counts with count(name, n) and add rows to a table (e.g. one
+    row per locale) with record(table, row), each row being a dict
+    with a 'name' entry.  Statistics gathered in another process can
+    be merge()d in.  Call report() to write them all out, along with
+    peak memory use."""
+    def __init__(self):
+        self.phases, self.counts, self.tables = [], {}, {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.time() - start))
+
+    def count(self, name, n = 1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def record(self, table, row):
+        self.tables.setdefault(table, []).append(row)
+
+    def merge(self, other):
+        self.phases.extend(other.phases)
+        for name, n in other.counts.items():
+            self.count(name, n)
+        for table, rows in other.tables.items():
+            self.tables.setdefault(table, []).extend(rows)
+
+    @staticmethod
+    def peakMemory():
+        """Peak resident set size, in KiB, of this process and its children.
+
+        Returns a pair; children (such as worker processes) only count
+        once they have been waited for.  Returns None if this platform
+        can't tell."""
+        if resource is None:
+            return None
+        # ru_maxrss is in bytes on macOS, KiB elsewhere:
+        scale = 1024 if sys.platform == 'darwin' else 1
+        return tuple(resource.getrusage(who).ru_maxrss // scale
+                     for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN))
+
+    def report(self, out, asJson = False, longest = 10):
+        """Writes the statistics gathered to stream out.
+
+        If asJson is true, everything is written as one JSON object;
+        otherwise, as text, showing only the longest-running rows of
+        each table that has a 'seconds' column."""
+        memory = self.peakMemory()
+        if asJson:
+            json.dump({'phases': self.phases, 'counts': self.counts, 'tables': self.tables,
+                       'peakRss': memory and dict(zip(('self', 'children'), memory))},
+                      out, indent=1, sort_keys=True)
+            out.write('\n')
+            return
+
+        for name, seconds in self.phases:
+            out.write('{:<40} {:9.3f} s\n'.format(name, seconds))
+        for name, n in sorted(self.counts.items()):
+            out.write('{:<40} {:>9}\n'.format(name, n))
+        for table, rows in sorted(self.tables.items()):
+            if any('seconds' in row for row in rows):
+                rows = sorted(rows, key=lambda row: -row.get('seconds', 0))
+                out.write('{} (slowest {} of {}):\n'.format(
+                        table, min(len(rows), longest), len(rows)))
+                rows = rows[:longest]
+            else:
+                out.write('{}:\n'.format(table))
+            for row in rows:
+                out.write('  {}: {}\n'.format(row['name'], ', '.join(
+                            '{}={}'.format(k, round(v, 4) if isinstance(v, float) else v)
+                            for k, v in sorted(row.items()) if k != 'name')))
+        if memory:
+            out.write('{:<40} {:>9} KiB\n'.format('peak RSS', memory[0]))
+            out.write('{:<40} {:>9} KiB\n'.format('peak RSS of child processes', memory[1]))
+
+    @staticmethod
+    @contextmanager
+    def writeTo(path, stderr):
+        """Context for the stream to report() to: path, or stderr if '-'."""
+        if path == '-':
+            yield stderr
+        else:
+            with open(path, 'w') as out:
+                yield out
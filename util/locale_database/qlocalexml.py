@@ -31,13 +31,26 @@
 Provides classes:
   Locale -- common data-type representing one locale as a namespace
   QLocaleXmlWriter -- helper to write a QLocaleXML file
-  QLocaleXmlReader -- helper to read a QLocaleXML file back in
+  QLocaleJsonWriter -- helper to write the same data as compact JSON lines
+  QLocaleXmlReader -- helper to read either form back in
 
 Support:
   Spacer -- provides control over indentation of the output.
+
+The JSON form is for quick iteration, where nobody needs to read the
+intermediate file; its name should end in JSON_EXTENSION, which is how
+QLocaleXmlReader recognizes it.  Each line of it is a JSON array whose
+first entry says what kind of record it is; see QLocaleJsonWriter.
 """
 from __future__ import print_function
+import json
+import hashlib
+from collections import Counter
 from xml.sax.saxutils import escape
+try:
+    from xml.etree.cElementTree import iterparse
+except ImportError: # Python 3.9 dropped it; the plain module is accelerated anyway.
+    from xml.etree.ElementTree import iterparse
 
 from localetools import Error
 
@@ -117,12 +130,10 @@ def convertFormat(format):
 
 class QLocaleXmlReader (object):
     def __init__(self, filename):
-        self.root = self.__parse(filename)
-        # Lists of (id, name, code) triples:
-        languages = tuple(self.__loadMap('language'))
-        scripts = tuple(self.__loadMap('script'))
-        countries = tuple(self.__loadMap('country'))
-        self.__likely = tuple(self.__likelySubtagsMap())
+        # Lists of (id, name, code) triples, of ((from), (to)) triples
+        # and of locales' mappings from tag to text:
+        languages, scripts, countries, likely, self.__locales = self.__parse(filename)
+        self.__likely = tuple(likely)
         # Mappings {ID: (name, code)}
         self.languages = dict((v[0], v[1:]) for v in languages)
         self.scripts = dict((v[0], v[1:]) for v in scripts)
@@ -133,13 +144,12 @@ class QLocaleXmlReader (object):
         self.__landByName = dict((v[1], (v[0], v[2])) for v in countries)
         # Other properties:
         self.dupes = set(v[1] for v in languages) & set(v[1] for v in countries)
-        self.cldrVersion = self.__firstChildText(self.root, "version")
 
     def loadLocaleMap(self, calendars, grumble = lambda text: None):
-        kid = self.__firstChildText
+        kid = self.__childText
         likely = dict(self.__likely)
-        for elt in self.__eachEltInGroup(self.root, 'localeList', 'locale'):
-            locale = Locale.fromXmlData(lambda k: kid(elt, k), calendars)
+        for fields in self.__locales:
+            locale = Locale.fromXmlData(lambda k: kid(fields, k), calendars)
             language = self.__langByName[locale.language][0]
             script = self.__textByName[locale.script][0]
             country = self.__landByName[locale.country][0]
@@ -165,9 +175,10 @@ class QLocaleXmlReader (object):
             yield (language, script, country), locale
 
     def languageIndices(self, locales):
+        counts = Counter(locales)
         index = 0
         for key, value in self.languages.iteritems():
-            i, count = 0, locales.count(key)
+            i, count = 0, counts[key]
             if count > 0:
                 i = index
                 index += count
@@ -204,66 +215,123 @@ class QLocaleXmlReader (object):
                        self.__landByName[give[2]][0])
 
     # Implementation details:
-    def __loadMap(self, category):
-        kid = self.__firstChildText
-        for element in self.__eachEltInGroup(self.root, category + 'List', category):
-            yield int(kid(element, 'id')), kid(element, 'name'), kid(element, 'code')
-
-    def __likelySubtagsMap(self):
-        def triplet(element, keys=('language', 'script', 'country'), kid = self.__firstChildText):
-            return tuple(kid(element, key) for key in keys)
-
-        kid = self.__firstChildElt
-        for elt in self.__eachEltInGroup(self.root, 'likelySubtags', 'likelySubtag'):
-            yield triplet(kid(elt, "from")), triplet(kid(elt, "to"))
-
     def __fromNames(self, names):
         return self.__langByName[names[0]], self.__textByName[names[1]], self.__landByName[names[2]]
 
-    # DOM access:
-    from xml.dom import minidom
-    @staticmethod
-    def __parse(filename, read = minidom.parse):
-        return read(filename).documentElement
-
-    @staticmethod
-    def __isNodeNamed(elt, name, TYPE=minidom.Node.ELEMENT_NODE):
-        return elt.nodeType == TYPE and elt.nodeName == name
-    del minidom
+    def __parse(self, filename):
+        if filename.endswith(JSON_EXTENSION):
+            return self.__load(filename)
+        return self.__iterparse(filename)
+
+    def __load(self, filename):
+        """Reads a file QLocaleJsonWriter wrote.
+
+        Returns the same as __iterparse()."""
+        tables = dict(language = [], script = [], country = [], likely = [], locale = [])
+        version = names = strings = None
+        with open(filename) as fd:
+            if tuple(json.loads(fd.readline() or 'null') or ()) != JSON_FORMAT:
+                raise Error('Not a {} version {} file: {}'.format(
+                        JSON_FORMAT[0], JSON_FORMAT[1], filename))
+            for line in fd:
+                record = json.loads(line)
+                kind = record[0]
+                if kind == 'locale':
+                    tables[kind].append(dict(zip(names, (strings[i] for i in record[1]))))
+                elif kind == 'fields':
+                    names = record[1]
+                elif kind == 'strings':
+                    strings = record[1]
+                elif kind == 'version':
+                    version = record[1]
+                elif kind == 'likely':
+                    tables[kind].append((tuple(record[1]), tuple(record[2])))
+                elif kind in tables:
+                    tables[kind].append((int(record[1]), record[2], record[3]))
+                else:
+                    raise Error('Unknown kind of record, {}, in {}'.format(kind, filename))
+
+        if version is None:
+            raise Error('No version child found')
+        self.cldrVersion = version
+        return tuple(tables[k] for k in ('language', 'script', 'country', 'likely', 'locale'))
+
+    # XML access:
+    def __iterparse(self, filename):
+        """Reads the file in one pass.
+
+        Each entry in one of the top-level groups is reduced to the
+        texts of its children as soon as it has been read; the entry
+        is then cleared, so that the document's tree is never held in
+        memory.  Returns lists of: (id, name, code) triples for
+        languages, scripts and countries; pairs of (language, script,
+        country) triples for likely sub-tags; mappings from tag to
+        text for locales."""
+        kid, group = self.__childText, self.__childFields
+        def triplet(elt, end, keys=('language', 'script', 'country')):
+            fields = group(self.__firstChildElt(elt, end))
+            return tuple(kid(fields, key) for key in keys)
+
+        tables = dict(languageList = [], scriptList = [], countryList = [],
+                      likelySubtags = [], localeList = [])
+        version, path = None, []
+        for event, elt in iterparse(filename, events=('start', 'end')):
+            if event == 'start':
+                path.append(elt.tag)
+                continue
+
+            path.pop()
+            if len(path) == 2: # Entry in a top-level group
+                table = tables.get(path[1])
+                if path[1] == 'likelySubtags':
+                    if elt.tag == 'likelySubtag':
+                        table.append((triplet(elt, 'from'), triplet(elt, 'to')))
+                elif table is not None and elt.tag == path[1][:-4]: # e.g. language in languageList
+                    fields = group(elt)
+                    if path[1] == 'localeList':
+                        table.append(fields)
+                    else:
+                        table.append((int(kid(fields, 'id')),
+                                      kid(fields, 'name'), kid(fields, 'code')))
+                elt.clear()
+            elif len(path) == 1: # Top-level group, now emptied
+                if elt.tag == 'version' and version is None:
+                    version = self.__eltText(elt)
+                elt.clear()
+
+        if version is None:
+            raise Error('No version child found')
+        self.cldrVersion = version
+        return tuple(tables[k] for k in ('languageList', 'scriptList', 'countryList',
+                                         'likelySubtags', 'localeList'))
 
     @staticmethod
-    def __eltWords(elt):
-        child = elt.firstChild
-        while child:
-            if child.nodeType == elt.TEXT_NODE:
-                yield child.nodeValue
-            child = child.nextSibling
+    def __eltText(elt):
+        return u' '.join(text for text in [elt.text] + [child.tail for child in elt]
+                         if text is not None)
 
     @classmethod
-    def __firstChildElt(cls, parent, name):
-        child = parent.firstChild
-        while child:
-            if cls.__isNodeNamed(child, name):
-                return child
-            child = child.nextSibling
+    def __childFields(cls, elt):
+        """Maps each child's tag to its text; the first such child's."""
+        fields = {}
+        for child in elt:
+            if child.tag not in fields:
+                fields[child.tag] = cls.__eltText(child)
+        return fields
 
-        raise Error('No {} child found'.format(name))
-
-    @classmethod
-    def __firstChildText(cls, elt, key):
-        return ' '.join(cls.__eltWords(cls.__firstChildElt(elt, key)))
+    @staticmethod
+    def __firstChildElt(parent, name):
+        child = parent.find(name)
+        if child is None:
+            raise Error('No {} child found'.format(name))
+        return child
 
-    @classmethod
-    def __eachEltInGroup(cls, parent, group, key):
+    @staticmethod
+    def __childText(fields, key):
         try:
-            element = cls.__firstChildElt(parent, group).firstChild
-        except Error:
-            element = None
-
-        while element:
-            if cls.__isNodeNamed(element, key):
-                yield element
-            element = element.nextSibling
+            return fields[key]
+        except KeyError:
+            raise Error('No {} child found'.format(key))
 
 
 class Spacer (object):
@@ -311,7 +379,7 @@ class Spacer (object):
         return self.__call(line)
 
 class QLocaleXmlWriter (object):
-    def __init__(self, save = None, space = Spacer(4)):
+    def __init__(self, save = None, indent = 4):
         """Set up to write digested CLDR data as QLocale XML.
 
         Arguments are both optional.
@@ -322,16 +390,21 @@ class QLocaleXmlWriter (object):
         suppressing the newline (but see the following); this is
         equivalent to passing sys.stdout.write.
 
-        Second argument, space, is an object to call on each text
-        output to prepend indentation and append newlines, or not as
-        the case may be. The default is a Spacer(4), which grows
-        indent by four spaces after each unmatched new tag and shrinks
-        back on a close-tag (its parsing is naive, but adequate to how
-        this class uses it), while adding a newline to each line.
-        """
+        Second argument, indent, is the number of spaces (default: 4)
+        or the unit of text (e.g. '\t') by which to indent each
+        element's children; pass 0 (or '') to skip indentation.  Each
+        element is written on a line of its own, either way.
+
+        Output is gathered into blocks of lines, each passed to save
+        in a single call: each locale is one such block.  The
+        indentation of each line is known from how deeply its element
+        is nested, without examining its text."""
         self.__rawOutput = self.__printit if save is None else save
-        self.__wrap = space
-        self.__write('<localeDatabase>')
+        unit = ' ' * indent if isinstance(indent, int) else indent
+        self.__pads = tuple(unit * depth for depth in range(5)) # Ample for our nesting
+        self.__depth, self.__lines = 0, []
+        self.__openTag('<localeDatabase>')
+        self.__flush()
 
     # Output of various sections, in their usual order:
     def enumData(self, languages, scripts, countries):
@@ -340,36 +413,36 @@ class QLocaleXmlWriter (object):
         self.__enumTable('countryList', countries)
 
     def likelySubTags(self, entries):
-        self.__openTag('likelySubtags')
+        self.__openTag('<likelySubtags>')
         for have, give in entries:
-            self.__openTag('likelySubtag')
+            self.__openTag('<likelySubtag>')
             self.__likelySubTag('from', have)
             self.__likelySubTag('to', give)
-            self.__closeTag('likelySubtag')
-        self.__closeTag('likelySubtags')
+            self.__closeTag('</likelySubtag>')
+        self.__closeTag('</likelySubtags>')
+        self.__flush()
 
     def locales(self, locales, calendars):
-        self.__openTag('localeList')
-        self.__openTag('locale')
-        Locale.C(calendars).toXml(self.inTag, calendars)
-        self.__closeTag('locale')
-        keys = locales.keys()
-        keys.sort()
-        for key in keys:
-            self.__openTag('locale')
-            locales[key].toXml(self.inTag, calendars)
-            self.__closeTag('locale')
-        self.__closeTag('localeList')
+        self.__openTag('<localeList>')
+        for locale in [Locale.C(calendars)] + [locales[k] for k in sorted(locales)]:
+            self.__openTag('<locale>')
+            locale.toXml(self.__inTag, calendars)
+            self.__closeTag('</locale>')
+            self.__flush()
+        self.__closeTag('</localeList>')
+        self.__flush()
 
     def version(self, cldrVersion):
         self.inTag('version', cldrVersion)
 
     def inTag(self, tag, text):
-        self.__write('<{0}>{1}</{0}>'.format(tag, text))
+        self.__inTag(tag, text)
+        self.__flush()
 
     def close(self):
         if self.__rawOutput != self.__complain:
-            self.__write('</localeDatabase>')
+            self.__closeTag('</localeDatabase>')
+            self.__flush()
         self.__rawOutput = self.__complain
 
     # Implementation details
@@ -381,30 +454,116 @@ class QLocaleXmlWriter (object):
         raise Error('Attempted to write data after closing :-(')
 
     def __enumTable(self, tag, table):
-        self.__openTag(tag)
+        self.__openTag('<' + tag + '>')
+        item = tag[:-4]
         for key, value in table.iteritems():
-            self.__openTag(tag[:-4])
-            self.inTag('name', value[0])
-            self.inTag('id', key)
-            self.inTag('code', value[1])
-            self.__closeTag(tag[:-4])
-        self.__closeTag(tag)
+            self.__openTag('<' + item + '>')
+            self.__inTag('name', value[0])
+            self.__inTag('id', key)
+            self.__inTag('code', value[1])
+            self.__closeTag('</' + item + '>')
+        self.__closeTag('</' + tag + '>')
+        self.__flush()
 
     def __likelySubTag(self, tag, likely):
-        self.__openTag(tag)
-        self.inTag('language', likely[0])
-        self.inTag('script', likely[1])
-        self.inTag('country', likely[2])
-        # self.inTag('variant', likely[3])
-        self.__closeTag(tag)
+        self.__openTag('<' + tag + '>')
+        self.__inTag('language', likely[0])
+        self.__inTag('script', likely[1])
+        self.__inTag('country', likely[2])
+        # self.__inTag('variant', likely[3])
+        self.__closeTag('</' + tag + '>')
+
+    # Each of these adds one line to the current block; each is passed
+    # its tag's complete text, to spare it formatting that:
+    def __openTag(self, text):
+        self.__lines.append(self.__pads[self.__depth] + text + '\n')
+        self.__depth += 1
+    def __closeTag(self, text):
+        self.__depth -= 1
+        self.__lines.append(self.__pads[self.__depth] + text + '\n')
+
+    def __inTag(self, tag, text):
+        if not isinstance(text, str):
+            text = str(text) # as str.format() would
+        self.__lines.append(''.join((self.__pads[self.__depth],
+                                     '<', tag, '>', text, '</', tag, '>\n')))
+
+    def __flush(self):
+        self.__rawOutput(''.join(self.__lines))
+        self.__lines = []
+
+JSON_EXTENSION = '.jsonl'
+JSON_FORMAT = ('QLocaleJSON', 1) # Header record: name and version of format
+
+class QLocaleJsonWriter (object):
+    def __init__(self, save = None):
+        """Set up to write digested CLDR data as JSON lines.
+
+        Has the same methods as QLocaleXmlWriter, to be called in the
+        same order.  Optional argument, save, is as for its
+        constructor.  Each record is written as one line, a JSON
+        array whose first entry names its kind:
+          [format name, format version] -- always first (see JSON_FORMAT)
+          ['version', CLDR version]
+          ['language' or 'script' or 'country', id, name, code]
+          ['likely', [language, script, country], [language, script, country]]
+          ['fields', [name, ...]] -- the names of each locale's fields
+          ['strings', [text, ...]] -- every distinct field value, once
+          ['locale', [index, ...]] -- index into strings of each field's value
+        A locale's field values are in the order of the fields record,
+        which is that of Locale.fields().  Locales follow in the same
+        order as QLocaleXmlWriter uses."""
+        self.__rawOutput = self.__printit if save is None else save
+        self.__write(*JSON_FORMAT)
+
+    def enumData(self, languages, scripts, countries):
+        for kind, table in (('language', languages),
+                            ('script', scripts), ('country', countries)):
+            for key, value in table.iteritems():
+                self.__write(kind, key, value[0], value[1])
 
-    def __openTag(self, tag):
-        self.__write('<{}>'.format(tag))
-    def __closeTag(self, tag):
-        self.__write('</{}>'.format(tag))
+    def likelySubTags(self, entries):
+        for have, give in entries:
+            self.__write('likely', have[:3], give[:3])
+
+    def locales(self, locales, calendars):
+        names, strings, index, records = None, [], {}, []
+        for locale in [Locale.C(calendars)] + [locales[k] for k in sorted(locales)]:
+            fields = tuple(locale.fields(calendars))
+            if names is None:
+                names = [k for k, v in fields]
+            record = []
+            for key, value in fields:
+                if not isinstance(value, basestring):
+                    value = str(value)
+                try:
+                    record.append(index[value])
+                except KeyError:
+                    record.append(index.setdefault(value, len(strings)))
+                    strings.append(value)
+            records.append(record)
+
+        self.__write('fields', names)
+        self.__write('strings', strings)
+        for record in records:
+            self.__write('locale', record)
+
+    def version(self, cldrVersion):
+        self.__write('version', cldrVersion)
 
-    def __write(self, line):
-        self.__rawOutput(self.__wrap(line))
+    def close(self):
+        self.__rawOutput = self.__complain
+
+    # Implementation details
+    @staticmethod
+    def __printit(text):
+        print(text, end='')
+    @staticmethod
+    def __complain(text):
+        raise Error('Attempted to write data after closing :-(')
+
+    def __write(self, *record):
+        self.__rawOutput(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
 
 class Locale (object):
     """Holder for the assorted data representing one locale.
@@ -487,20 +646,30 @@ class Locale (object):
         """Writes its data as QLocale XML.
 
         First argument, write, is a callable taking the name and
-        content of an XML element; it is expected to be the inTag
-        bound method of a QLocaleXmlWriter instance.
+        content of an XML element, such as the inTag bound method of
+        a QLocaleXmlWriter instance.
 
         Optional second argument is a list of calendar names, in the
         form used by CLDR; its default is ('gregorian',).
         """
+        for key, value in self.fields(calendars):
+            write(key, value if key in self.__xmlRaw else escape(value).encode('utf-8'))
+
+    def fields(self, calendars=('gregorian',)):
+        """Yields (name, value) for each field to be serialized.
+
+        The names, in the same order for every locale, are those of
+        the elements toXml() writes; the values are their content,
+        before escaping, that fromXmlData()'s lookup should return
+        for each name.  Optional argument is as for toXml()."""
         get = lambda k: getattr(self, k)
         for key in ('language', 'script', 'country'):
-            write(key, get(key))
-            write('{}code'.format(key), get('{}_code'.format(key)))
+            yield key, get(key)
+            yield '{}code'.format(key), get('{}_code'.format(key))
 
         for key in ('decimal', 'group', 'zero', 'list',
                     'percent', 'minus', 'plus', 'exp'):
-            write(key, get(key))
+            yield key, get(key)
 
         for key in ('languageEndonym', 'countryEndonym',
                     'quotationStart', 'quotationEnd',
@@ -518,11 +687,24 @@ class Locale (object):
                 '_'.join((k, cal))
                 for k in self.propsMonthDay('months')
                 for cal in calendars):
-            write(key, escape(get(key)).encode('utf-8'))
+            yield key, get(key)
 
-        write('groupSizes', ';'.join(str(x) for x in get('groupSizes')))
+        yield 'groupSizes', ';'.join(str(x) for x in get('groupSizes'))
         for key in ('currencyDigits', 'currencyRounding'):
-            write(key, get(key))
+            yield key, get(key)
+
+    def fingerprint(self, calendars=('gregorian',)):
+        """Returns a hash of fields(calendars), to tell when they change."""
+        digest = hashlib.sha1()
+        for field in self.fields(calendars):
+            digest.update(repr(field))
+        return digest.hexdigest()
+
+    # Fields toXml() writes without escaping:
+    __xmlRaw = ('language', 'languagecode', 'script', 'scriptcode',
+                'country', 'countrycode', 'decimal', 'group', 'zero', 'list',
+                'percent', 'minus', 'plus', 'exp',
+                'groupSizes', 'currencyDigits', 'currencyRounding')
 
     # Tools used by __monthNames:
     def fullName(i, name): return name
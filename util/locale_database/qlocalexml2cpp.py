@@ -30,68 +30,129 @@
 
 See ``cldr2qlocalexml.py`` for how to generate the qLocaleXML data itself.
 Pass the output file from that as first parameter to this script; pass
-the root of the qtbase check-out as second parameter.
+the root of the qtbase check-out as second parameter.  The first may be
+in either of the forms that script can write, XML or (if its name ends
+in .jsonl) compact JSON lines.
+
+Once the data is loaded, the files are written in parallel, one
+process per file (up to one per CPU); a failure to write one file does
+not stop the others from being updated, but is reported and makes the
+exit status non-zero.
+
+Strings are stored in arrays that share text between strings where
+possible; the sizes of these arrays, without and with the sharing,
+are reported on standard output.
 """
 
 import os
+import re
+import bisect
 import datetime
+import traceback
+import multiprocessing
+from StringIO import StringIO
 
 from qlocalexml import QLocaleXmlReader
-from localetools import unicode2hex, wrap_list, Error, Transcriber, SourceFileEditor
-
-def compareLocaleKeys(key1, key2):
-    if key1 == key2:
-        return 0
-
-    if key1[0] != key2[0]: # First sort by language:
-        return key1[0] - key2[0]
-
-    defaults = compareLocaleKeys.default_map
-    # maps {(language, script): country} by ID
-    try:
-        country = defaults[key1[:2]]
-    except KeyError:
-        pass
-    else:
-        if key1[2] == country:
-            return -1
-        if key2[2] == country:
-            return 1
-
-    if key1[1] == key2[1]:
-        return key1[2] - key2[2]
-
-    try:
-        country = defaults[key2[:2]]
-    except KeyError:
-        pass
-    else:
-        if key2[2] == country:
-            return 1
-        if key1[2] == country:
-            return -1
-
-    return key1[1] - key2[1]
+from localetools import wrap_list, Error, Transcriber, SourceFileEditor, Statistics
+
+class ScriptMixKey (object):
+    """Sort key for a locale of a language with locales in several scripts.
+
+    Orders such locales by the pairwise rules compareLocaleKeys() used
+    to apply; for some languages (e.g. Serbian) these contradict one
+    another, so the order they produce depends on the order of the
+    keys being sorted, which is why sortLocaleKeys() uses them just as
+    that function was used."""
+    __slots__ = ('script', 'country', 'home')
+    def __init__(self, script, country, home):
+        self.script, self.country = script, country
+        self.home = home # (script, country) of the language's default, or (None, None)
+
+    def __eq__(self, other):
+        return self.script == other.script and self.country == other.country
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        script, country = self.script, self.country
+        mainScript, mainLand = self.home
+        if self == other:
+            return False
+        if script == mainScript:
+            if country == mainLand:
+                return True
+            if other.country == mainLand:
+                return False
+        if script == other.script:
+            return country < other.country
+        if other.script == mainScript:
+            if other.country == mainLand:
+                return False
+            if country == mainLand:
+                return True
+        return script < other.script
+
+def sortLocaleKeys(keys, defaults):
+    """Returns locales' keys, as a list, in the order of Qt's tables.
+
+    First argument, keys, is a sequence of (language, script, country)
+    ID triples; second, defaults, is a sequence of ((language, script),
+    country) pairs, as yielded by QLocaleXmlReader.defaultMap(),
+    naming each language's default script and country.
+
+    Locales are grouped by language; within each, the one with the
+    default script and country comes first.  When all of a language's
+    locales share a script, the rest follow by country.  Otherwise,
+    ScriptMixKey orders them pairwise, exactly as the cmp function
+    this replaces did; as its rules can contradict one another, the
+    result may depend on the order of keys, just as it did before.
+    Each locale's sort key is computed once, up front."""
+    home = {} # {language: (script, country)}
+    for (language, script), country in dict(defaults).items():
+        assert language not in home, language # Only one default script
+        home[language] = script, country
+    scripts = {} # {language: set(script)}
+    for language, script, country in keys:
+        scripts.setdefault(language, set()).add(script)
+
+    def key(locale):
+        language, script, country = locale
+        main = home.get(language, (None, None))
+        if len(scripts[language]) > 1:
+            return language, ScriptMixKey(script, country, main)
+        return language, 0 if (script, country) == main else 1, country
+
+    return sorted(keys, key = key)
 
 
 class StringDataToken:
     def __init__(self, index, length, bits):
-        if index > 0xffff:
-            raise ValueError('Start-index ({}) exceeds the uint16 range!'.format(index))
         if length >= (1 << bits):
             raise ValueError('Data size ({}) exceeds the {}-bit range!'.format(length, bits))
 
-        self.index = index
         self.length = length
+        self.place(index)
+
+    def place(self, index):
+        """Sets the start-index; None if it isn't yet known."""
+        if index > 0xffff: # (None compares less than any number.)
+            raise ValueError('Start-index ({}) exceeds the uint16 range!'.format(index))
+        self.index = index
 
 class StringData:
+    """Pool of strings, packed into one array of UTF-16 code units.
+
+    Call append() with each string to be stored, then pack(), before
+    reading the index of any token append() returned, then write()."""
     def __init__(self, name):
         self.data = []
         self.hash = {}
         self.name = name
-        self.text = '' # Used in quick-search for matches in data
+        self.units = [] # UTF-16 of each distinct non-empty string, in order of arrival
+        self.appended = 0
 
     def append(self, s, bits = 8):
+        self.appended += 1
         try:
             token = self.hash[s]
         except KeyError:
@@ -102,32 +163,97 @@ class StringData:
     def __store(self, s, bits):
         """Add string s to known data.
 
-        Seeks to avoid duplication, where possible.
-        For example, short-forms may be prefixes of long-forms.
+        Its start-index in the data is only decided by pack().
         """
         if not s:
             return StringDataToken(0, 0, bits)
-        ucs2 = unicode2hex(s)
-        try:
-            index = self.text.index(s) - 1
-            matched = 0
-            while matched < len(ucs2):
-                index, matched = self.data.index(ucs2[0], index + 1), 1
-                if index + len(ucs2) >= len(self.data):
-                    raise ValueError # not found after all !
-                while matched < len(ucs2) and self.data[index + matched] == ucs2[matched]:
-                    matched += 1
-        except ValueError:
-            index = len(self.data)
-            self.data += ucs2
-            self.text += s
-
-        assert index >= 0
+        units = self.__nonBmp.sub(self.__surrogates, s)
         try:
-            return StringDataToken(index, len(ucs2), bits)
+            token = StringDataToken(None, len(units), bits)
         except ValueError as e:
             e.args += (self.name, s)
             raise
+        token.units = units
+        self.units.append(units)
+        return token
+
+    def pack(self):
+        """Lay out all strings appended, sharing text where possible.
+
+        A string that appears within another shares its text; the
+        rest are merged, greedily, in order of decreasing overlap
+        between the end of one and the start of the next, into a
+        common super-string.  Returns a pair: the number of code units
+        needed without any sharing, and the number needed after."""
+        text = self.__superString(self.units)
+        for s, token in self.hash.items():
+            if token.length:
+                try:
+                    token.place(text.index(token.units))
+                except ValueError as e:
+                    e.args += (self.name, s)
+                    raise
+        self.data = [hex(ord(c)) for c in text]
+        return sum(len(s) for s in self.units), len(text)
+
+    # Python 2 narrow builds already represent non-BMP characters as surrogates:
+    __nonBmp = re.compile(u'[^\u0000-\uffff]')
+    @staticmethod
+    def __surrogates(match):
+        v = ord(match.group())
+        # copied from qchar.h, as in localetools.unicode2hex()
+        return unichr((v >> 10) + 0xd7c0) + unichr(v % 0x400 + 0xdc00)
+
+    @staticmethod
+    def __superString(strings):
+        # Each distinct string, once, longest first (else in order of arrival):
+        order = {}
+        for i, s in enumerate(strings):
+            order.setdefault(s, i)
+        strings = sorted(order, key = lambda s: (-len(s), order[s]))
+
+        # Drop each string that is contained in a longer one:
+        kept, length, joined = [], None, u''
+        for s in strings:
+            if len(s) != length: # Only longer strings can contain s:
+                length, joined = len(s), u'\0'.join(kept)
+            if s not in joined:
+                kept.append(s)
+
+        # Greedily join ends to starts, with the longest overlaps first:
+        count = len(kept)
+        after, before = [None] * count, [None] * count # (index, overlap) of neighbours
+        head, tail = range(count), range(count) # of chain, for each tail and head
+        for size in range(len(kept[0]) - 1 if kept else 0, 0, -1):
+            # Strings are longest first; only those longer than size can overlap by size.
+            # A kept string is not in another, so a whole string can't be an overlap.
+            longer = [i for i in range(count) if len(kept[i]) > size]
+            starts = {}
+            for i in longer:
+                if before[i] is None:
+                    starts.setdefault(kept[i][:size], []).append(i)
+            if not starts:
+                continue
+            for i in longer:
+                if after[i] is not None:
+                    continue
+                nexts = starts.get(kept[i][-size:], ())
+                for j in nexts:
+                    if before[j] is None and j != head[i]: # Avoid forming a cycle
+                        after[i], before[j] = (j, size), (i, size)
+                        first, last = head[i], tail[j]
+                        head[last], tail[first] = first, last
+                        break
+
+        # Write out each chain, from its head:
+        text = []
+        for i in range(count):
+            if before[i] is None:
+                text.append(kept[i])
+                while after[i] is not None:
+                    i, size = after[i]
+                    text.append(kept[i][size:])
+        return u''.join(text)
 
     def write(self, fd):
         if len(self.data) > 0xffff:
@@ -143,10 +269,190 @@ def currencyIsoCodeData(s):
         return '{' + ",".join(str(ord(x)) for x in s) + '}'
     return "{0,0,0}"
 
+class ColumnGroups (object):
+    """Stores the columns of locale_data once per distinct value.
+
+    Each row is taken as written to locale_data: the three IDs, 37
+    range starts, then 37 range sizes, then the strays (currency ISO
+    code and the bit-fields).  Related columns are grouped; each group
+    is stored as a table of its distinct values, each row then holding
+    an index into each table in place of those columns.  The IDs and
+    endonyms are specific to each locale, so stay in the rows.
+
+    The rows are split into group tables and index rows on
+    construction; write() emits these as arrays of integers, each
+    range as its start and size, the currency ISO code as its three
+    characters, under #if 0 until QLocaleData uses them.  The class
+    method verify() reads these arrays back from the generated source
+    and checks they rebuild every row of its locale_data."""
+
+    # Sizes, in bits, of the bit-fields that follow the currency ISO code:
+    __strayBits = (2, 3, 3, 3, 3, 2, 3, 3)
+
+    groups = (('list patterns', tuple(range(0, 5))),
+              ('number symbols', tuple(range(5, 12))),
+              ('quotation marks', tuple(range(12, 16))),
+              ('date formats', (16, 17)),
+              ('time formats', (18, 19)),
+              ('day names', tuple(range(20, 26))),
+              ('am/pm', (26, 27)),
+              ('byte units', (28, 29, 30)),
+              # symbol, display name, formats; ISO code, digits, rounding
+              ('currency', (31, 32, 33, 34, 37, 38, 39)),
+              ('week', (40, 41, 42)),
+              ('digit grouping', (43, 44, 45)))
+    inline = (35, 36) # endonyms
+
+    def __init__(self, rows):
+        self.rows = tuple(self.__fields(row) for row in rows)
+        # One table of distinct values per group, plus, for each row,
+        # its index into each table and its IDs and inline columns:
+        self.tables = tuple([] for group in self.groups)
+        self.indices, self.inlined = [], []
+        seen = tuple({} for group in self.groups)
+        for ids, fields in self.rows:
+            indices = []
+            for (name, columns), table, known in zip(self.groups, self.tables, seen):
+                value = self.__flatten(columns, fields)
+                if value not in known:
+                    known[value] = len(table)
+                    table.append(value)
+                indices.append(known[value])
+            self.indices.append(tuple(indices))
+            self.inlined.append(ids + self.__flatten(self.inline, fields))
+
+    @staticmethod
+    def __fields(row):
+        """Splits off the IDs and pairs up each range's start and size.
+
+        Returns the IDs and a tuple of 46 entries: the 37 (start,
+        size) pairs, then the nine strays."""
+        assert len(row) == 3 + 37 * 2 + 9, row
+        return row[:3], tuple(zip(row[3:40], row[40:77])) + tuple(row[77:])
+
+    @staticmethod
+    def __flatten(columns, fields):
+        """The given columns of a row's fields, as a tuple of integers."""
+        value = []
+        for c in columns:
+            if c < 37:
+                value.extend(fields[c])
+            elif c == 37:
+                value.extend(int(n) for n in fields[c].strip('{}').split(','))
+            else:
+                value.append(fields[c])
+        return tuple(value)
+
+    @staticmethod
+    def __unflatten(columns, value):
+        """Inverse of __flatten(): yields (column, field) pairs."""
+        value = iter(value)
+        for c in columns:
+            if c < 37:
+                yield c, (next(value), next(value))
+            elif c == 37:
+                yield c, '{' + ','.join(str(next(value)) for i in range(3)) + '}'
+            else:
+                yield c, next(value)
+
+    @staticmethod
+    def __arrayName(name):
+        return 'locale_data_' + re.sub(r'\W+', '_', name)
+
+    def __indexType(self):
+        return 'quint8' if all(len(table) <= 256 for table in self.tables) else 'quint16'
+
+    def write(self, out):
+        """Emits the group tables, index rows and inline columns.
+
+        Single argument, out, is a callable to pass the text to."""
+        out('// locale_data, with related columns stored once per distinct value\n'
+            '// (see qlocalexml2cpp.py --column-groups); not yet used by QLocaleData:\n'
+            '#if 0\n')
+        arrays = [('quint16', self.__arrayName(name), table)
+                  for (name, columns), table in zip(self.groups, self.tables)]
+        arrays.append((self.__indexType(), self.__arrayName('group index'), self.indices))
+        arrays.append(('quint16', self.__arrayName('inline'), self.inlined))
+        for kind, name, rows in arrays:
+            out('static const {} {}[][{}] = {{\n'.format(kind, name, len(rows[0])))
+            out(',\n'.join('    {{{} }}'.format(','.join('{:6d}'.format(n) for n in row))
+                           for row in rows))
+            out('\n};\n\n')
+        out('#endif // locale_data grouped\n\n')
+
+    @classmethod
+    def verify(cls, text):
+        """Checks the arrays write() emitted into text rebuild its locale_data.
+
+        Reads back each array and every row of locale_data from text;
+        raises Error if any row is not rebuilt exactly."""
+        arrays = dict((name, [tuple(int(n) for n in re.findall(r'\d+', row))
+                              for row in re.findall(r'\{([^{}]*)\}', body)])
+                      for name, body in re.findall(
+                r'^static const quint(?:8|16) (\w+)\[\]\[\d+\] = \{\n(.*?)\n\};$',
+                text, re.M | re.S))
+        start = text.index('static const QLocaleData locale_data[] = {\n')
+        rows = [tuple(int(n) if n.isdigit() else n
+                      for n in re.findall(r'\{[\d,]*\}|\d+', line.split('//')[0][5:]))
+                for line in text[start:text.index('\n};', start)].split('\n')[1:]
+                if line.startswith('    { ') and not line.endswith('// trailing zeros')]
+        try:
+            tables = [arrays[cls.__arrayName(name)] for name, columns in cls.groups]
+            indices = arrays[cls.__arrayName('group index')]
+            inlined = arrays[cls.__arrayName('inline')]
+        except KeyError as e:
+            raise Error('Missing grouped locale_data array: {}'.format(e.args[0]))
+        if len(indices) != len(rows) or len(inlined) != len(rows):
+            raise Error('Grouped locale_data has {} and {} rows, not {}'.format(
+                    len(indices), len(inlined), len(rows)))
+
+        for n, row in enumerate(rows):
+            fields = [None] * 46
+            for (name, columns), table, i in zip(cls.groups, tables, indices[n]):
+                for column, value in cls.__unflatten(columns, table[i]):
+                    fields[column] = value
+            for column, value in cls.__unflatten(cls.inline, inlined[n][3:]):
+                fields[column] = value
+            if (inlined[n][:3] + tuple(f[0] for f in fields[:37])
+                + tuple(f[1] for f in fields[:37]) + tuple(fields[37:])) != row:
+                raise Error('Row {} of locale_data does not survive grouping'.format(n))
+
+    @classmethod
+    def __width(cls, columns):
+        """Bytes taken up by the given columns, as QLocaleData lays them out."""
+        ranges = [c for c in columns if c < 37]
+        bits = sum(cls.__strayBits[c - 38] for c in columns if c >= 38)
+        size = 3 * len(ranges) + (3 if 37 in columns else 0) + (bits + 7) // 8
+        # quint16 range starts give two-byte alignment:
+        return size + size % 2 if ranges else size
+
+    def sizes(self):
+        """Returns (before, after, groups) sizes in bytes.
+
+        The size before is of locale_data's rows; the one after is of
+        the arrays write() emits.  Each of groups is (name, distinct,
+        bytes) for one group's table."""
+        count = len(self.rows)
+        before = (6 + self.__width(range(46))) * count
+        groups = tuple((name, len(table), 2 * len(table[0]) * len(table))
+                       for (name, columns), table in zip(self.groups, self.tables))
+        index = (1 if self.__indexType() == 'quint8' else 2) * len(self.groups)
+        after = (index + 2 * len(self.inlined[0])) * count + sum(g[2] for g in groups)
+        return before, after, groups
+
+    def report(self, out, path):
+        before, after, groups = self.sizes()
+        for name, distinct, size in groups:
+            out.write('{}: locale_data {}: {} distinct of {} rows, {} bytes\n'.format(
+                    path, name, distinct, len(self.rows), size))
+        out.write('{}: locale_data {} -> {} bytes grouped\n'.format(path, before, after))
+
 class LocaleSourceEditor (SourceFileEditor):
     __upinit = SourceFileEditor.__init__
     def __init__(self, path, temp, version):
         self.__upinit(path, temp)
+        # (name, unshared, packed, appended, distinct) for each StringData:
+        self.poolSizes = []
         self.writer.write("""
 /*
     This part of the file was generated on {} from the
@@ -161,13 +467,41 @@ class LocaleSourceEditor (SourceFileEditor):
 
 """.format(datetime.date.today(), version))
 
+    def packStringData(self, *pools):
+        for data in pools:
+            self.poolSizes.append((data.name,) + data.pack() + (data.appended, len(data.hash)))
+
 class LocaleDataWriter (LocaleSourceEditor):
+    @staticmethod
+    def __checkLikely(likely, table):
+        """Checks each likely sub-tag is found by a search of table.
+
+        QLocale's addLikelySubtags() does a binary search of the table
+        for the first row whose key matches; check that, for each
+        entry, this finds what the first entry for its key, in CLDR's
+        order, maps to."""
+        keys, first = [row[1] for row in table], {}
+        for had, have, got, give, ignore in likely:
+            first.setdefault(have, (got, give))
+        for had, have, got, give, ignore in likely:
+            i = bisect.bisect_left(keys, have)
+            if i == len(keys) or keys[i] != have:
+                raise Error('Likely sub-tag {} is missing from the table'.format(had))
+            if table[i][3] != first[have][1]:
+                raise Error('Likely sub-tag {} maps to {}, not {}'.format(
+                        had, table[i][2], first[have][0]))
+
     def likelySubtags(self, likely):
-        self.writer.write('static const QLocaleId likely_subtags[] = {\n')
-        for had, have, got, give, last in likely:
-            self.writer.write('    {{ {:3d}, {:3d}, {:3d} }}'.format(*have))
-            self.writer.write(', {{ {:3d}, {:3d}, {:3d} }}'.format(*give))
-            self.writer.write(' ' if last else ',')
+        # Sorted (stably) on the key, for QLocale to do a binary search:
+        likely = tuple(likely)
+        table = sorted(likely, key=lambda row: row[1])
+        self.__checkLikely(likely, table)
+
+        self.writer.write('static const LikelyPair likely_subtags[] = {\n')
+        for i, (had, have, got, give, ignore) in enumerate(table, 1):
+            self.writer.write('    {{ {{ {:3d}, {:3d}, {:3d} }}'.format(*have))
+            self.writer.write(', {{ {:3d}, {:3d}, {:3d} }} }}'.format(*give))
+            self.writer.write(' ' if i == len(table) else ',')
             self.writer.write(' // {} -> {}\n'.format(had, got))
         self.writer.write('};\n\n')
 
@@ -282,6 +616,7 @@ class LocaleDataWriter (LocaleSourceEditor):
             # Number group sizes
             ',{:6d}' * 3,
             ' }}')).format
+        rows = []
         for key in names:
             locale = locales[key]
             # Sequence of StringDataToken:
@@ -315,16 +650,26 @@ class LocaleDataWriter (LocaleSourceEditor):
                        endonyms_data.append(locale.countryEndonym)) # 6 entries
                       ) # Total: 37 entries
             assert len(ranges) == 37
-
-            self.writer.write(formatLine(*(
-                        key +
-                        tuple(r.index for r in ranges) +
-                        tuple(r.length for r in ranges) +
-                        (currencyIsoCodeData(locale.currencyIsoCode),
-                         locale.currencyDigits,
-                         locale.currencyRounding, # unused (QTBUG-81343)
-                         locale.firstDayOfWeek, locale.weekendStart, locale.weekendEnd,
-                         locale.groupTop, locale.groupHigher, locale.groupLeast) ))
+            rows.append((key, locale, ranges))
+
+        pools = (list_pattern_part_data, single_character_data,
+                 date_format_data, time_format_data, days_data,
+                 byte_unit_data, am_data, pm_data, currency_symbol_data,
+                 currency_display_name_data, currency_format_data,
+                 endonyms_data)
+        self.packStringData(*pools)
+
+        self.localeRows = []
+        for key, locale, ranges in rows:
+            row = (tuple(r.index for r in ranges) +
+                   tuple(r.length for r in ranges) +
+                   (currencyIsoCodeData(locale.currencyIsoCode),
+                    locale.currencyDigits,
+                    locale.currencyRounding, # unused (QTBUG-81343)
+                    locale.firstDayOfWeek, locale.weekendStart, locale.weekendEnd,
+                    locale.groupTop, locale.groupHigher, locale.groupLeast))
+            self.localeRows.append(key + row)
+            self.writer.write(formatLine(*(key + row))
                               + ', // {}/{}/{}\n'.format(
                     locale.language, locale.script, locale.country))
         self.writer.write(formatLine(*( # All zeros, matching the format:
@@ -335,11 +680,7 @@ class LocaleDataWriter (LocaleSourceEditor):
         self.writer.write('};\n')
 
         # StringData tables:
-        for data in (list_pattern_part_data, single_character_data,
-                     date_format_data, time_format_data, days_data,
-                     byte_unit_data, am_data, pm_data, currency_symbol_data,
-                     currency_display_name_data, currency_format_data,
-                     endonyms_data):
+        for data in pools:
             data.write(self.writer)
 
     @staticmethod
@@ -418,6 +759,7 @@ class CalendarDataWriter (LocaleSourceEditor):
             #  No individual headers for the sizes.
             'Sizes...'
             '\n')
+        rows = []
         for key in names:
             locale = locales[key]
             # Sequence of StringDataToken:
@@ -431,7 +773,10 @@ class CalendarDataWriter (LocaleSourceEditor):
             except ValueError as e:
                 e.args += (locale.language, locale.script, locale.country, stem)
                 raise
+            rows.append((key, locale, ranges))
 
+        self.packStringData(months_data)
+        for key, locale, ranges in rows:
             self.writer.write(
                 self.formatCalendar(*(
                         key +
@@ -488,38 +833,28 @@ class LocaleHeaderWriter (SourceFileEditor):
                                  for pair in sorted(alias.items()))
             + ',\n\n        Last{} = {}\n    }};\n'.format(name, member))
 
-def usage(name, err, message = ''):
-    err.write("""Usage: {} path/to/qlocale.xml root/of/qtbase
-""".format(name)) # TODO: elaborate
-    if message:
-        err.write('\n' + message + '\n')
-
-def main(args, out, err):
-    # TODO: Make calendars a command-line parameter
-    # map { CLDR name: Qt file name }
-    calendars = {'gregorian': 'roman', 'persian': 'jalali', 'islamic': 'hijri',} # 'hebrew': 'hebrew',
-
-    name = args.pop(0)
-    if len(args) != 2:
-        usage(name, err, 'I expect two arguments')
-        return 1
-
-    qlocalexml = args.pop(0)
-    qtsrcdir = args.pop(0)
-
-    if not (os.path.isdir(qtsrcdir)
-            and all(os.path.isfile(os.path.join(qtsrcdir, 'src', 'corelib', 'text', leaf))
-                    for leaf in ('qlocale_data_p.h', 'qlocale.h', 'qlocale.qdoc'))):
-        usage(name, err, 'Missing expected files under qtbase source root ' + qtsrcdir)
-        return 1
-
-    reader = QLocaleXmlReader(qlocalexml)
-    locale_map = dict(reader.loadLocaleMap(calendars, err.write))
-
-    locale_keys = locale_map.keys()
-    compareLocaleKeys.default_map = dict(reader.defaultMap())
-    locale_keys.sort(compareLocaleKeys)
-
+def finishWriting(writer):
+    """Completes writer's new version of its file, without replacing it.
+
+    Records the new version, if it differs from the original, for
+    main() to replace the original with once every job has succeeded.
+    Returns the path of the file holding the new version."""
+    names = writer.finish()
+    if names is None:
+        return writer.path
+    _finished.append(names)
+    return names[1]
+
+def reportPoolSizes(out, path, sizes):
+    for name, unshared, packed, appended, distinct in sizes:
+        out.write('{}: {} {} -> {} code units\n'.format(path, name, unshared, packed))
+        if _stats is not None:
+            _stats.record('string pools', {
+                    'name': '{}: {}'.format(path, name), 'strings': appended,
+                    'distinct': distinct, 'unshared': unshared, 'packed': packed,
+                    'dedup hit rate': round(1 - distinct / float(appended or 1), 4)})
+
+def writeLocaleData(out, err, qtsrcdir, reader, locale_map, locale_keys, grouped = False):
     try:
         writer = LocaleDataWriter(os.path.join(qtsrcdir,  'src', 'corelib', 'text',
                                                'qlocale_data_p.h'),
@@ -533,6 +868,9 @@ def main(args, out, err):
         writer.localeIndex(reader.languageIndices(tuple(k[0] for k in locale_map)))
         writer.localeData(locale_map, locale_keys)
         writer.writer.write('\n')
+        if grouped:
+            groups = ColumnGroups(writer.localeRows)
+            groups.write(writer.writer.write)
         writer.languageNames(reader.languages)
         writer.scriptNames(reader.scripts)
         writer.countryNames(reader.countries)
@@ -544,30 +882,49 @@ def main(args, out, err):
         writer.cleanup()
         err.write('\nError updating locale data: ' + e.message + '\n')
         return 1
+    except:
+        writer.cleanup()
+        raise
 
-    writer.close()
-
-    # Generate calendar data
-    for calendar, stem in calendars.items():
-        try:
-            writer = CalendarDataWriter(os.path.join(qtsrcdir, 'src', 'corelib', 'time',
-                                                     'q{}calendar_data_p.h'.format(stem)),
-                                        qtsrcdir, reader.cldrVersion)
-        except IOError as e:
-            err.write('Failed to open files to transcribe ' + calendar
-                             + ' data ' + (e.message or e.args[1]))
-            return 1
-
+    written = finishWriting(writer)
+    reportPoolSizes(out, 'qlocale_data_p.h', writer.poolSizes)
+    if grouped:
+        # Check what we wrote, as read back from the new version; if
+        # this fails, main() doesn't replace the original with it:
         try:
-            writer.write(calendar, locale_map, locale_keys)
+            with open(written) as fd:
+                ColumnGroups.verify(fd.read())
         except Error as e:
-            writer.cleanup()
-            err.write('\nError updating ' + calendar + ' locale data: ' + e.message + '\n')
+            err.write('\nError checking grouped locale data: ' + e.message + '\n')
             return 1
+        groups.report(out, 'qlocale_data_p.h')
+    return 0
+
+def writeCalendarData(out, err, qtsrcdir, reader, locale_map, locale_keys, calendar, stem):
+    try:
+        writer = CalendarDataWriter(os.path.join(qtsrcdir, 'src', 'corelib', 'time',
+                                                 'q{}calendar_data_p.h'.format(stem)),
+                                    qtsrcdir, reader.cldrVersion)
+    except IOError as e:
+        err.write('Failed to open files to transcribe ' + calendar
+                         + ' data ' + (e.message or e.args[1]))
+        return 1
 
-        writer.close()
+    try:
+        writer.write(calendar, locale_map, locale_keys)
+    except Error as e:
+        writer.cleanup()
+        err.write('\nError updating ' + calendar + ' locale data: ' + e.message + '\n')
+        return 1
+    except:
+        writer.cleanup()
+        raise
 
-    # qlocale.h
+    finishWriting(writer)
+    reportPoolSizes(out, 'q{}calendar_data_p.h'.format(stem), writer.poolSizes)
+    return 0
+
+def writeLocaleHeader(out, err, qtsrcdir, reader):
     try:
         writer = LocaleHeaderWriter(os.path.join(qtsrcdir, 'src', 'corelib', 'text', 'qlocale.h'),
                                     qtsrcdir, reader.dupes)
@@ -583,10 +940,14 @@ def main(args, out, err):
         writer.cleanup()
         err.write('\nError updating qlocale.h: ' + e.message + '\n')
         return 1
+    except:
+        writer.cleanup()
+        raise
 
-    writer.close()
+    finishWriting(writer)
+    return 0
 
-    # qlocale.qdoc
+def writeLocaleDoc(out, err, qtsrcdir, reader):
     try:
         writer = Transcriber(os.path.join(qtsrcdir, 'src', 'corelib', 'text', 'qlocale.qdoc'),
                              qtsrcdir)
@@ -605,10 +966,146 @@ def main(args, out, err):
         writer.cleanup()
         err.write('\nError updating qlocale.qdoc: ' + e.message + '\n')
         return 1
+    except:
+        writer.cleanup()
+        raise
 
-    writer.close()
+    finishWriting(writer)
     return 0
 
+_stats = None # Statistics of the job being run
+_finished = None # (original, new) paths of the files the job being run has written
+_jobs = None # (label, function, args) for each output file, inherited by forked workers
+def _runJob(index):
+    """Runs one of _jobs, capturing its output.
+
+    Returns a 5-tuple: the job's exit status, what it wrote to its out
+    and err parameters, the Statistics it gathered and the (original,
+    new) paths of each file it wrote, whose original it hasn't yet
+    replaced."""
+    global _stats, _finished
+    label, func, args = _jobs[index]
+    out, err, outer = StringIO(), StringIO(), _stats
+    _stats, _finished = Statistics(), []
+    try:
+        with _stats.phase(label):
+            status = func(out, err, *args)
+    except Exception:
+        err.write(traceback.format_exc())
+        status = 1
+    finally:
+        stats, _stats = _stats, outer
+        finished, _finished = _finished, None
+    return status, out.getvalue(), err.getvalue(), stats, finished
+
+def runJobs(jobs, processes):
+    """Runs each job, in parallel if possible.
+
+    Each job is a triple: a label, for statistics; a function; and a
+    tuple of arguments for it, to follow the out and err streams it is
+    to write to; the function returns its exit status.  Each job only
+    writes its own output file, cleaning up its temporary file if it
+    fails; it leaves replacing the original to its caller, so that
+    nothing is replaced unless every job succeeds.  Returns a sequence
+    of results from _runJob(), in the order of jobs."""
+    global _jobs
+    _jobs = jobs
+    try:
+        # Only forking lets the workers share the data loaded so far:
+        if processes > 1 and len(jobs) > 1 and hasattr(os, 'fork'):
+            pool = multiprocessing.Pool(min(processes, len(jobs)))
+            try:
+                return pool.map(_runJob, range(len(jobs)))
+            finally:
+                pool.close()
+                pool.join()
+        return map(_runJob, range(len(jobs)))
+    finally:
+        _jobs = None
+
+def usage(name, err, message = ''):
+    err.write("""Usage: {} [--column-groups] [--stats FILE] path/to/qlocale.xml root/of/qtbase
+
+  --column-groups  also write locale_data with its related columns
+                   stored once per distinct value, check these tables
+                   rebuild it and report how much smaller they are
+  --stats FILE     report timings and string pool statistics to FILE (-
+                   for the standard error stream), as JSON if it ends in .json
+""".format(name)) # TODO: elaborate
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    # TODO: Make calendars a command-line parameter
+    # map { CLDR name: Qt file name }
+    calendars = {'gregorian': 'roman', 'persian': 'jalali', 'islamic': 'hijri',} # 'hebrew': 'hebrew',
+
+    name = args.pop(0)
+    grouped = '--column-groups' in args
+    if grouped:
+        args.remove('--column-groups')
+    report = None
+    if '--stats' in args:
+        at = args.index('--stats')
+        try:
+            report = args[at + 1]
+        except IndexError:
+            usage(name, err, '--stats needs a file name (or -)')
+            return 1
+        del args[at:at + 2]
+    if len(args) != 2:
+        usage(name, err, 'I expect two arguments')
+        return 1
+
+    qlocalexml = args.pop(0)
+    qtsrcdir = args.pop(0)
+
+    if not (os.path.isdir(qtsrcdir)
+            and all(os.path.isfile(os.path.join(qtsrcdir, 'src', 'corelib', 'text', leaf))
+                    for leaf in ('qlocale_data_p.h', 'qlocale.h', 'qlocale.qdoc'))):
+        usage(name, err, 'Missing expected files under qtbase source root ' + qtsrcdir)
+        return 1
+
+    stats = Statistics()
+    with stats.phase('reading ' + os.path.basename(qlocalexml)):
+        reader = QLocaleXmlReader(qlocalexml)
+    with stats.phase('loading locales'):
+        locale_map = dict(reader.loadLocaleMap(calendars, err.write))
+
+    with stats.phase('sorting locales'):
+        locale_keys = sortLocaleKeys(locale_map, reader.defaultMap())
+
+    jobs = [('writing qlocale_data_p.h', writeLocaleData,
+             (qtsrcdir, reader, locale_map, locale_keys, grouped))]
+    jobs += [('writing q{}calendar_data_p.h'.format(stem), writeCalendarData,
+              (qtsrcdir, reader, locale_map, locale_keys, calendar, stem))
+             for calendar, stem in calendars.items()]
+    jobs += [('writing qlocale.h', writeLocaleHeader, (qtsrcdir, reader)),
+             ('writing qlocale.qdoc', writeLocaleDoc, (qtsrcdir, reader))]
+    status, finished = 0, []
+    for code, said, moaned, gathered, names in runJobs(jobs, multiprocessing.cpu_count()):
+        out.write(said)
+        err.write(moaned)
+        status = max(status, code)
+        stats.merge(gathered)
+        finished += names
+
+    # Only update the sources if all are updated, to keep them consistent:
+    for names in finished:
+        if status:
+            Transcriber.discard(*names)
+        else:
+            Transcriber.replace(*names)
+            out.write('Changed: {}\n'.format(names[0]))
+    if status and finished:
+        err.write('Not updating any files, due to the errors above.\n')
+
+    if report is not None:
+        stats.count('locales', len(locale_keys))
+        with Statistics.writeTo(report, err) as stream:
+            stats.report(stream, report.endswith('.json'))
+    return status
+
 if __name__ == "__main__":
     import sys
     sys.exit(main(sys.argv, sys.stdout, sys.stderr))